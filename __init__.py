@@ -51,6 +51,9 @@ images_path = os.path.join(path, f"images{os.sep}")
 uix_path = os.path.join(path, "uix")
 """Path to uix directory."""
 
+data_path = os.path.join(path, f"data{os.sep}")
+"""Path to data directory."""
+
 _log_message = (
     "EZE:"
     + (" Release" if release else "")
@@ -0,0 +1,248 @@
+"""
+Themes/Animation
+================
+
+.. versionadded:: 0.1.0
+
+Central scheduler for the animations of EZE widgets.
+
+A Kivy :class:`~kivy.animation.Animation` installs its own `Clock` callback
+for every running animation. The :class:`EZEAnimation` class is an
+:class:`~kivy.animation.Animation` that is stepped instead by the
+:attr:`animation_scheduler`, which updates all running EZE animations in one
+callback per frame.
+
+Each animation has a priority:
+
+- `'essential'` - animations that show a state change, for example, opening
+  menus, dialogs and snack bars. They are never degraded;
+- `'normal'` - progress indicators and spinners;
+- `'decorative'` - ripples and the "magic" effects. They are finished at
+  once (jump to the final values) when the device is too slow to keep up,
+  and in the reduced motion and low power modes.
+
+The least important animations exceeding the budget of concurrent
+animations are paused until other animations complete. Animations that
+are restarted over and over from the completion of a finished animation,
+like loops, are paused instead of being finished again.
+
+.. code-block:: python
+
+    from eze.animation import EZEAnimation, animation_scheduler
+
+    EZEAnimation(opacity=1, d=0.2, priority="decorative").start(widget)
+
+    # No more than 8 animations at the same time.
+    animation_scheduler.max_concurrent = 8
+    # Respect the accessibility settings of the user.
+    animation_scheduler.reduced_motion = True
+    # Update the animations at half the frame rate to save battery.
+    animation_scheduler.low_power = True
+"""
+
+__all__ = ("AnimationScheduler", "EZEAnimation", "animation_scheduler")
+
+from kivy.animation import Animation
+from kivy.clock import Clock
+from kivy.event import EventDispatcher
+from kivy.properties import BooleanProperty, NumericProperty
+
+# Priorities in ascending order of importance.
+PRIORITIES = {"decorative": 0, "normal": 1, "essential": 2}
+
+# The number of animations started one after another from the completion of
+# a finished animation, above which the animations are considered a loop.
+MAX_FINISHED_CHAIN = 4
+
+
+class AnimationScheduler(EventDispatcher):
+    """
+    Steps all running :class:`EZEAnimation` objects in one `Clock` callback.
+    """
+
+    max_concurrent = NumericProperty(0)
+    """
+    The maximum number of animations running at the same time. When it is
+    exceeded, the least important animations, the newest first, are
+    paused. `0` for no limit. Essential animations are always run.
+
+    :attr:`max_concurrent` is a :class:`~kivy.properties.NumericProperty`
+    and defaults to `0`.
+    """
+
+    reduced_motion = BooleanProperty(False)
+    """
+    Finish the decorative animations at once.
+
+    :attr:`reduced_motion` is a :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
+    low_power = BooleanProperty(False)
+    """
+    Finish the decorative animations at once and update the others every
+    second frame.
+
+    :attr:`low_power` is a :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
+    slow_frame_time = NumericProperty(1 / 30)
+    """
+    The average frame time in seconds above which the device is considered
+    slow, the decorative animations are finished at once, and the
+    animations exceeding half of :attr:`max_concurrent` are paused.
+
+    :attr:`slow_frame_time` is a :class:`~kivy.properties.NumericProperty`
+    and defaults to `1 / 30`.
+    """
+
+    is_slow = BooleanProperty(False)
+    """
+    Whether the average frame time is above :attr:`slow_frame_time`.
+
+    :attr:`is_slow` is a :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Running animations in the order of start, mapped to the number of
+        # animations finished one after another before they started.
+        self._animations = {}
+        self._finished_chain = 0
+        self._update_event = None
+        self._average_frame_time = 0
+        self._skipped_time = 0
+        self._skip_frame = False
+
+    @property
+    def running_count(self) -> int:
+        """The number of running animations."""
+
+        return len(self._animations)
+
+    def add(self, animation: "EZEAnimation") -> None:
+        """Starts stepping the `animation`."""
+
+        self._animations[animation] = self._finished_chain
+        if self._update_event is None:
+            self._update_event = Clock.schedule_interval(self._update, 0)
+
+    def remove(self, animation: "EZEAnimation") -> None:
+        """Stops stepping the `animation`."""
+
+        self._animations.pop(animation, None)
+        if not self._animations and self._update_event is not None:
+            self._update_event.cancel()
+            self._update_event = None
+            self._average_frame_time = 0
+
+    def get_budget(self) -> int:
+        """
+        Returns the number of animations allowed to run at the same time,
+        `0` for no limit.
+        """
+
+        if self.is_slow and self.max_concurrent:
+            return max(1, self.max_concurrent // 2)
+        return self.max_concurrent
+
+    def _is_degraded(self, animation: "EZEAnimation") -> bool:
+        return animation.priority_level == 0 and (
+            self.reduced_motion or self.low_power or self.is_slow
+        )
+
+    def _update(self, dt: float) -> None:
+        self._average_frame_time += (dt - self._average_frame_time) * 0.1
+        self.is_slow = self._average_frame_time > self.slow_frame_time
+
+        animations = list(self._animations)
+        finished = []
+        paused = set()
+        for animation in animations:
+            if self._is_degraded(animation):
+                if self._animations[animation] < MAX_FINISHED_CHAIN:
+                    finished.append(animation)
+                else:
+                    paused.add(animation)
+        budget = self.get_budget()
+        running = len(animations) - len(finished) - len(paused)
+        if budget and running > budget:
+            candidates = sorted(
+                (
+                    animation
+                    for animation in reversed(animations)
+                    if animation not in paused
+                    and animation not in finished
+                    and animation.priority_level < PRIORITIES["essential"]
+                ),
+                key=lambda animation: animation.priority_level,
+            )
+            paused.update(candidates[: running - budget])
+
+        for animation in finished:
+            # Animations started on completion continue the chain.
+            self._finished_chain = self._animations.get(animation, 0) + 1
+            try:
+                animation.finish()
+            finally:
+                self._finished_chain = 0
+
+        if self.low_power:
+            self._skipped_time += dt
+            self._skip_frame = not self._skip_frame
+            if self._skip_frame:
+                return
+            dt, self._skipped_time = self._skipped_time, 0
+
+        for animation in animations:
+            if animation in self._animations and animation not in paused:
+                animation._update(dt)
+
+
+animation_scheduler = AnimationScheduler()
+"""The scheduler of all EZE animations."""
+
+
+class EZEAnimation(Animation):
+    """
+    Animation stepped by the :attr:`animation_scheduler`.
+
+    See :class:`~kivy.animation.Animation` class documentation for more
+    information. Animations with a custom `step` are stepped by their own
+    `Clock` callback as usual.
+
+    :param priority: `'essential'`, `'normal'` or `'decorative'`.
+    """
+
+    def __init__(self, priority: str = "normal", **kw):
+        super().__init__(**kw)
+        self.priority = priority
+        self.priority_level = PRIORITIES[priority]
+
+    def finish(self) -> None:
+        """
+        Jumps to the final values of the animated properties of all
+        animated widgets and completes the animation.
+        """
+
+        for widget_uid in list(self._widgets):
+            anim = self._widgets.get(widget_uid)
+            if anim is not None:
+                anim["time"] = self._duration
+        self._update(0)
+
+    def _clock_install(self):
+        if self._step:
+            super()._clock_install()
+        elif not self._clock_installed:
+            animation_scheduler.add(self)
+            self._clock_installed = True
+
+    def _clock_uninstall(self):
+        if self._step:
+            super()._clock_uninstall()
+        elif self._clock_installed and not self._widgets:
+            self._clock_installed = False
+            animation_scheduler.remove(self)
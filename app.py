@@ -49,6 +49,7 @@ import watchdog
 from kivy.properties import ObjectProperty, StringProperty
 
 from eze.theming import ThemeManager
+from eze.utils.workers import WorkerPool
 
 
 Window.size = (320, 580)
@@ -57,15 +58,48 @@ Window.size = (320, 580)
 class FpsMonitoring:
     """Implements a monitor to display the current FPS in the toolbar."""
 
-    def fps_monitor_start(self, anchor: str = "top") -> None:
-        """Adds a monitor to the main application window."""
+    frame_profiler = None
+    """
+    Instance of :class:`~eze.utils.profiler.FrameProfiler` class started by
+    :meth:`fps_monitor_start` with the `profiler` argument.
+
+    .. versionadded:: 0.1.0
+    """
+
+    def fps_monitor_start(
+        self,
+        anchor: str = "top",
+        profiler: bool = False,
+        profile_callbacks: bool = False,
+        count_properties: bool = False,
+    ) -> None:
+        """
+        Adds a monitor to the main application window.
+
+        .. versionchanged:: 0.1.0
+            Added the `profiler`, `profile_callbacks` and `count_properties`
+            arguments. With `profiler`, the monitor shows the frame time
+            percentiles and the most expensive widgets, callbacks and
+            properties, see :mod:`~eze.utils.profiler`.
+        """
 
         def add_monitor(*args):
             from kivy.core.window import Window
 
-            from eze.utils.fpsmonitor import FpsMonitor
+            if profiler:
+                from eze.utils.profiler import FrameProfiler, ProfilerMonitor
+
+                self.frame_profiler = FrameProfiler(
+                    profile_callbacks=profile_callbacks,
+                    count_properties=count_properties,
+                )
+                monitor = ProfilerMonitor(
+                    anchor=anchor, profiler=self.frame_profiler
+                )
+            else:
+                from eze.utils.fpsmonitor import FpsMonitor
 
-            monitor = FpsMonitor(anchor=anchor)
+                monitor = FpsMonitor(anchor=anchor)
             monitor.start()
             Window.add_widget(monitor)
 
@@ -113,9 +147,27 @@ class EZEApp(App, FpsMonitoring):
     :attr:`theme_cls` is an :class:`~kivy.properties.ObjectProperty`.
     """
 
+    worker_pool = ObjectProperty()
+    """
+    Instance of :class:`~eze.utils.workers.WorkerPool` class that runs
+    blocking and CPU-bound work off the UI thread, see
+    :mod:`~eze.utils.workers`. It is shut down when the application stops.
+
+    .. versionadded:: 0.1.0
+
+    :attr:`worker_pool` is an :class:`~kivy.properties.ObjectProperty`.
+    """
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.theme_cls = ThemeManager()
+        self.worker_pool = WorkerPool()
+        # Bound rather than overridden, so that the pool is shut down
+        # even if `on_stop` of the application does not call `super`.
+        self.fbind("on_stop", self._shutdown_worker_pool)
+
+    def _shutdown_worker_pool(self, *args) -> None:
+        self.worker_pool.shutdown()
 
     def load_all_kv_files(self, path_to_directory: str) -> None:
         """
@@ -50,7 +50,7 @@ register("EZEFlatButton", module="eze.uix.button")
 register("EZERaisedButton", module="eze.uix.button")
 register("EZEFloatingActionButton", module="eze.uix.button")
 register("EZERectangleFlatButton", module="eze.uix.button")
-register("EZETextButton", module="eze..uix.button")
+register("EZETextButton", module="eze.uix.button")
 register("EZECustomRoundIconButton", module="eze.uix.button")
 register("EZERoundFlatButton", module="eze.uix.button")
 register("EZEFillRoundFlatButton", module="eze.uix.button")
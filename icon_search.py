@@ -0,0 +1,194 @@
+"""
+Themes/Icon Search
+==================
+
+.. versionadded:: 0.1.0
+
+Indexed search over the names of the icons from
+:mod:`~eze.icon_definitions`.
+
+The index is built once, on the first query, and answers each query without
+scanning all icon names. Results are ranked and returned incrementally, so an
+icon picker can show the best matches first and stop as soon as it has
+enough of them:
+
+.. code-block:: python
+
+    from eze.icon_search import search_icons
+
+    def set_list_icons(self, text):
+        self.ids.rv.data = [
+            {"viewclass": "CustomOneLineIconListItem", "icon": name}
+            for name in search_icons(text, limit=200)
+        ]
+
+Ranking
+-------
+
+Matches are returned in the following order, alphabetically within each
+group:
+
+- the name is equal to the query;
+- the name starts with the query (`'arrow'` -> `'arrow-left'`);
+- a word of the name starts with the query (`'left'` -> `'arrow-left'`);
+- the name contains the query anywhere else (`'rrow'` -> `'arrow-left'`).
+
+Spaces in the query are treated as word separators, so `'arrow left'` finds
+the same icons as `'arrow-left'`.
+"""
+
+from __future__ import annotations
+
+__all__ = ("IconSearchIndex", "get_icon_search_index", "search_icons")
+
+from bisect import bisect_left
+from itertools import islice
+from typing import Iterable, Iterator
+
+_NGRAM = 3
+
+
+class IconSearchIndex:
+    """
+    Search index over a collection of icon names.
+
+    :param names: icon names to index.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        pairs = sorted((name.lower(), name) for name in set(names))
+        # Lowercase names in alphabetical order; the position of the name in
+        # this list is its identifier in all other tables of the index.
+        self._keys = [key for key, name in pairs]
+        self._names = [name for key, name in pairs]
+        # Sorted (suffix, name id) pairs for the parts of each name starting
+        # at its second, third, ... word. The first word is already covered
+        # by the prefix search over the names themselves.
+        words = []
+        # Trigram -> ids of the names containing it.
+        ngrams = {}
+
+        for index, key in enumerate(self._keys):
+            start = key.find("-")
+            while start != -1:
+                if start + 1 < len(key):
+                    words.append((key[start + 1 :], index))
+                start = key.find("-", start + 1)
+            for start in range(len(key) - _NGRAM + 1):
+                ngrams.setdefault(key[start : start + _NGRAM], []).append(
+                    index
+                )
+
+        words.sort()
+        self._words = words
+        self._ngrams = ngrams
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def search(self, query: str, limit: int | None = None) -> Iterator[str]:
+        """
+        Returns an iterator over the names of the icons matching the `query`,
+        best matches first. See Ranking_.
+
+        Matches are found lazily, so only as much work as needed for the
+        consumed results is done. An empty query matches all icons.
+
+        :param query: the text to search for;
+        :param limit: the maximum number of returned names, `None` for
+                      no limit;
+        """
+
+        results = self._search(self._normalize(query))
+        if limit is not None:
+            results = islice(results, limit)
+        return results
+
+    def _normalize(self, query: str) -> str:
+        return "-".join(query.lower().split())
+
+    def _search(self, query: str) -> Iterator[str]:
+        names = self._names
+        keys = self._keys
+
+        if not query:
+            yield from names
+            return
+
+        seen = set()
+        # Names equal to and starting with the query.
+        index = bisect_left(keys, query)
+        while index < len(keys) and keys[index].startswith(query):
+            seen.add(index)
+            yield names[index]
+            index += 1
+
+        # Names with a word starting with the query.
+        word_matches = []
+        words = self._words
+        position = bisect_left(words, (query, -1))
+        while position < len(words) and words[position][0].startswith(query):
+            index = words[position][1]
+            if index not in seen:
+                seen.add(index)
+                word_matches.append(index)
+            position += 1
+        for index in sorted(word_matches):
+            yield names[index]
+
+        # Names containing the query anywhere else.
+        for index in self._get_candidates(query):
+            if index not in seen and query in keys[index]:
+                yield names[index]
+
+    def _get_candidates(self, query: str) -> Iterable[int]:
+        """
+        Returns the ids of the names that may contain the `query`,
+        in alphabetical order.
+        """
+
+        if len(query) < _NGRAM:
+            return range(len(self._keys))
+
+        postings = []
+        for start in range(len(query) - _NGRAM + 1):
+            ids = self._ngrams.get(query[start : start + _NGRAM])
+            if ids is None:
+                return ()
+            postings.append(ids)
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for ids in postings[1:]:
+            candidates.intersection_update(ids)
+            if not candidates:
+                return ()
+        return sorted(candidates)
+
+
+_index = None
+
+
+def get_icon_search_index() -> IconSearchIndex:
+    """
+    Returns the search index over all icons from
+    :attr:`~eze.icon_definitions.eze_icons`. The index is built on the first
+    call.
+    """
+
+    global _index
+
+    if _index is None:
+        from eze.icon_definitions import eze_icons
+
+        _index = IconSearchIndex(eze_icons.keys())
+    return _index
+
+
+def search_icons(query: str, limit: int | None = None) -> Iterator[str]:
+    """
+    Searches the icons from :attr:`~eze.icon_definitions.eze_icons`.
+    See :meth:`IconSearchIndex.search`.
+    """
+
+    return get_icon_search_index().search(query, limit)
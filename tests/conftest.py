@@ -0,0 +1,59 @@
+import importlib.util
+import os
+import sys
+import time
+
+# Kivy reads these when it is imported.
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+if sys.platform.startswith("linux") and not (
+    os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")
+):
+    os.environ.setdefault("SDL_VIDEODRIVER", "offscreen")
+
+import pytest  # NOQA E402
+
+_spec = importlib.util.find_spec("eze")
+if _spec is None or _spec.submodule_search_locations is None:
+    # The tests run from a checkout of the package directory, which is
+    # imported as `eze` (not as the `eze.py` module of the directory).
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    spec = importlib.util.spec_from_file_location(
+        "eze",
+        os.path.join(root, "__init__.py"),
+        submodule_search_locations=[root],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["eze"] = module
+    spec.loader.exec_module(module)
+
+
+@pytest.fixture
+def run_until():
+    """
+    Returns a function running the scheduled callbacks until `condition()`
+    is true. Fails after `timeout` seconds.
+    """
+
+    from kivy.clock import Clock
+
+    def run_until(condition, timeout: float = 2):
+        deadline = time.perf_counter() + timeout
+        while not condition():
+            if time.perf_counter() > deadline:
+                pytest.fail("The condition is not met in time")
+            time.sleep(0.001)
+            Clock.tick()
+
+    return run_until
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The application object needed to create the widgets."""
+
+    from kivy.app import App
+
+    from eze.app import EZEApp
+
+    return App.get_running_app() or EZEApp()
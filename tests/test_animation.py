@@ -0,0 +1,62 @@
+import pytest
+from kivy.uix.widget import Widget
+
+from eze.animation import MAX_FINISHED_CHAIN, EZEAnimation, animation_scheduler
+
+
+@pytest.fixture
+def scheduler():
+    yield animation_scheduler
+    for animation in list(animation_scheduler._animations):
+        for anim in list(animation._widgets.values()):
+            animation.cancel(anim["widget"])
+    animation_scheduler.max_concurrent = 0
+    animation_scheduler.reduced_motion = False
+
+
+def test_excess_animations_are_paused(scheduler):
+    first, second = Widget(opacity=0), Widget(opacity=0)
+    scheduler.max_concurrent = 1
+    EZEAnimation(opacity=1, d=0.1, t="linear").start(first)
+    EZEAnimation(opacity=1, d=0.1, t="linear").start(second)
+
+    # The first step starts the animations.
+    scheduler._update(0)
+    scheduler._update(0.05)
+    assert first.opacity == pytest.approx(0.5)
+    assert second.opacity == 0
+
+    scheduler._update(0.05)
+    assert first.opacity == 1
+    scheduler._update(0)
+    scheduler._update(0.05)
+    assert second.opacity == pytest.approx(0.5)
+
+
+def test_reduced_motion_finishes_decorative_animations(scheduler):
+    widget = Widget(opacity=0)
+    scheduler.reduced_motion = True
+    EZEAnimation(opacity=1, d=1, priority="decorative").start(widget)
+
+    scheduler._update(0.01)
+    assert widget.opacity == 1
+    assert scheduler.running_count == 0
+
+
+def test_reduced_motion_pauses_loops(scheduler):
+    widget = Widget(opacity=0)
+    completed = []
+
+    def restart(*args):
+        completed.append(args)
+        animation = EZEAnimation(opacity=0, d=1, priority="decorative")
+        animation.bind(on_complete=restart)
+        animation.start(widget)
+
+    scheduler.reduced_motion = True
+    restart()
+    for _ in range(MAX_FINISHED_CHAIN * 3):
+        scheduler._update(0.01)
+
+    assert len(completed) == MAX_FINISHED_CHAIN + 1
+    assert scheduler.running_count == 1
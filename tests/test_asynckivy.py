@@ -0,0 +1,112 @@
+import threading
+
+import pytest
+
+from eze.utils import asynckivy
+
+
+async def return_after(value, seconds: float):
+    await asynckivy.sleep(seconds)
+    return value
+
+
+async def fail_after(seconds: float):
+    await asynckivy.sleep(seconds)
+    raise ValueError("failed")
+
+
+def test_gather_returns_results_in_order(run_until):
+    task = asynckivy.start(
+        asynckivy.gather(return_after(1, 0.02), return_after(2, 0.01))
+    )
+    run_until(lambda: task.done)
+
+    assert task.result == [1, 2]
+
+
+def test_gather_cancels_the_others_on_error(run_until):
+    slow = asynckivy.start(return_after(1, 10))
+    task = asynckivy.start(asynckivy.gather(slow, fail_after(0.01)))
+    task.add_done_callback(lambda task: None)
+    run_until(lambda: task.done)
+
+    assert task.state == "error"
+    assert slow.state == "cancelled"
+    with pytest.raises(ValueError):
+        task.result
+
+
+@pytest.mark.parametrize("wait", [asynckivy.gather, asynckivy.wait_any])
+def test_started_tasks_are_cancelled_if_a_start_fails(wait):
+    cancelled = []
+
+    async def wait_forever():
+        try:
+            await asynckivy.sleep(10)
+        finally:
+            cancelled.append(True)
+
+    async def fail_at_once():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        asynckivy.start(wait(wait_forever(), fail_at_once()))
+    assert cancelled == [True]
+
+
+def test_wait_any_returns_the_finished_task(run_until):
+    slow = asynckivy.start(return_after("slow", 10))
+    task = asynckivy.start(asynckivy.wait_any(slow, return_after("fast", 0)))
+    run_until(lambda: task.done)
+
+    assert task.result.result == "fast"
+    assert slow.state == "cancelled"
+
+
+def test_timeout(run_until):
+    task = asynckivy.start(asynckivy.timeout(return_after(1, 0), 10))
+    run_until(lambda: task.done)
+    assert task.result == 1
+
+    slow = asynckivy.start(return_after(1, 10))
+    task = asynckivy.start(asynckivy.timeout(slow, 0.01))
+    task.add_done_callback(lambda task: None)
+    run_until(lambda: task.done)
+    assert slow.state == "cancelled"
+    with pytest.raises(TimeoutError):
+        task.result
+
+
+def test_cancel_runs_finally(run_until):
+    cleaned_up = []
+
+    async def job():
+        try:
+            await asynckivy.sleep(10)
+        finally:
+            cleaned_up.append(True)
+
+    task = asynckivy.start(job())
+    task.cancel()
+
+    assert task.state == "cancelled"
+    assert cleaned_up == [True]
+    with pytest.raises(asynckivy.Cancelled):
+        task.result
+
+
+def test_run_in_executor_returns_on_main_thread(run_until):
+    main_thread = threading.current_thread()
+    threads = []
+
+    async def job():
+        value = await asynckivy.run_in_executor(
+            lambda: threading.current_thread()
+        )
+        threads.extend([value, threading.current_thread()])
+
+    task = asynckivy.start(job())
+    run_until(lambda: task.done)
+
+    assert threads[0] is not main_thread
+    assert threads[1] is main_thread
@@ -0,0 +1,57 @@
+import pytest
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.graphics import Color, Rectangle
+from kivy.uix.widget import Widget
+
+from eze.uix.carousel import EZECarousel
+
+
+def create_content():
+    widget = Widget()
+    with widget.canvas:
+        Color(1, 0, 0, 1)
+        Rectangle(size=(10, 10))
+    return widget
+
+
+@pytest.fixture
+def carousel(app, run_until):
+    carousel = EZECarousel(
+        snapshot_slides=True, anim_move_duration=0.2, size=(100, 100)
+    )
+    for _ in range(3):
+        carousel.add_widget(create_content())
+    Window.add_widget(carousel)
+    # The snapshots of the adjacent slides are rendered in idle frames.
+    run_until(lambda: carousel.next_slide in carousel._snapshots)
+    Clock.tick()
+    yield carousel
+    Window.remove_widget(carousel)
+
+
+def assert_live_slides(carousel):
+    assert carousel._shown_snapshots == {}
+    for slide in carousel.slides:
+        container = carousel.get_slide_container(slide)
+        assert container.canvas.indexof(slide.canvas) > -1
+
+
+def test_snapshot_swipe(run_until, carousel):
+    next_slide = carousel.next_slide
+    carousel.load_next()
+    run_until(lambda: carousel._shown_snapshots)
+
+    container = carousel.get_slide_container(next_slide)
+    assert container.canvas.indexof(next_slide.canvas) == -1
+
+    run_until(lambda: carousel.index == 1 and not carousel._offset)
+    assert_live_slides(carousel)
+
+
+def test_interrupted_snapshot_swipe(run_until, carousel):
+    carousel.load_next()
+    run_until(lambda: carousel._shown_snapshots)
+
+    carousel.index = 2
+    assert_live_slides(carousel)
@@ -0,0 +1,24 @@
+import gc
+
+from eze.uix.hero import EZEHeroFrom, _heroes_from, get_heroes_from
+
+
+def test_heroes_are_found_by_tag(app):
+    hero = EZEHeroFrom(tag="registry-a")
+    assert get_heroes_from("registry-a") == [hero]
+
+    hero.tag = "registry-b"
+    assert get_heroes_from("registry-a") == []
+    assert "registry-a" not in _heroes_from
+    assert get_heroes_from("registry-b") == [hero]
+
+
+def test_tags_of_deleted_heroes_are_removed(app):
+    heroes = [EZEHeroFrom(tag=f"dynamic-{index}") for index in range(3)]
+    kept = EZEHeroFrom(tag="dynamic-0")
+    del heroes
+    gc.collect()
+
+    assert get_heroes_from("dynamic-0") == [kept]
+    assert "dynamic-1" not in _heroes_from
+    assert "dynamic-2" not in _heroes_from
@@ -0,0 +1,44 @@
+import pytest
+from kivy.core.window import Window
+from kivy.uix.widget import Widget
+
+from eze.uix.hero import EZEHeroFrom, EZEHeroTo
+from eze.uix.screen import MDScreen
+from eze.uix.screenmanager import EZEScreenManager
+from eze.uix.transition import EZEFadeSlideTransition, EZESlideTransition
+
+
+@pytest.mark.parametrize(
+    "transition_cls", [EZESlideTransition, EZEFadeSlideTransition]
+)
+def test_hero_round_trip(app, run_until, transition_cls):
+    hero = Widget()
+    hero_from = EZEHeroFrom(tag="hero")
+    hero_from.add_widget(hero)
+    screen_a = MDScreen(name="a")
+    screen_a.add_widget(hero_from)
+    hero_to = EZEHeroTo(tag="hero")
+    screen_b = MDScreen(name="b", heroes_to=[hero_to])
+    screen_b.add_widget(hero_to)
+
+    manager = EZEScreenManager(transition=transition_cls(duration=0.01))
+    manager.add_widget(screen_a)
+    manager.add_widget(screen_b)
+    Window.add_widget(manager)
+    try:
+        manager.current_heroes = ["hero"]
+        manager.current = "b"
+        run_until(lambda: not manager.transition.is_active)
+        assert hero.parent is hero_to
+
+        manager.current = "a"
+        run_until(lambda: not manager.transition.is_active)
+        assert hero.parent is hero_from
+        assert hero not in Window.children
+
+        # The next flight works too.
+        manager.current = "b"
+        run_until(lambda: not manager.transition.is_active)
+        assert hero.parent is hero_to
+    finally:
+        Window.remove_widget(manager)
@@ -0,0 +1,45 @@
+import pytest
+
+from eze.icon_definitions import EZEIcons, eze_icons, write_icon_table
+
+
+def test_table_round_trip(tmp_path):
+    icons = {
+        "home": "\U000F02DC",
+        "account": "\U000F0004",
+        "flag-ru": "\U0001F1F7\U0001F1FA",
+        "blank": "",
+    }
+    path = str(tmp_path / "icons.bin")
+    write_icon_table(icons, path)
+    table = EZEIcons(path)
+
+    assert dict(table) == icons
+    assert list(table) == sorted(icons)
+    assert len(table) == len(icons)
+    assert table["flag-ru"] == "\U0001F1F7\U0001F1FA"
+    assert "home" in table
+    assert "missing" not in table
+    assert 1 not in table
+    with pytest.raises(KeyError):
+        table["missing"]
+
+
+def test_empty_table(tmp_path):
+    path = str(tmp_path / "icons.bin")
+    write_icon_table({}, path)
+
+    assert len(EZEIcons(path)) == 0
+
+
+def test_not_a_table(tmp_path):
+    path = tmp_path / "icons.bin"
+    path.write_bytes(b"not an icon table")
+
+    with pytest.raises(ValueError):
+        len(EZEIcons(str(path)))
+
+
+def test_bundled_table():
+    assert len(eze_icons) > 1000
+    assert len(eze_icons["home"]) == 1
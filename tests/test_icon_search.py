@@ -0,0 +1,72 @@
+from eze.icon_search import IconSearchIndex, search_icons
+
+NAMES = [
+    "arrow-left",
+    "arrow-right",
+    "arrow-left-bold",
+    "left-arrow",
+    "barrow",
+    "home",
+    "home-outline",
+    "Account",
+]
+
+
+def test_ranking():
+    index = IconSearchIndex(NAMES)
+
+    assert list(index.search("arrow")) == [
+        # The name starts with the query.
+        "arrow-left",
+        "arrow-left-bold",
+        "arrow-right",
+        # A word of the name starts with the query.
+        "left-arrow",
+        # The name contains the query.
+        "barrow",
+    ]
+
+
+def test_equal_name_first():
+    index = IconSearchIndex(NAMES)
+
+    assert next(index.search("home")) == "home"
+
+
+def test_spaces_are_word_separators():
+    index = IconSearchIndex(NAMES)
+
+    assert list(index.search("Arrow  Left")) == list(
+        index.search("arrow-left")
+    )
+
+
+def test_case_insensitive():
+    index = IconSearchIndex(NAMES)
+
+    assert list(index.search("account")) == ["Account"]
+
+
+def test_limit_and_empty_query():
+    index = IconSearchIndex(NAMES)
+
+    assert list(index.search("arrow", limit=2)) == [
+        "arrow-left",
+        "arrow-left-bold",
+    ]
+    assert len(list(index.search(""))) == len(NAMES) == len(index)
+
+
+def test_no_match():
+    index = IconSearchIndex(NAMES)
+
+    assert list(index.search("xyz")) == []
+    assert list(index.search("rowx")) == []
+
+
+def test_search_icons():
+    results = list(search_icons("home", limit=5))
+
+    assert results[0] == "home"
+    assert len(results) == 5
+    assert all("home" in name.lower() for name in results)
@@ -0,0 +1,41 @@
+import pytest
+from kivy.core.window import Window
+
+# The menu imports the list items, which import FitImage from KivyMD.
+pytest.importorskip("kivymd")
+
+from eze.uix.menu import EZEDropdownMenuPool  # NOQA
+
+
+def test_get_reuses_menus(app):
+    pool = EZEDropdownMenuPool()
+    menu = pool.get("a", items=[])
+
+    assert pool.get("a", width=200) is menu
+    assert menu.width == 200
+    assert len(pool) == 1
+
+
+def test_least_recently_used_menu_is_discarded(app):
+    pool = EZEDropdownMenuPool(max_menus=2)
+    pool.get("a")
+    pool.get("b")
+    pool.get("a")
+    pool.get("c")
+
+    assert "a" in pool
+    assert "b" not in pool
+    assert "c" in pool
+
+
+def test_discarded_menu_is_unbound_from_the_window(app):
+    pool = EZEDropdownMenuPool()
+    menu = pool.get("a")
+    pool.discard("a")
+
+    Window.add_widget(menu)
+    try:
+        Window.dispatch("on_resize", *Window.size)
+        assert menu.parent is Window
+    finally:
+        Window.remove_widget(menu)
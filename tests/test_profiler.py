@@ -0,0 +1,32 @@
+from kivy.graphics import Color, InstructionGroup, PopMatrix, PushMatrix
+from kivy.uix.widget import Widget
+
+from eze.utils.profiler import count_canvas_instructions
+
+
+def test_count_canvas_instructions():
+    parent = Widget()
+    child = Widget()
+    parent.add_widget(child)
+    with parent.canvas.before:
+        PushMatrix()
+        Color()
+    with parent.canvas:
+        Color()
+    with parent.canvas.after:
+        PopMatrix()
+    with child.canvas:
+        Color()
+
+    assert count_canvas_instructions(child) == 1
+    assert count_canvas_instructions(parent) == 5
+
+
+def test_count_nested_groups():
+    widget = Widget()
+    group = InstructionGroup()
+    group.add(PushMatrix())
+    group.add(PopMatrix())
+    widget.canvas.add(group)
+
+    assert count_canvas_instructions(widget) == 2
@@ -0,0 +1,91 @@
+import gc
+import weakref
+
+from kivy.clock import Clock
+from kivy.core.window import Window
+
+from eze.uix.screen import MDScreen
+from eze.uix.screenmanager import EZEScreenManager
+from eze.uix.transition import EZESlideTransition
+
+
+def create_manager(**kwargs):
+    manager = EZEScreenManager(
+        transition=EZESlideTransition(duration=0.01), **kwargs
+    )
+    for name in ("a", "b", "c"):
+        manager.register_screen(name, lambda name: MDScreen())
+    return manager
+
+
+def test_screens_are_created_on_demand(app):
+    manager = create_manager()
+    manager.current = "b"
+
+    assert [screen.name for screen in manager.screens] == ["b"]
+
+
+def test_hidden_screen_is_evicted_after_the_transition(app, run_until):
+    manager = create_manager(max_screens=1)
+    Window.add_widget(manager)
+    try:
+        manager.current = "a"
+        manager.current = "b"
+        assert {screen.name for screen in manager.screens} == {"a", "b"}
+
+        run_until(lambda: not manager.transition.is_active)
+        assert [screen.name for screen in manager.screens] == ["b"]
+    finally:
+        Window.remove_widget(manager)
+
+
+def test_saved_state_is_restored(app, run_until):
+    class StateScreen(MDScreen):
+        state = None
+
+        def save_state(self):
+            return "saved"
+
+        def restore_state(self, state):
+            self.state = state
+
+    manager = EZEScreenManager(transition=EZESlideTransition(duration=0))
+    manager.register_screen("a", lambda name: StateScreen())
+    manager.register_screen("b", lambda name: StateScreen())
+    manager.current = "a"
+    manager.current = "b"
+    run_until(lambda: not manager.transition.is_active)
+    manager.evict_screens()
+    manager.current = "a"
+
+    assert manager.get_screen("a").state == "saved"
+
+
+def test_manager_is_not_kept_by_the_window(app):
+    ref = weakref.ref(create_manager())
+    # Runs the scheduled `check_transition`.
+    Clock.tick()
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_switching_during_a_transition_keeps_the_new_screen(app, run_until):
+    manager = create_manager(max_screens=1)
+    manager.transition.duration = 0.5
+    Window.add_widget(manager)
+    try:
+        manager.current = "a"
+        manager.current = "b"
+        assert manager.transition.is_active
+        manager.current = "c"
+
+        screen_c = manager.current_screen
+        assert screen_c.name == "c"
+        assert screen_c.manager is manager
+        assert screen_c in manager.screens
+
+        run_until(lambda: not manager.transition.is_active, timeout=3)
+        assert [screen.name for screen in manager.screens] == ["c"]
+    finally:
+        Window.remove_widget(manager)
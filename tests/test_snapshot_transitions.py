@@ -0,0 +1,76 @@
+import pytest
+from kivy.core.window import Window
+from kivy.graphics import Color, Rectangle
+from kivy.uix.widget import Widget
+
+from eze.uix.screen import MDScreen
+from eze.uix.screenmanager import EZEScreenManager
+from eze.uix.transition import EZEFadeSlideTransition, EZESlideTransition
+
+
+def create_content():
+    widget = Widget()
+    with widget.canvas:
+        Color(1, 0, 0, 1)
+        Rectangle(size=(10, 10))
+    return widget
+
+
+@pytest.fixture
+def manager_in_window():
+    managers = []
+
+    def create(transition):
+        manager = EZEScreenManager(transition=transition)
+        for name in ("a", "b", "c"):
+            screen = MDScreen(name=name)
+            screen.add_widget(create_content())
+            manager.add_widget(screen)
+        Window.add_widget(manager)
+        managers.append(manager)
+        return manager
+
+    yield create
+    for manager in managers:
+        Window.remove_widget(manager)
+
+
+def assert_live_screens(manager):
+    assert manager.transition._snapshots is None
+    for screen in manager.children:
+        assert manager.canvas.indexof(screen.canvas) > -1
+
+
+@pytest.mark.parametrize(
+    "transition_cls", [EZESlideTransition, EZEFadeSlideTransition]
+)
+def test_snapshot_transition(app, run_until, manager_in_window, transition_cls):
+    manager = manager_in_window(transition_cls(duration=0.2, snapshot=True))
+    manager.current = "b"
+    run_until(lambda: manager.transition._snapshots)
+
+    screen_b = manager.get_screen("b")
+    assert manager.canvas.indexof(screen_b.canvas) == -1
+
+    run_until(lambda: not manager.transition.is_active)
+    assert_live_screens(manager)
+
+
+@pytest.mark.parametrize(
+    "transition_cls", [EZESlideTransition, EZEFadeSlideTransition]
+)
+def test_interrupted_snapshot_transition(
+    app, run_until, manager_in_window, transition_cls
+):
+    manager = manager_in_window(transition_cls(duration=0.5, snapshot=True))
+    manager.current = "b"
+    run_until(lambda: manager.transition._snapshots)
+
+    # Stops the running transition and starts the next one, which renders
+    # its snapshots in its first frame.
+    manager.current = "c"
+    assert_live_screens(manager)
+
+    run_until(lambda: not manager.transition.is_active)
+    assert_live_screens(manager)
+    assert manager.current_screen.name == "c"
@@ -0,0 +1,38 @@
+from kivy.clock import Clock
+from kivy.uix.floatlayout import FloatLayout
+
+from eze.uix.button.button import (
+    EZEFloatingActionButtonSpeedDial,
+    EZEFloatingBottomButton,
+    EZEFloatingRootButton,
+)
+
+
+def get_buttons(speed_dial, cls):
+    return [widget for widget in speed_dial.children if isinstance(widget, cls)]
+
+
+def test_stack_properties_are_applied_to_all_buttons(app):
+    speed_dial = EZEFloatingActionButtonSpeedDial(
+        bg_color_stack_button=(1, 0, 0, 1),
+        bg_color_root_button=(0, 1, 0, 1),
+        data={
+            "Python": "language-python",
+            "JS": "language-javascript",
+            "PHP": "language-php",
+        },
+    )
+    # The stack buttons are positioned relative to the parent.
+    FloatLayout().add_widget(speed_dial)
+    Clock.tick()
+
+    bottom_buttons = get_buttons(speed_dial, EZEFloatingBottomButton)
+    assert len(bottom_buttons) == 3
+    for button in bottom_buttons:
+        assert list(button.eze_bg_color) == [1, 0, 0, 1]
+    (root_button,) = get_buttons(speed_dial, EZEFloatingRootButton)
+    assert list(root_button.eze_bg_color) == [0, 1, 0, 1]
+
+    speed_dial.bg_color_stack_button = (0, 0, 1, 1)
+    for button in bottom_buttons:
+        assert list(button.eze_bg_color) == [0, 0, 1, 1]
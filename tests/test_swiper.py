@@ -0,0 +1,18 @@
+from kivy.core.window import Window
+from kivy.uix.widget import Widget
+
+from eze.uix.swiper import EZESwiper
+
+
+def test_window_resize_is_unbound_when_removed(app):
+    parent = Widget()
+    swiper = EZESwiper()
+    parent.add_widget(swiper)
+    swiper._trigger_update_size.cancel()
+    Window.dispatch("on_resize", *Window.size)
+    assert swiper._trigger_update_size.is_triggered
+
+    parent.remove_widget(swiper)
+    swiper._trigger_update_size.cancel()
+    Window.dispatch("on_resize", *Window.size)
+    assert not swiper._trigger_update_size.is_triggered
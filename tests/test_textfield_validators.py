@@ -0,0 +1,107 @@
+from datetime import date
+
+import pytest
+
+from eze.uix.textfield import EZETextField, register_validator
+from eze.utils import asynckivy
+from eze.uix.textfield.textfield import get_date_parser
+
+
+@pytest.mark.parametrize(
+    "validator, invalid, valid",
+    [
+        ("email", "user@example", "user@example.com"),
+        ("time", "24:00", "23:59:59"),
+    ],
+)
+def test_builtin_validators(app, validator, invalid, valid):
+    field = EZETextField(validator=validator)
+
+    field.text = invalid
+    assert field.error
+    field.text = valid
+    assert not field.error
+
+
+def test_date_validator(app, run_until):
+    field = EZETextField(
+        validator="date",
+        date_format="dd/mm/yyyy",
+        date_interval=["01/01/2000", None],
+    )
+    # The string dates of the interval are converted in the next frame.
+    run_until(lambda: isinstance(field.date_interval[0], date))
+
+    field.text = "29/02/2023"
+    assert field.error
+    field.text = "31/12/1999"
+    assert field.error
+    field.text = "29/02/2024"
+    assert not field.error
+    assert field.datetime_date == date(2024, 2, 29)
+
+
+def test_date_parser_is_cached():
+    pattern, to_date = get_date_parser("yyyy/mm/dd")
+
+    assert get_date_parser("yyyy/mm/dd")[0] is pattern
+    assert to_date(pattern.match("2024/12/31").groups()) == date(2024, 12, 31)
+    assert pattern.match("2024/13/31") is None
+
+
+def test_unknown_validator(app):
+    field = EZETextField(validator="unknown")
+
+    with pytest.raises(ValueError):
+        field.text = "text"
+    field.validator = None
+
+
+def test_custom_validator(app):
+    register_validator("upper", lambda field, text: not text.isupper())
+    field = EZETextField(validator="upper")
+
+    field.text = "abc"
+    assert field.error
+    field.text = "ABC"
+    assert not field.error
+
+
+def test_debounced_validator(app, run_until):
+    calls = []
+
+    def is_short(field, text):
+        calls.append(text)
+        return len(text) < 3
+
+    register_validator("long", is_short, debounce=0.01)
+    field = EZETextField(validator="long")
+    for text in ("a", "ab", "abc"):
+        field.text = text
+    run_until(lambda: calls)
+
+    # Only the last text is validated.
+    assert calls == ["abc"]
+    assert not field.error
+
+
+def test_async_validator(app, run_until):
+    taken = {"admin"}
+    calls = []
+
+    async def is_taken(field, text):
+        calls.append(text)
+        await asynckivy.sleep(0)
+        return text in taken
+
+    register_validator("username", is_taken)
+    field = EZETextField(validator="username")
+
+    field.text = "admin"
+    # The field keeps its state until the validator returns.
+    assert not field.error
+    run_until(lambda: field.error)
+
+    field.text = "user"
+    run_until(lambda: not field.error)
+    assert calls == ["admin", "user"]
@@ -0,0 +1,96 @@
+from collections import namedtuple
+
+from eze.uix.label.texture_cache import LabelTextureCache
+
+Texture = namedtuple("Texture", ("width", "height"))
+# 16 x 16 RGBA textures are 1024 bytes.
+TEXTURE_SIZE = 1024
+
+
+def create_texture():
+    return Texture(16, 16)
+
+
+def test_acquire_and_release():
+    cache = LabelTextureCache()
+    texture = create_texture()
+
+    assert cache.acquire("ok") is None
+    cache.add("ok", texture, None)
+    assert cache.acquire("ok") is texture
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["textures"] == 1
+    assert stats["bytes_saved"] == TEXTURE_SIZE
+    assert stats["unused_bytes"] == 0
+
+    cache.release("ok")
+    cache.release("ok")
+    assert cache.get_stats()["unused_bytes"] == TEXTURE_SIZE
+    # The unused texture is kept and can be reused.
+    assert cache.acquire("ok") is texture
+    assert cache.get_stats()["unused_bytes"] == 0
+
+
+def test_least_recently_used_unused_textures_are_evicted():
+    cache = LabelTextureCache(max_unused_bytes=2 * TEXTURE_SIZE)
+    for key in ("a", "b", "c"):
+        cache.add(key, create_texture(), None)
+    for key in ("a", "b", "c"):
+        cache.release(key)
+
+    assert cache.acquire("a") is None
+    assert cache.acquire("b") is not None
+    assert cache.acquire("c") is not None
+    assert cache.get_stats()["unused_bytes"] == 0
+
+
+def test_used_textures_are_not_evicted():
+    cache = LabelTextureCache(max_unused_bytes=0)
+    texture = create_texture()
+    cache.add("used", texture, None)
+    cache.add("unused", create_texture(), None)
+    cache.release("unused")
+
+    assert cache.acquire("used") is texture
+    assert cache.acquire("unused") is None
+
+
+def test_discard_and_clear():
+    cache = LabelTextureCache()
+    cache.add("a", create_texture(), None)
+    cache.release("a")
+    cache.discard("a")
+
+    assert cache.get_stats()["unused_bytes"] == 0
+    assert cache.acquire("a") is None
+
+    cache.add("b", create_texture(), None)
+    cache.clear()
+    assert cache.get_stats() == {
+        "hits": 0,
+        "misses": 0,
+        "hit_rate": 0.0,
+        "textures": 0,
+        "bytes": 0,
+        "unused_bytes": 0,
+        "bytes_saved": 0,
+    }
+
+
+def test_label_key_with_list_values(app):
+    from eze.uix.label import EZELabel
+
+    label = EZELabel(
+        text="Key",
+        use_texture_cache=True,
+        outline_color=[1, 0, 0, 1],
+        ellipsis_options={"color": [1, 0, 0, 1], "underline": True},
+    )
+    key = label._get_texture_cache_key()
+    hash(key)
+    label.texture_update()
+    assert label._texture_cache_key == key
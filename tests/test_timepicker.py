@@ -0,0 +1,33 @@
+import re
+
+import pytest
+
+# The pickers package imports the color picker, which needs Pillow.
+pytest.importorskip("PIL")
+
+from eze.uix.pickers.timepicker.timepicker import TimeInputTextField  # NOQA
+
+
+@pytest.mark.parametrize(
+    "num_type, valid, invalid",
+    [("hour", ["1", "09", "12"], ["13", "00"]), ("minute", ["0", "59"], ["60"])],
+)
+def test_validate_time(app, num_type, valid, invalid):
+    field = TimeInputTextField(num_type=num_type)
+
+    for text in valid:
+        assert field.validate_time(text)
+    for text in invalid:
+        assert not field.validate_time(text)
+
+
+@pytest.mark.parametrize("hour_regx", ["^1$", re.compile("^1$")])
+def test_overridden_pattern(app, hour_regx):
+    class HourField(TimeInputTextField):
+        pass
+
+    HourField.hour_regx = hour_regx
+    field = HourField(num_type="hour")
+
+    assert field.validate_time("1")
+    assert not field.validate_time("2")
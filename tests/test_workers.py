@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+
+from eze.utils.workers import WorkerPool
+
+
+def test_jobs_start_in_priority_order(run_until):
+    pool = WorkerPool(max_workers=1)
+    blocker = threading.Event()
+    started = []
+    pool.submit(blocker.wait)
+    jobs = [
+        pool.submit(started.append, name, priority=priority)
+        for name, priority in (("low", 0), ("high", 10), ("middle", 5))
+    ]
+
+    assert pool.running_count == 1
+    assert pool.pending_count == 3
+
+    blocker.set()
+    run_until(lambda: all(job.done for job in jobs))
+    assert started == ["high", "middle", "low"]
+    assert pool.running_count == pool.pending_count == 0
+    pool.shutdown()
+
+
+def test_callbacks_are_called_on_main_thread(run_until):
+    pool = WorkerPool(max_workers=2)
+    results = []
+    errors = []
+    pool.submit(
+        lambda: 1 / 1,
+        callback=lambda result: results.append(
+            (result, threading.current_thread())
+        ),
+    )
+    job = pool.submit(lambda: 1 / 0, error_callback=errors.append)
+    run_until(lambda: results and errors)
+
+    assert results == [(1.0, threading.main_thread())]
+    assert isinstance(errors[0], ZeroDivisionError)
+    assert job.state == "error"
+    pool.shutdown()
+
+
+def test_cancelled_jobs_do_not_call_back(run_until):
+    pool = WorkerPool(max_workers=1)
+    blocker = threading.Event()
+    results = []
+    running = pool.submit(blocker.wait, callback=results.append)
+    pending = pool.submit(lambda: "pending", callback=results.append)
+    running.cancel()
+    pending.cancel()
+    blocker.set()
+    marker = pool.submit(lambda: "marker", callback=results.append)
+    run_until(lambda: marker.done)
+
+    assert running.state == pending.state == "cancelled"
+    assert results == ["marker"]
+    pool.shutdown()
+
+
+def test_shutdown_cancels_jobs(run_until):
+    pool = WorkerPool(max_workers=1)
+    blocker = threading.Event()
+    running = pool.submit(blocker.wait)
+    pending = pool.submit(lambda: None)
+    pool.shutdown()
+    blocker.set()
+
+    assert running.state == pending.state == "cancelled"
+    with pytest.raises(RuntimeError):
+        pool.submit(lambda: None)
+
+
+def test_owner_jobs_are_cancelled(run_until):
+    class Owner:
+        pass
+
+    pool = WorkerPool(max_workers=1)
+    blocker = threading.Event()
+    owner = Owner()
+    pool.submit(blocker.wait)
+    job = pool.submit(lambda: None, owner=owner)
+    other = pool.submit(lambda: None)
+    pool.cancel_owner(owner)
+    blocker.set()
+    run_until(lambda: other.done)
+
+    assert job.state == "cancelled"
+    assert other.state == "done"
+    pool.shutdown()
@@ -214,7 +214,7 @@ from kivy.app import App
 from kivy.clock import Clock
 from kivy.core.window import Window
 from kivy.event import EventDispatcher
-from kivy.metrics import dp
+from kivy.metrics import Metrics, dp, sp
 from kivy.properties import (
     AliasProperty,
     BooleanProperty,
@@ -232,6 +232,10 @@ from eze.font_definitions import theme_font_styles
 from eze.material_resources import DEVICE_IOS, DEVICE_TYPE
 
 
+# The number of the font styles defined by EZE in `ThemeManager.font_styles`.
+_BUILTIN_FONT_STYLES_COUNT = 14
+
+
 class ThemeManager(EventDispatcher):
     primary_palette = OptionProperty("Blue", options=palette)
     """
@@ -1439,6 +1443,21 @@ class ThemeManager(EventDispatcher):
     :attr:`font_styles` is an :class:`~kivy.properties.DictProperty`.
     """
 
+    font_style_records = DictProperty()
+    """
+    Font styles resolved for labels: font name, font size in pixels and
+    whether the text is always capitalized. The font size is `None` for the
+    font styles added to :attr:`font_styles` by the user, labels keep their
+    own font size for them.
+
+    The records are recalculated when :attr:`font_styles` or the font scale
+    changes.
+
+    .. versionadded:: 0.1.0
+
+    :attr:`font_style_records` is an :class:`~kivy.properties.DictProperty`.
+    """
+
     def set_colors(
         self,
         primary_palette: str,
@@ -1535,9 +1554,26 @@ class ThemeManager(EventDispatcher):
         self._determine_device_orientation(None, Window.size)
         Window.bind(size=self._determine_device_orientation)
         self.bind(font_styles=self.sync_theme_styles)
+        self.bind(font_styles=self.update_font_style_records)
+        Metrics.bind(fontscale=self.update_font_style_records)
         self.colors = colors
+        self.update_font_style_records()
         Clock.schedule_once(self.sync_theme_styles)
 
+    def update_font_style_records(self, *args) -> None:
+        """Recalculates :attr:`font_style_records`."""
+
+        # The font size is only applied for the built-in font styles, which
+        # come first in the dictionary.
+        self.font_style_records = {
+            name: (
+                font_info[0],
+                sp(font_info[1]) if num < _BUILTIN_FONT_STYLES_COUNT else None,
+                font_info[2],
+            )
+            for num, (name, font_info) in enumerate(self.font_styles.items())
+        }
+
     def sync_theme_styles(self, *args) -> None:
         # Syncs the values from self.font_styles to theme_font_styles
         # this will ensure continuity when someone registers a new font_style.
@@ -1608,23 +1644,32 @@ class ThemableBehavior(EventDispatcher):
 
     """
 
+    # Theme properties whose observers are unbound from the removed widgets.
+    unbind_properties = (
+        "theme_style",
+        "material_style",
+        "device_orientation",
+        "primary_color",
+        "primary_palette",
+        "accent_palette",
+        "text_color",
+    )
+
+    # The application that has already been checked to be an `EZEApp`.
+    _checked_app = None
+
     def __init__(self, **kwargs):
-        self.unbind_properties = [
-            "theme_style",
-            "material_style",
-            "device_orientation",
-            "primary_color",
-            "primary_palette",
-            "accent_palette",
-            "text_color",
-        ]
-
-        if self.theme_cls is not None:
-            pass
-        else:
+        if self.theme_cls is None:
+            self.theme_cls = self._get_app_theme_cls()
+        super().__init__(**kwargs)
+
+    @staticmethod
+    def _get_app_theme_cls():
+        app = App.get_running_app()
+        if app is None or app is not ThemableBehavior._checked_app:
             try:
                 if not isinstance(
-                    App.get_running_app().property("theme_cls", True),
+                    app.property("theme_cls", True),
                     ObjectProperty,
                 ):
                     raise ValueError(
@@ -1636,24 +1681,18 @@ class ThemableBehavior(EventDispatcher):
                     "EZE: App object must be initialized before loading "
                     "root widget. See "
                 )
-            self.theme_cls = App.get_running_app().theme_cls
-
-        super().__init__(**kwargs)
-
-        # Fix circular imports.
-        from eze.uix.behaviors import CommonElevationBehavior
-        from eze.uix.label import EZELabel
-        from eze.uix.textfield import EZETextField
-
-        self.common_elevation_behavior = CommonElevationBehavior
-        self.eze_label = EZELabel
-        self.eze_textfield = EZETextField
+            ThemableBehavior._checked_app = app
+        return app.theme_cls
 
     def remove_widget(self, widget) -> None:
         if not hasattr(widget, "theme_cls"):
             super().remove_widget(widget)
             return
 
+        # Fix circular imports.
+        from eze.uix.label import EZELabel
+        from eze.uix.textfield import EZETextField
+
         callbacks = widget.theme_cls.get_property_observers("theme_style")
 
         for callback in callbacks:
@@ -1661,7 +1700,7 @@ class ThemableBehavior(EventDispatcher):
                 if hasattr(callback, "proxy") and hasattr(
                     callback.proxy, "theme_cls"
                 ):
-                    if issubclass(widget.__class__, self.eze_textfield):
+                    if isinstance(widget, EZETextField):
                         widget.theme_cls.unbind(
                             **{
                                 "theme_style": getattr(
@@ -1687,10 +1726,7 @@ class ThemableBehavior(EventDispatcher):
 
         # Canceling a scheduled method call on_window_touch for EZELabel
         # objects.
-        if (
-            issubclass(widget.__class__, self.eze_label)
-            and self.eze_label.allow_selection
-        ):
+        if isinstance(widget, EZELabel) and widget.allow_selection:
             Window.unbind(on_touch_down=widget.on_window_touch)
 
         super().remove_widget(widget)
@@ -0,0 +1,89 @@
+"""
+Benchmarks
+==========
+
+.. versionadded:: 0.1.0
+
+Scripts that measure the performance of EZE widgets:
+
+- :mod:`~eze.tools.benchmarks.construction` - construction throughput of
+  the main widget classes;
+- :mod:`~eze.tools.benchmarks.suite` - construction time, memory per
+  instance and first layout time of all registered widgets, saved as JSON;
+- :mod:`~eze.tools.benchmarks.textfield` - keystroke latency of a form of
+  text fields.
+
+The benchmarks do not need a display. When no display is available, SDL is
+switched to its `offscreen` video driver, so the benchmarks can run on
+a Linux machine without X11 or Wayland. Kivy must be configured before it
+is imported, so a benchmark restarts its process once at startup. Kivy
+parses the command line arguments when it is imported, so pass the
+benchmark arguments after ``--``::
+
+    python -m eze.tools.benchmarks.construction -- --count 1000
+"""
+
+import os
+import sys
+
+
+def setup_headless_environment() -> None:
+    """
+    Configures Kivy and SDL to run without a display, without console logs
+    and without the frame rate limit. Must be called before the Kivy window
+    is created.
+
+    Kivy reads the configuration when it is imported, which happens before
+    the benchmark runs, because the `eze` package imports Kivy. So the
+    benchmark process is restarted once with the configuration in its
+    environment.
+    """
+
+    environment = {
+        "KIVY_NO_CONSOLELOG": "1",
+        # Frames must not wait for the frame rate limit, the same as
+        # `Config.set("graphics", "maxfps", "0")` before Kivy is imported.
+        "KCFG_GRAPHICS_MAXFPS": "0",
+    }
+    if sys.platform.startswith("linux") and not (
+        os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")
+    ):
+        environment["SDL_VIDEODRIVER"] = "offscreen"
+
+    missing = {
+        name: value
+        for name, value in environment.items()
+        if name not in os.environ
+    }
+    os.environ.update(missing)
+    if not missing or "kivy" not in sys.modules:
+        return
+
+    spec = getattr(sys.modules["__main__"], "__spec__", None)
+    command = ["-m", spec.name] if spec else [sys.argv[0]]
+    # Kivy removes its own arguments and the `--` separator from `sys.argv`.
+    args = [sys.executable, *command, "--", *sys.argv[1:]]
+    sys.stdout.flush()
+    os.execv(sys.executable, args)
+
+
+def create_app():
+    """
+    Creates an application object, so that widgets can be created without
+    running the application.
+    """
+
+    from kivy.app import App
+
+    from eze.app import EZEApp
+
+    return App.get_running_app() or EZEApp()
+
+
+def run_frame() -> None:
+    """Runs the scheduled callbacks and draws a frame."""
+
+    from kivy.clock import Clock
+
+    Clock.tick()
+    Clock.tick_draw()
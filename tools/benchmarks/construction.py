@@ -0,0 +1,99 @@
+"""
+Widget construction benchmark
+=============================
+
+.. versionadded:: 0.1.0
+
+Measures how many widgets of the main EZE classes are created per second::
+
+    python -m eze.tools.benchmarks.construction -- --count 1000
+
+Example output::
+
+    EZELabel                       2431.2 widgets/s     411.3 us/widget
+    EZEIcon                        1538.0 widgets/s     650.2 us/widget
+    ...
+"""
+
+__all__ = ["main", "measure_construction"]
+
+import argparse
+import gc
+import time
+
+from eze.tools.benchmarks import create_app, setup_headless_environment
+
+# Names of the widget classes in the Kivy `Factory`.
+WIDGET_CLASSES = [
+    "EZELabel",
+    "EZEIcon",
+    "EZEBoxLayout",
+    "EZECard",
+    "EZERaisedButton",
+    "EZEIconButton",
+    "EZECheckbox",
+    "EZETextField",
+    "OneLineListItem",
+    "TwoLineAvatarIconListItem",
+    "EZEChip",
+]
+
+
+def measure_construction(widget_class, count: int) -> float:
+    """Returns the average time in seconds to create a `widget_class`."""
+
+    # The first widget loads the KV rules of the class.
+    widget_class()
+    widgets = []
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(count):
+            widgets.append(widget_class())
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.enable()
+    return elapsed / count
+
+
+def main():
+    """The function of running the construction benchmark."""
+
+    parser = create_argument_parser()
+    args = parser.parse_args()
+
+    setup_headless_environment()
+    from kivy.factory import Factory
+
+    create_app()
+    for name in args.widgets or WIDGET_CLASSES:
+        seconds = measure_construction(getattr(Factory, name), args.count)
+        print(
+            f"{name:<30} {1 / seconds:>8.1f} widgets/s "
+            f"{seconds * 1e6:>9.1f} us/widget"
+        )
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="construction.py",
+        allow_abbrev=False,
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=500,
+        help="the number of widgets of each class to create.",
+    )
+    parser.add_argument(
+        "--widgets",
+        nargs="*",
+        type=str,
+        help="the names of the widget classes to measure.",
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""
+Widget benchmark suite
+======================
+
+.. versionadded:: 0.1.0
+
+Measures every widget registered in :mod:`eze.factory_registers`:
+
+- construction time, in microseconds per widget;
+- memory per instance, in bytes of Python objects allocated for a widget
+  (textures and other GPU resources are not included);
+- first layout time, in microseconds: the time of the first two frames
+  after the widget is added to the window, when its layout and its KV
+  rules and scheduled callbacks are applied.
+
+Classes that are not widgets (behaviors and interfaces) are skipped.
+Widgets that fail to build are reported with the error.
+
+Run the suite and save the results::
+
+    python -m eze.tools.benchmarks.suite -- --output results-0.1.0.json
+
+Compare the results with the results of the previous release::
+
+    python -m eze.tools.benchmarks.suite -- \\
+        --output results-0.1.1.json \\
+        --compare results-0.1.0.json
+
+Results format
+--------------
+
+The results are saved as JSON with sorted keys, so that the files of
+different releases can be compared with ``diff``:
+
+.. code-block:: json
+
+    {
+      "environment": {
+        "eze": "0.1.0",
+        "kivy": "2.2.1",
+        "platform": "Linux-6.1.0-x86_64",
+        "python": "3.11.4"
+      },
+      "format": 1,
+      "settings": {"count": 200, "layout_samples": 20, "memory_count": 50},
+      "widgets": {
+        "EZELabel": {
+          "construction_us": 411.3,
+          "first_layout_us": 95.2,
+          "memory_bytes": 10328,
+          "module": "eze.uix.label"
+        },
+        "HoverBehavior": {
+          "module": "eze.uix.behaviors.hover_behavior",
+          "skipped": "not a widget"
+        }
+      }
+    }
+"""
+
+__all__ = ["main", "run_suite", "compare_results"]
+
+import argparse
+import gc
+import json
+import platform
+import time
+import tracemalloc
+
+from eze.tools.benchmarks import (
+    create_app,
+    run_frame,
+    setup_headless_environment,
+)
+from eze.tools.benchmarks.construction import measure_construction
+
+FORMAT_VERSION = 1
+# Measured values, compared between the runs.
+METRICS = ("construction_us", "memory_bytes", "first_layout_us")
+
+
+def get_registered_widgets() -> dict:
+    """
+    Returns the names of the classes registered in the Kivy `Factory` by
+    :mod:`eze.factory_registers` and the names of their modules.
+    """
+
+    from kivy.factory import Factory
+
+    return {
+        name: entry["module"]
+        for name, entry in Factory.classes.items()
+        if (entry.get("module") or "").startswith("eze.")
+    }
+
+
+def measure_memory(widget_class, count: int) -> int:
+    """
+    Returns the average size in bytes of the Python objects allocated to
+    create a `widget_class`.
+    """
+
+    widget_class()
+    widgets = []
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        for _ in range(count):
+            widgets.append(widget_class())
+        gc.collect()
+        allocated = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    return allocated // count
+
+
+def measure_first_layout(widget_class, samples: int) -> float:
+    """
+    Returns the average time in seconds of the first two frames after
+    a `widget_class` is added to the window.
+    """
+
+    from kivy.core.window import Window
+
+    run_frame()
+    total = 0
+    for _ in range(samples):
+        widget = widget_class()
+        Window.add_widget(widget)
+        start = time.perf_counter()
+        run_frame()
+        run_frame()
+        total += time.perf_counter() - start
+        Window.remove_widget(widget)
+        run_frame()
+    return total / samples
+
+
+def run_suite(
+    count: int = 200,
+    memory_count: int = 50,
+    layout_samples: int = 20,
+    names: list = None,
+) -> dict:
+    """
+    Measures the registered widgets and returns the results in the format
+    described in `Results format`_.
+    """
+
+    import kivy
+    from kivy.factory import Factory
+    from kivy.uix.widget import Widget
+
+    import eze
+
+    create_app()
+    widgets = {}
+    registered = get_registered_widgets()
+
+    for name in names or sorted(registered):
+        result = {"module": registered.get(name)}
+        widgets[name] = result
+        try:
+            widget_class = getattr(Factory, name)
+            if not (
+                isinstance(widget_class, type)
+                and issubclass(widget_class, Widget)
+            ):
+                result["skipped"] = "not a widget"
+                continue
+            result["construction_us"] = round(
+                measure_construction(widget_class, count) * 1e6, 1
+            )
+            result["memory_bytes"] = measure_memory(widget_class, memory_count)
+            result["first_layout_us"] = round(
+                measure_first_layout(widget_class, layout_samples) * 1e6, 1
+            )
+        except Exception as error:
+            result["error"] = f"{type(error).__name__}: {error}"
+
+    return {
+        "format": FORMAT_VERSION,
+        "environment": {
+            "eze": eze.__version__,
+            "kivy": kivy.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "settings": {
+            "count": count,
+            "memory_count": memory_count,
+            "layout_samples": layout_samples,
+        },
+        "widgets": widgets,
+    }
+
+
+def compare_results(previous: dict, current: dict, threshold: float) -> list:
+    """
+    Returns the (widget name, metric, previous value, current value) tuples
+    for the metrics that grew by more than `threshold` (0.1 for 10%).
+    """
+
+    regressions = []
+    for name, result in sorted(current["widgets"].items()):
+        previous_result = previous["widgets"].get(name, {})
+        for metric in METRICS:
+            old = previous_result.get(metric)
+            new = result.get(metric)
+            if old and new is not None and new > old * (1 + threshold):
+                regressions.append((name, metric, old, new))
+    return regressions
+
+
+def main():
+    """The function of running the benchmark suite."""
+
+    parser = create_argument_parser()
+    args = parser.parse_args()
+
+    setup_headless_environment()
+    results = run_suite(
+        args.count, args.memory_count, args.layout_samples, args.widgets
+    )
+
+    for name, result in sorted(results["widgets"].items()):
+        if "construction_us" in result:
+            print(
+                f"{name:<36} {result['construction_us']:>9.1f} us "
+                f"{result['memory_bytes']:>9} B "
+                f"{result['first_layout_us']:>9.1f} us"
+            )
+        else:
+            print(f"{name:<36} {result.get('skipped') or result.get('error')}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(results, output_file, indent=2, sort_keys=True)
+            output_file.write("\n")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as previous_file:
+            previous = json.load(previous_file)
+        regressions = compare_results(previous, results, args.threshold)
+        for name, metric, old, new in regressions:
+            print(f"Regression: {name} {metric} {old} -> {new}")
+        if regressions:
+            parser.exit(1)
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="suite.py",
+        allow_abbrev=False,
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=200,
+        help="the number of widgets of each class to create to measure "
+        "the construction time.",
+    )
+    parser.add_argument(
+        "--memory_count",
+        type=int,
+        default=50,
+        help="the number of widgets of each class to create to measure "
+        "the memory per instance.",
+    )
+    parser.add_argument(
+        "--layout_samples",
+        type=int,
+        default=20,
+        help="the number of widgets of each class to add to the window to "
+        "measure the first layout time.",
+    )
+    parser.add_argument(
+        "--widgets",
+        nargs="*",
+        type=str,
+        help="the names of the widget classes to measure, all registered "
+        "widgets by default.",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help="the path to the JSON file to save the results to.",
+    )
+    parser.add_argument(
+        "--compare",
+        type=str,
+        help="the path to the JSON file with the previous results; the "
+        "script exits with code 1 if there are regressions.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="the relative growth of a metric reported as a regression.",
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    main()
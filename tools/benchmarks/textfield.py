@@ -0,0 +1,123 @@
+"""
+Text field keystroke benchmark
+==============================
+
+.. versionadded:: 0.1.0
+
+Measures the latency of a keystroke in a form of
+:class:`~eze.uix.textfield.EZETextField` widgets: the time to insert
+a character into the focused field and to draw the next frame, when the
+scheduled callbacks and the animations started by the keystroke run::
+
+    python -m eze.tools.benchmarks.textfield -- --fields 30 --keystrokes 200
+
+Example output::
+
+    rectangle   30 fields    412.5 us/keystroke (p95    530.1 us)
+    fill        30 fields    398.2 us/keystroke (p95    511.7 us)
+    ...
+"""
+
+__all__ = ["main", "measure_keystrokes"]
+
+import argparse
+import time
+
+from eze.tools.benchmarks import (
+    create_app,
+    run_frame,
+    setup_headless_environment,
+)
+
+MODES = ["line", "rectangle", "fill", "round"]
+
+
+def measure_keystrokes(mode: str, fields: int, keystrokes: int) -> list:
+    """
+    Returns the times in seconds of `keystrokes` keystrokes into the first
+    of `fields` text fields of the `mode`.
+    """
+
+    from kivy.core.window import Window
+
+    from eze.uix.boxlayout import EZEBoxLayout
+    from eze.uix.textfield import EZETextField
+
+    form = EZEBoxLayout(orientation="vertical")
+    for index in range(fields):
+        form.add_widget(
+            EZETextField(
+                mode=mode,
+                hint_text=f"Field {index}",
+                helper_text="Helper text",
+                max_text_length=keystrokes * 2,
+            )
+        )
+    Window.add_widget(form)
+    field = form.children[-1]
+    field.focus = True
+    for _ in range(30):
+        run_frame()
+
+    times = []
+    for index in range(keystrokes):
+        start = time.perf_counter()
+        if index % 10 == 9:
+            field.do_backspace()
+        else:
+            field.insert_text("a")
+        run_frame()
+        times.append(time.perf_counter() - start)
+
+    Window.remove_widget(form)
+    run_frame()
+    return times
+
+
+def main():
+    """The function of running the keystroke benchmark."""
+
+    parser = create_argument_parser()
+    args = parser.parse_args()
+
+    setup_headless_environment()
+    create_app()
+    for mode in args.modes or MODES:
+        times = sorted(measure_keystrokes(mode, args.fields, args.keystrokes))
+        average = sum(times) / len(times)
+        p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+        print(
+            f"{mode:<10} {args.fields:>4} fields "
+            f"{average * 1e6:>9.1f} us/keystroke "
+            f"(p95 {p95 * 1e6:>9.1f} us)"
+        )
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="textfield.py",
+        allow_abbrev=False,
+    )
+    parser.add_argument(
+        "--fields",
+        type=int,
+        default=30,
+        help="the number of text fields in the form.",
+    )
+    parser.add_argument(
+        "--keystrokes",
+        type=int,
+        default=200,
+        help="the number of keystrokes to measure.",
+    )
+    parser.add_argument(
+        "--modes",
+        nargs="*",
+        type=str,
+        help="the modes of the text fields to measure.",
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 PyInstaller hook for EZE
 ===========================
 
-Adds fonts, images and KV files to package.
+Adds fonts, images, data and KV files to package.
 
 All modules from uix directory are added by Kivy hook.
 """
@@ -23,6 +23,11 @@ datas = [
         eze.images_path,
         str(Path("eze").joinpath(Path(eze.images_path).name)),
     ),
+    # Add files from the `eze/data` directory.
+    (
+        eze.data_path,
+        str(Path("eze").joinpath(Path(eze.data_path).name)),
+    ),
 ]
 
 # Add `.kv. files from the `eze/uix` directory.
@@ -558,13 +558,23 @@ class {}(EZEApp):{}
         architecture.
         """
 
-        for i, name_screen in enumerate(screens.keys()):
-            model = screens[name_screen]["model"]({})
-            controller = screens[name_screen]["controller"](model)
-            view = controller.get_view()
-            view.manager_screens = self.manager_screens
-            view.name = name_screen
-            self.manager_screens.add_widget(view)
+        for name_screen in screens.keys():
+            # The screen is created when it is shown for the first time.
+            self.manager_screens.register_screen(
+                name_screen, self.create_application_screen
+            )
+        if screens:
+            self.manager_screens.current = next(iter(screens))
+
+    def create_application_screen(self, name_screen: str):
+        """Creates the screen with the `name_screen` name."""
+
+        model = screens[name_screen]["model"]({})
+        controller = screens[name_screen]["controller"](model)
+        view = controller.get_view()
+        view.manager_screens = self.manager_screens
+        view.name = name_screen
+        return view
 {}{}
 
 {}().run()
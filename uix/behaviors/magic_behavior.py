@@ -90,6 +90,8 @@ from kivy.animation import Animation
 from kivy.lang import Builder
 from kivy.properties import NumericProperty
 
+from eze.animation import EZEAnimation
+
 Builder.load_string(
     """
 <MagicBehavior>
@@ -130,14 +132,19 @@ class MagicBehavior:
         """Grow effect animation."""
 
         (
-            Animation(
+            EZEAnimation(
                 scale_x=1.2,
                 scale_y=1.2,
                 t="out_quad",
                 d=0.03 / self.magic_speed,
+                priority="decorative",
             )
-            + Animation(
-                scale_x=1, scale_y=1, t="out_elastic", d=0.4 / self.magic_speed
+            + EZEAnimation(
+                scale_x=1,
+                scale_y=1,
+                t="out_elastic",
+                d=0.4 / self.magic_speed,
+                priority="decorative",
             )
         ).start(self)
 
@@ -145,9 +152,17 @@ class MagicBehavior:
         """Shake effect animation."""
 
         (
-            Animation(translate_x=50, t="out_quad", d=0.02 / self.magic_speed)
-            + Animation(
-                translate_x=0, t="out_elastic", d=0.5 / self.magic_speed
+            EZEAnimation(
+                translate_x=50,
+                t="out_quad",
+                d=0.02 / self.magic_speed,
+                priority="decorative",
+            )
+            + EZEAnimation(
+                translate_x=0,
+                t="out_elastic",
+                d=0.5 / self.magic_speed,
+                priority="decorative",
             )
         ).start(self)
 
@@ -156,15 +171,31 @@ class MagicBehavior:
 
         (
             (
-                Animation(scale_y=0.7, t="out_quad", d=0.03 / self.magic_speed)
-                & Animation(
-                    scale_x=1.4, t="out_quad", d=0.03 / self.magic_speed
+                EZEAnimation(
+                    scale_y=0.7,
+                    t="out_quad",
+                    d=0.03 / self.magic_speed,
+                    priority="decorative",
+                )
+                & EZEAnimation(
+                    scale_x=1.4,
+                    t="out_quad",
+                    d=0.03 / self.magic_speed,
+                    priority="decorative",
                 )
             )
             + (
-                Animation(scale_y=1, t="out_elastic", d=0.5 / self.magic_speed)
-                & Animation(
-                    scale_x=1, t="out_elastic", d=0.4 / self.magic_speed
+                EZEAnimation(
+                    scale_y=1,
+                    t="out_elastic",
+                    d=0.5 / self.magic_speed,
+                    priority="decorative",
+                )
+                & EZEAnimation(
+                    scale_x=1,
+                    t="out_elastic",
+                    d=0.4 / self.magic_speed,
+                    priority="decorative",
                 )
             )
         ).start(self)
@@ -173,15 +204,29 @@ class MagicBehavior:
         """Twist effect animation."""
 
         (
-            Animation(rotate=25, t="out_quad", d=0.05 / self.magic_speed)
-            + Animation(rotate=0, t="out_elastic", d=0.5 / self.magic_speed)
+            EZEAnimation(
+                rotate=25,
+                t="out_quad",
+                d=0.05 / self.magic_speed,
+                priority="decorative",
+            )
+            + EZEAnimation(
+                rotate=0,
+                t="out_elastic",
+                d=0.5 / self.magic_speed,
+                priority="decorative",
+            )
         ).start(self)
 
     def shrink(self) -> None:
         """Shrink effect animation."""
 
-        Animation(
-            scale_x=0.95, scale_y=0.95, t="out_quad", d=0.1 / self.magic_speed
+        EZEAnimation(
+            scale_x=0.95,
+            scale_y=0.95,
+            t="out_quad",
+            d=0.1 / self.magic_speed,
+            priority="decorative",
         ).start(self)
 
     def on_touch_up(self, *args):
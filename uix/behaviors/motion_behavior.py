@@ -20,12 +20,13 @@ __all__ = (
     "MotionShackBehavior",
 )
 
-from kivy.animation import Animation
 from kivy.clock import Clock
 from kivy.core.window import Window
 from kivy.properties import StringProperty, NumericProperty
 
+from eze.animation import EZEAnimation
 from eze.uix.behaviors.stencil_behavior import StencilBehavior
+from eze.utils import asynckivy
 
 
 class MotionBase:
@@ -132,7 +133,8 @@ class MotionDropDownMenuBehavior(MotionBase):
         self._scale_y = 0
 
     def on_dismiss(self) -> None:
-        anim = Animation(
+        anim = EZEAnimation(
+            priority="essential",
             _scale_x=0,
             _scale_y=0,
             # _opacity=0,
@@ -143,13 +145,15 @@ class MotionDropDownMenuBehavior(MotionBase):
         anim.start(self)
 
     def on_open(self, *args):
-        anim = Animation(
+        anim = EZEAnimation(
+            priority="essential",
             _scale_y=1,
             # _opacity=1,
             duration=self.show_duration,
             transition=self.show_transition,
         )
-        anim &= Animation(
+        anim &= EZEAnimation(
+            priority="essential",
             _scale_x=1,
             duration=self.show_duration - 0.3,
             transition="out_quad",
@@ -216,7 +220,8 @@ class MotionDialogBehavior(MotionBase):
     def on_open(self, *args):
         """Called when a dialog opened."""
 
-        Animation(
+        EZEAnimation(
+            priority="essential",
             opacity=1,
             scale_value_x=1,
             scale_value_y=1,
@@ -235,7 +240,6 @@ class MotionShackBehavior(StencilBehavior, MotionBase):
     documentation.
     """
 
-    _interval = 0
     _height = 0
 
     def on_dismiss(self, *args):
@@ -247,7 +251,8 @@ class MotionShackBehavior(StencilBehavior, MotionBase):
             self.dispatch("on_dismiss")
 
         Clock.unschedule(self._wait_interval)
-        anim = Animation(
+        anim = EZEAnimation(
+            priority="essential",
             opacity=0,
             height=0,
             t=self.hide_transition,
@@ -259,27 +264,22 @@ class MotionShackBehavior(StencilBehavior, MotionBase):
     def on_open(self, *args):
         """Called when a snackbar opened."""
 
-        def open(*args):
+        async def open():
             self._height = self.height
             self.height = 0
-            anim = Animation(
+            anim = EZEAnimation(
+                priority="essential",
                 opacity=1,
                 height=self._height,
                 t=self.show_transition,
                 d=self.show_duration,
             )
-            anim.bind(
-                on_complete=lambda *args: Clock.schedule_interval(
-                    self._wait_interval, 1
-                )
-            )
             anim.start(self)
+            await asynckivy.animation_complete(anim)
+            Clock.schedule_once(self._wait_interval, self.duration)
 
-        Clock.schedule_once(open)
+        Clock.schedule_once(lambda x: asynckivy.start(open()))
         self.dispatch("on_open")
 
-    def _wait_interval(self, interval):
-        self._interval += interval
-        if self._interval > self.duration:
-            self.dismiss()
-            self._interval = 0
+    def _wait_interval(self, *args):
+        self.dismiss()
@@ -110,6 +110,8 @@ from kivy.properties import (
 )
 from kivy.uix.behaviors import ToggleButtonBehavior
 
+from eze.animation import EZEAnimation
+
 
 class CommonRipple:
     """Base class for ripple effect."""
@@ -298,7 +300,8 @@ class CommonRipple:
     def start_ripple(self) -> None:
         if not self._doing_ripple:
             self._doing_ripple = True
-            anim = Animation(
+            anim = EZEAnimation(
+                priority="decorative",
                 _ripple_rad=self.finish_rad,
                 t="linear",
                 duration=self.ripple_duration_in_slow,
@@ -311,7 +314,8 @@ class CommonRipple:
             self._finishing_ripple = True
             self._doing_ripple = False
             Animation.cancel_all(self, "_ripple_rad")
-            anim = Animation(
+            anim = EZEAnimation(
+                priority="decorative",
                 _ripple_rad=self.finish_rad,
                 t=self.ripple_func_in,
                 duration=self.ripple_duration_in_fast,
@@ -324,7 +328,8 @@ class CommonRipple:
         if not self._fading_out:
             self._fading_out = True
             Animation.cancel_all(self, "ripple_color")
-            anim = Animation(
+            anim = EZEAnimation(
+                priority="decorative",
                 ripple_color=[rc[0], rc[1], rc[2], 0.0],
                 t=self.ripple_func_out,
                 duration=self.ripple_duration_out,
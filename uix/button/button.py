@@ -1924,6 +1924,10 @@ class EZEFloatingActionButtonSpeedDial(
     _anim_labels_data = {}
 
     def __init__(self, **kwargs):
+        # (Button class, property name) -> value of the stack properties,
+        # applied to the buttons when they are created. The properties can
+        # be set by `kwargs` in `super().__init__`.
+        self._button_properties = {}
         super().__init__(**kwargs)
         self.register_event_type("on_open")
         self.register_event_type("on_close")
@@ -2021,6 +2025,7 @@ class EZEFloatingActionButtonSpeedDial(
                     callback = parameters[parameters.index("on_release") + 1]
                     bottom_button.bind(on_release=callback)
 
+                self._apply_button_properties(bottom_button)
                 self.set_pos_bottom_buttons(bottom_button)
                 self.add_widget(bottom_button)
                 self.stack_buttons[name] = WeakProxy(bottom_button)
@@ -2039,6 +2044,7 @@ class EZEFloatingActionButtonSpeedDial(
             # Top root button.
             root_button = EZEFloatingRootButton(on_release=self.open_stack)
             root_button.icon = self.icon
+            self._apply_button_properties(root_button)
             self.set_pos_root_button(root_button)
             self.add_widget(root_button)
 
@@ -2284,12 +2290,16 @@ class EZEFloatingActionButtonSpeedDial(
     def _set_button_property(
         self, instance, property_name: str, property_value: str | list
     ):
-        def set_count_widget(*args):
-            if self.children:
-                for widget in self.children:
-                    if isinstance(widget, instance):
-                        setattr(instance, property_name, property_value)
-                        Clock.unschedule(set_count_widget)
-                        break
-
-        Clock.schedule_interval(set_count_widget, 0)
+        # Sets the property of the created buttons of the `instance` class
+        # and of the buttons created later by `on_data`.
+        self._button_properties[(instance, property_name)] = property_value
+        for widget in self.children:
+            if isinstance(widget, instance):
+                setattr(widget, property_name, property_value)
+
+    def _apply_button_properties(self, button) -> None:
+        for (instance, property_name), value in (
+            self._button_properties.items()
+        ):
+            if isinstance(button, instance):
+                setattr(button, property_name, value)
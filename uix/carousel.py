@@ -51,14 +51,39 @@ EZECarousel
         on_slide_complete:
             do_something()
 
+Snapshot slides
+---------------
+
+.. versionadded:: 0.1.0
+
+With :attr:`~EZECarousel.snapshot_slides`, the previous and the next
+slides are rendered to textures in idle frames, and only these textures
+are drawn instead of the widget trees of the slides while swiping. The
+live slides are drawn again when the slide animation is complete. Use it
+for heavy slides such as charts and image grids:
+
+.. code-block:: kv
+
+    EZECarousel:
+        snapshot_slides: True
+
+The snapshots show the slides as they were when rendered. Call
+:meth:`~EZECarousel.refresh_snapshots` after changing the content of the
+adjacent slides.
 """
 # TODO: Add documentation.
 
+__all__ = ("EZECarousel",)
+
 from kivy.animation import Animation
+from kivy.clock import Clock
+from kivy.graphics import Color, InstructionGroup, Rectangle
+from kivy.properties import BooleanProperty
 from kivy.uix.carousel import Carousel
 
 from eze.theming import ThemableBehavior
 from eze.uix.behaviors import DeclarativeBehavior
+from eze.utils.snapshot import render_snapshot
 
 
 class EZECarousel(DeclarativeBehavior, ThemableBehavior, Carousel):
@@ -69,12 +94,132 @@ class EZECarousel(DeclarativeBehavior, ThemableBehavior, Carousel):
         `kivy.uix.carousel.Carousel <https://kivy.org/doc/stable/api-kivy.uix.carousel.html>`_
     """
 
+    snapshot_slides = BooleanProperty(False)
+    """
+    Draw the snapshots of the previous and the next slides instead of the
+    slides while swiping. See `Snapshot slides`_.
+
+    .. versionadded:: 0.1.0
+
+    :attr:`snapshot_slides` is an :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
     _scrolling = False
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.register_event_type("on_slide_progress")
         self.register_event_type("on_slide_complete")
+        # Slide -> Fbo of its snapshot.
+        self._snapshots = {}
+        # Slides rendered since the last change of the current slide.
+        self._fresh_snapshots = set()
+        # Slide -> instruction group drawn instead of the slide.
+        self._shown_snapshots = {}
+        self._snapshot_event = None
+        self.fbind("_offset", self._on_offset_snapshots)
+        self.fbind("index", self._on_index_snapshots)
+        self.fbind("size", self._on_index_snapshots)
+        self.fbind("snapshot_slides", self._on_index_snapshots)
+
+    def refresh_snapshots(self, *args) -> None:
+        """
+        Renders the snapshots of the adjacent slides again in the next idle
+        frames.
+
+        .. versionadded:: 0.1.0
+        """
+
+        self._fresh_snapshots.clear()
+        self._schedule_snapshot()
+
+    def remove_widget(self, widget, *args, **kwargs):
+        self._show_live_slides()
+        self._release_snapshot(widget)
+        return super().remove_widget(widget, *args, **kwargs)
+
+    def _get_adjacent_slides(self) -> list:
+        return [
+            slide
+            for slide in (self.previous_slide, self.next_slide)
+            if slide is not None and slide is not self.current_slide
+        ]
+
+    def _on_index_snapshots(self, *args) -> None:
+        # The current slide has changed, the adjacent slides are drawn live
+        # until the next swipe and their snapshots are rendered again.
+        self._show_live_slides()
+        self._fresh_snapshots.clear()
+        adjacent_slides = self._get_adjacent_slides()
+        for slide in list(self._snapshots):
+            if slide not in adjacent_slides or not self.snapshot_slides:
+                self._release_snapshot(slide)
+        self._schedule_snapshot()
+
+    def _on_offset_snapshots(self, instance, offset: float) -> None:
+        if offset and self.snapshot_slides and not self._shown_snapshots:
+            self._show_snapshots()
+
+    def _schedule_snapshot(self) -> None:
+        if self.snapshot_slides and self._snapshot_event is None:
+            self._snapshot_event = Clock.schedule_once(self._render_snapshot)
+
+    def _render_snapshot(self, *args) -> None:
+        # Renders one snapshot per idle frame.
+        self._snapshot_event = None
+        if not self.snapshot_slides:
+            return
+        if self._touch or self._offset:
+            # Not idle, retried when the slide animation is complete.
+            return
+
+        for slide in self._get_adjacent_slides():
+            if slide in self._fresh_snapshots:
+                continue
+            if slide.width > 0 and slide.height > 0:
+                self._render_slide(slide)
+            self._fresh_snapshots.add(slide)
+            self._schedule_snapshot()
+            return
+
+    def _render_slide(self, slide) -> None:
+        self._snapshots[slide] = render_snapshot(
+            slide, self._snapshots.get(slide)
+        )
+
+    def _show_snapshots(self) -> None:
+        for slide in self._get_adjacent_slides():
+            fbo = self._snapshots.get(slide)
+            if fbo is None or slide not in self._fresh_snapshots:
+                continue
+            container = self.get_slide_container(slide)
+            canvas_index = container.canvas.indexof(slide.canvas)
+            if canvas_index == -1:
+                continue
+            snapshot = InstructionGroup()
+            snapshot.add(Color(1, 1, 1, slide.opacity))
+            snapshot.add(
+                Rectangle(texture=fbo.texture, pos=slide.pos, size=fbo.size)
+            )
+            container.canvas.remove(slide.canvas)
+            container.canvas.insert(canvas_index, snapshot)
+            self._shown_snapshots[slide] = snapshot
+
+    def _show_live_slides(self) -> None:
+        shown_snapshots, self._shown_snapshots = self._shown_snapshots, {}
+        for slide, snapshot in shown_snapshots.items():
+            container = self.get_slide_container(slide)
+            if container is None:
+                continue
+            canvas_index = container.canvas.indexof(snapshot)
+            if canvas_index > -1:
+                container.canvas.remove(snapshot)
+                container.canvas.insert(canvas_index, slide.canvas)
+
+    def _release_snapshot(self, slide) -> None:
+        self._snapshots.pop(slide, None)
+        self._fresh_snapshots.discard(slide)
 
     def on_slide_progress(self, *args):
         """
@@ -199,6 +344,9 @@ class EZECarousel(DeclarativeBehavior, ThemableBehavior, Carousel):
         anim.cancel_all(self)
 
         def _cmp(*args):
+            if self._shown_snapshots:
+                self._show_live_slides()
+            self._schedule_snapshot()
             self.dispatch(
                 "on_slide_complete",
                 self.previous_slide,
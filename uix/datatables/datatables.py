@@ -1585,7 +1585,17 @@ class EZEDataTable(ThemableBehavior, AnchorLayout):
 
         Remember that this is a heavy function. since the whole data set must
         be updated. you can get better results calling this metod with in a
-        coroutine.
+        coroutine, preparing the data in a thread:
+
+        .. code-block:: python
+
+            from eze.utils import asynckivy
+
+            async def update_table():
+                data = await asynckivy.run_in_executor(load_rows)
+                data_table.update_row_data(data_table, data)
+
+            asynckivy.start(update_table())
         """
 
         self.table_data.row_data = data
@@ -559,10 +559,34 @@ Using multiple heroes at the same time
     :align: center
 """
 
+import weakref
+
 from kivy.properties import StringProperty
 
 from eze.uix.boxlayout import EZEBoxLayout
 
+# Tag -> weak set of the `EZEHeroFrom` widgets with this tag.
+_heroes_from = {}
+
+
+def get_heroes_from(tag: str) -> list:
+    """
+    Returns the existing :class:`EZEHeroFrom` widgets with the `tag`.
+
+    .. versionadded:: 0.1.0
+    """
+
+    heroes = _heroes_from.get(tag)
+    return list(heroes) if heroes else []
+
+
+def _remove_empty_tag(tag: str) -> None:
+    heroes = _heroes_from.get(tag)
+    # The set can still hold the dead reference of a deleted hero, its
+    # iteration skips the dead references.
+    if heroes is not None and next(iter(heroes), None) is None:
+        del _heroes_from[tag]
+
 
 class EZEHeroFrom(EZEBoxLayout):
     """
@@ -586,10 +610,34 @@ class EZEHeroFrom(EZEBoxLayout):
     and defaults to `''`.
     """
 
+    _registered_tag = None
+    _tag_finalizer = None
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.register_event_type("on_transform_in")
         self.register_event_type("on_transform_out")
+        self._register_tag()
+        self.fbind("tag", self._register_tag)
+
+    def _register_tag(self, *args) -> None:
+        # The heroes are looked up by their tags in the transitions.
+        # The widgets are referenced weakly, so deleted heroes are
+        # removed from the registry, as well as their tags when no other
+        # hero has them.
+        if self._tag_finalizer is not None:
+            self._tag_finalizer.detach()
+            self._tag_finalizer = None
+        heroes = _heroes_from.get(self._registered_tag)
+        if heroes is not None:
+            heroes.discard(self)
+            _remove_empty_tag(self._registered_tag)
+        self._registered_tag = self.tag
+        if self.tag:
+            _heroes_from.setdefault(self.tag, weakref.WeakSet()).add(self)
+            self._tag_finalizer = weakref.finalize(
+                self, _remove_empty_tag, self.tag
+            )
 
     def on_transform_in(self, *args):
         """Called when the hero flies from screen **A** to screen **B**."""
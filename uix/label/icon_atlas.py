@@ -0,0 +1,190 @@
+"""
+Components/Label/IconAtlas
+==========================
+
+.. versionadded:: 0.1.0
+
+Shared texture atlas for the glyphs drawn by :class:`~eze.uix.label.EZEIcon`.
+
+Each (glyph, font, size) combination is rasterized once, in white, into a
+large shared texture. Icons then draw the region of that texture and tint it
+with a :class:`~kivy.graphics.Color` instruction, so changing the color of
+an icon does not render a new texture and hundreds of icons on a screen
+share a few atlas pages instead of owning one texture each.
+
+The atlas is used by icons whose
+:attr:`~eze.uix.label.EZEIcon.use_icon_atlas` attribute is `True`:
+
+.. code-block:: kv
+
+    EZEIcon:
+        icon: "gmail"
+        use_icon_atlas: True
+"""
+
+from __future__ import annotations
+
+__all__ = ("IconAtlas", "icon_atlas")
+
+from kivy.core.text import Label as CoreLabel
+from kivy.graphics.texture import Texture
+
+# Space between glyphs, so that the texture filtering of one region does not
+# pick up the pixels of its neighbors.
+_PADDING = 1
+
+
+class _AtlasPage:
+    """A single atlas texture filled with glyphs shelf by shelf."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.texture = Texture.create(size=(size, size), colorfmt="rgba")
+        self.texture.add_reload_observer(self._on_reload)
+        self.glyphs = []
+        self._x = 0
+        self._y = 0
+        self._shelf_height = 0
+        self._clear()
+
+    def _clear(self) -> None:
+        self.texture.blit_buffer(
+            b"\x00" * (self.size * self.size * 4),
+            colorfmt="rgba",
+            bufferfmt="ubyte",
+        )
+
+    def _on_reload(self, texture: Texture) -> None:
+        # The content of the textures is lost together with the OpenGL
+        # context (for example, when an Android app is resumed).
+        self._clear()
+        for glyph, font_name, font_size, pos in self.glyphs:
+            self._blit(_render_glyph(glyph, font_name, font_size), pos)
+
+    def _blit(self, glyph_texture: Texture, pos: tuple) -> None:
+        self.texture.blit_buffer(
+            glyph_texture.pixels,
+            pos=pos,
+            size=glyph_texture.size,
+            colorfmt="rgba",
+            bufferfmt="ubyte",
+        )
+
+    def add(
+        self,
+        glyph_texture: Texture,
+        glyph: str,
+        font_name: str,
+        font_size: int,
+    ) -> Texture | None:
+        """
+        Copies the glyph texture to the page. Returns the region of the page
+        texture with the glyph or `None` if the page is full.
+        """
+
+        width, height = glyph_texture.size
+        if self._x + width > self.size:
+            self._x = 0
+            self._y += self._shelf_height + _PADDING
+            self._shelf_height = 0
+        if self._y + height > self.size:
+            return None
+
+        pos = (self._x, self._y)
+        self._blit(glyph_texture, pos)
+        self.glyphs.append((glyph, font_name, font_size, pos))
+        self._x += width + _PADDING
+        self._shelf_height = max(self._shelf_height, height)
+        return self.texture.get_region(*pos, width, height)
+
+
+def _render_glyph(glyph: str, font_name: str, font_size: int) -> Texture:
+    label = CoreLabel(
+        text=glyph, font_name=font_name, font_size=font_size, color=(1, 1, 1, 1)
+    )
+    label.refresh()
+    return label.texture
+
+
+class IconAtlas:
+    """
+    Cache of white glyph textures packed into shared atlas pages.
+
+    :param page_size: width and height of each atlas page in pixels.
+    """
+
+    def __init__(self, page_size: int = 1024):
+        self.page_size = page_size
+        self._pages = []
+        self._regions = {}
+        self._blank_texture = None
+
+    @property
+    def blank_texture(self) -> Texture:
+        """
+        A transparent 1x1 texture. Icons drawn from the atlas give it to the
+        :class:`~kivy.uix.label.Label` canvas instead of a rendered text.
+        """
+
+        if self._blank_texture is None:
+            self._blank_texture = Texture.create(size=(1, 1), colorfmt="rgba")
+            self._blank_texture.blit_buffer(
+                b"\x00" * 4, colorfmt="rgba", bufferfmt="ubyte"
+            )
+        return self._blank_texture
+
+    def get_texture(
+        self, glyph: str, font_name: str, font_size: float
+    ) -> Texture | None:
+        """
+        Returns the texture region with the white `glyph` rendered with the
+        given font, rasterizing it on the first request. Returns `None` for
+        an empty glyph.
+        """
+
+        if not glyph:
+            return None
+
+        font_size = int(round(font_size))
+        key = (glyph, font_name, font_size)
+        region = self._regions.get(key)
+        if region is not None:
+            return region
+
+        glyph_texture = _render_glyph(glyph, font_name, font_size)
+        if (
+            glyph_texture.width > self.page_size
+            or glyph_texture.height > self.page_size
+        ):
+            # Too big for the atlas, the icon owns its texture in this case.
+            region = glyph_texture
+        else:
+            if self._pages:
+                region = self._pages[-1].add(
+                    glyph_texture, glyph, font_name, font_size
+                )
+            if not self._pages or region is None:
+                page = _AtlasPage(self.page_size)
+                self._pages.append(page)
+                region = page.add(glyph_texture, glyph, font_name, font_size)
+
+        self._regions[key] = region
+        return region
+
+    def get_stats(self) -> dict:
+        """Returns the number of cached glyphs and atlas pages."""
+
+        return {"glyphs": len(self._regions), "pages": len(self._pages)}
+
+    def clear(self) -> None:
+        """
+        Drops all cached glyphs. Icons that already use the atlas keep their
+        textures until they are updated.
+        """
+
+        self._pages = []
+        self._regions = {}
+
+
+icon_atlas = IconAtlas()
+"""The atlas shared by all icons."""
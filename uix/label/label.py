@@ -505,6 +505,7 @@ from __future__ import annotations
 __all__ = ("EZELabel", "EZEIcon")
 
 import os
+import weakref
 from typing import Union
 
 from kivy.animation import Animation
@@ -513,7 +514,6 @@ from kivy.core.clipboard import Clipboard
 from kivy.core.window import Window
 from kivy.graphics import Color, Rectangle
 from kivy.lang import Builder
-from kivy.metrics import sp
 from kivy.properties import (
     AliasProperty,
     BooleanProperty,
@@ -532,6 +532,19 @@ from eze.theming_dynamic_text import get_contrast_text_color
 from eze.uix import EZEAdaptiveWidget
 from eze.uix.behaviors import DeclarativeBehavior, TouchBehavior
 from eze.uix.floatlayout import EZEFloatLayout
+from eze.uix.label.icon_atlas import icon_atlas
+from eze.uix.label.texture_cache import label_texture_cache
+
+
+def _freeze(value):
+    """Converts lists and dicts in `value` to tuples, recursively."""
+
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
 
 __EZELabel_colors__ = {
     "Primary": "text_color",
@@ -690,7 +703,22 @@ class EZELabel(
     and defaults to `False`.
     """
 
+    use_texture_cache = BooleanProperty(False)
+    """
+    Share the rendered text texture with other labels that have the same
+    text, font, color, alignment and width (see
+    :mod:`~eze.uix.label.texture_cache`). Labels with markup always render
+    their own texture.
+
+    .. versionadded:: 0.1.0
+
+    :attr:`use_texture_cache` is an :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
     _text_color_str = StringProperty()
+    _texture_cache_key = None
+    _texture_cache_finalizer = None
 
     parent_background = ColorProperty(None)
     can_capitalize = BooleanProperty(True)
@@ -712,7 +740,7 @@ class EZELabel(
         Clock.schedule_once(self.check_font_styles)
 
     def check_font_styles(self, interval: Union[int, float] = 0) -> bool:
-        if self.font_style not in list(self.theme_cls.font_styles.keys()):
+        if self.font_style not in self.theme_cls.font_style_records:
             raise ValueError(
                 f"MDLabel.font_style is set to an invalid option '{self.font_style}'."
                 f"Must be one of: {list(self.theme_cls.font_styles)}"
@@ -722,19 +750,79 @@ class EZELabel(
 
     def update_font_style(self, instance_label, font_style: str) -> None:
         if self.check_font_styles() is True:
-            font_info = self.theme_cls.font_styles[self.font_style]
-            self.font_name = font_info[0]
-            if self.font_style in list(self.theme_cls.font_styles.keys())[0:14]:
-                self.font_size = sp(font_info[1])
-
-            if font_info[2] and self.can_capitalize:
-                self._capitalizing = True
-            else:
-                self._capitalizing = False
+            font_name, font_size, capitalize = self.theme_cls.font_style_records[
+                self.font_style
+            ]
+            self.font_name = font_name
+            if font_size is not None:
+                self.font_size = font_size
+            self._capitalizing = bool(capitalize and self.can_capitalize)
 
         # TODO: Add letter spacing change
         # self.letter_spacing = font_info[3]
 
+    def on_use_texture_cache(self, instance_label, value: bool) -> None:
+        self._trigger_texture()
+
+    def texture_update(self, *args) -> None:
+        if not self.use_texture_cache or self.markup or not self.text:
+            self._release_cached_texture()
+            super().texture_update(*args)
+            return
+
+        try:
+            key = self._get_texture_cache_key()
+            hash(key)
+        except TypeError:
+            # A font property holds a value that cannot be a part of the key.
+            self._release_cached_texture()
+            super().texture_update(*args)
+            return
+        if key == self._texture_cache_key:
+            return
+
+        self._release_cached_texture()
+        texture = label_texture_cache.acquire(key)
+        if texture is None:
+            super().texture_update(*args)
+            texture = self.texture
+            if texture is None or texture is self._label.texture_1px:
+                return
+            # The cached texture is filled by the core label that rendered
+            # it, so this label gets a new core label for other texts.
+            label_texture_cache.add(key, texture, self._label)
+            self._label = None
+            self._create_label()
+        else:
+            self.texture = texture
+            self.texture_size = list(texture.size)
+
+        self._texture_cache_key = key
+        self._texture_cache_finalizer = weakref.finalize(
+            self, label_texture_cache.release, key
+        )
+
+    def _get_texture_cache_key(self) -> tuple:
+        key = [self.disabled]
+        for name in self._font_properties:
+            value = getattr(self, name)
+            if name == "text_size":
+                # Sizes that differ by a fraction of a pixel give the same
+                # texture.
+                value = tuple(
+                    int(size) if size is not None else None for size in value
+                )
+            else:
+                value = _freeze(value)
+            key.append(value)
+        return tuple(key)
+
+    def _release_cached_texture(self) -> None:
+        if self._texture_cache_finalizer is not None:
+            self._texture_cache_finalizer()
+            self._texture_cache_finalizer = None
+            self._texture_cache_key = None
+
     def do_selection(self) -> None:
         if not self.is_selected:
             self.eze_bg_color = (
@@ -939,12 +1027,45 @@ class EZEIcon(EZEFloatLayout, EZELabel):
     and defaults to `None`.
     """
 
+    use_icon_atlas = BooleanProperty(False)
+    """
+    Draw the icon glyph from the shared icon atlas (see
+    :mod:`~eze.uix.label.icon_atlas`) instead of rendering a texture for
+    each icon. The glyph is rasterized once for each font size and tinted
+    with the icon color when drawing.
+
+    .. versionadded:: 0.1.0
+
+    :attr:`use_icon_atlas` is an :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
     _size = ListProperty((0, 0))
+    _icon_texture = ObjectProperty(None, allownone=True)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         Clock.schedule_once(self.adjust_size)
 
+    def on_use_icon_atlas(self, instance_icon, value: bool) -> None:
+        self._trigger_texture()
+
+    def texture_update(self, *args) -> None:
+        if not self.use_icon_atlas or self.source:
+            self._icon_texture = None
+            super().texture_update(*args)
+            return
+
+        self._icon_texture = icon_atlas.get_texture(
+            self.text, self.font_name, self.font_size
+        )
+        if self._icon_texture:
+            self.texture = icon_atlas.blank_texture
+            self.texture_size = list(self._icon_texture.size)
+        else:
+            self.texture = None
+            self.texture_size = [0, 0]
+
     def adjust_size(self, *args) -> None:
         from eze.uix.selectioncontrol import EZECheckbox
 
@@ -0,0 +1,168 @@
+"""
+Components/Label/TextureCache
+=============================
+
+.. versionadded:: 0.1.0
+
+Shared cache of rendered text textures for :class:`~eze.uix.label.EZELabel`.
+
+Labels that render the same text with the same font, color, alignment and
+width (column headers, `'Cancel'`/`'OK'` buttons, repeated list captions)
+can share one texture instead of rasterizing their own. The cache is used
+by labels whose :attr:`~eze.uix.label.EZELabel.use_texture_cache` attribute
+is `True`:
+
+.. code-block:: kv
+
+    EZELabel:
+        text: "Cancel"
+        use_texture_cache: True
+
+Textures are reference-counted. A texture that is no longer used by any
+label stays in the cache, so it can be reused later, until the total size of
+such textures exceeds :attr:`LabelTextureCache.max_unused_bytes`; then the
+least recently used ones are dropped.
+
+.. code-block:: python
+
+    from eze.uix.label.texture_cache import label_texture_cache
+
+    print(label_texture_cache.get_stats())
+"""
+
+from __future__ import annotations
+
+__all__ = ("LabelTextureCache", "label_texture_cache")
+
+from collections import OrderedDict
+
+from kivy.core.text import Label as CoreLabel
+from kivy.graphics.texture import Texture
+
+
+class _CacheEntry:
+    __slots__ = ("texture", "core_label", "refs", "size")
+
+    def __init__(self, texture: Texture, core_label: CoreLabel):
+        self.texture = texture
+        # The core label renders the texture when it is first drawn and
+        # after the OpenGL context is lost, so it is kept with the texture.
+        self.core_label = core_label
+        self.refs = 1
+        self.size = texture.width * texture.height * 4
+
+
+class LabelTextureCache:
+    """
+    Reference-counted cache of label textures.
+
+    :param max_unused_bytes: the maximum total size of the cached textures
+                             that are not used by any label.
+    """
+
+    def __init__(self, max_unused_bytes: int = 4 * 1024 * 1024):
+        self.max_unused_bytes = max_unused_bytes
+        self._entries = {}
+        # Keys of the entries without references, least recently used first.
+        self._unused = OrderedDict()
+        self._unused_bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def acquire(self, key) -> Texture | None:
+        """
+        Returns the texture stored by `key` and adds a reference to it, or
+        `None` if there is no such texture. In the latter case, the caller
+        renders the texture and stores it with :meth:`add`.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        if not entry.refs:
+            del self._unused[key]
+            self._unused_bytes -= entry.size
+        entry.refs += 1
+        return entry.texture
+
+    def add(self, key, texture: Texture, core_label: CoreLabel) -> None:
+        """
+        Stores the `texture` rendered by `core_label` with one reference.
+        The core label must not be used to render anything else afterwards.
+        """
+
+        self.discard(key)
+        self._entries[key] = _CacheEntry(texture, core_label)
+
+    def release(self, key) -> None:
+        """Removes a reference to the texture stored by `key`."""
+
+        entry = self._entries.get(key)
+        if entry is None or not entry.refs:
+            return
+
+        entry.refs -= 1
+        if not entry.refs:
+            self._unused[key] = None
+            self._unused_bytes += entry.size
+            self._evict()
+
+    def discard(self, key) -> None:
+        """Removes the texture stored by `key` from the cache."""
+
+        entry = self._entries.pop(key, None)
+        if entry is not None and not entry.refs:
+            del self._unused[key]
+            self._unused_bytes -= entry.size
+
+    def clear(self) -> None:
+        """
+        Removes all textures from the cache and resets the statistics.
+        Labels keep the textures they already use.
+        """
+
+        self._entries.clear()
+        self._unused.clear()
+        self._unused_bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get_stats(self) -> dict:
+        """
+        Returns the cache statistics:
+
+        - `hits`, `misses` - the number of found and not found textures;
+        - `hit_rate` - the share of found textures, from 0 to 1;
+        - `textures` - the number of cached textures;
+        - `bytes` - the total size of the cached textures;
+        - `unused_bytes` - the size of the textures not used by any label;
+        - `bytes_saved` - the size of the textures that labels sharing
+          a texture would have rendered on their own.
+        """
+
+        requests = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / requests if requests else 0.0,
+            "textures": len(self._entries),
+            "bytes": sum(entry.size for entry in self._entries.values()),
+            "unused_bytes": self._unused_bytes,
+            "bytes_saved": sum(
+                entry.size * (entry.refs - 1)
+                for entry in self._entries.values()
+                if entry.refs > 1
+            ),
+        }
+
+    def _evict(self) -> None:
+        while self._unused_bytes > self.max_unused_bytes:
+            key, _ = self._unused.popitem(last=False)
+            self._unused_bytes -= self._entries.pop(key).size
+
+
+label_texture_cache = LabelTextureCache()
+"""The cache shared by all labels."""
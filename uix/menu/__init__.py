@@ -1 +1 @@
-from .menu import EZEDropdownMenu  # NOQA F401
+from .menu import EZEDropdownMenu, EZEDropdownMenuPool  # NOQA F401
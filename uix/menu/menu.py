@@ -609,6 +609,7 @@ from __future__ import annotations
 __all__ = (
     "BaseDropdownItem",
     "EZEDropdownMenu",
+    "EZEDropdownMenuPool",
     "EZEDropdownTextItem",
     "EZEDropdownLeadingIconItem",
     "EZEDropdownTrailingIconItem",
@@ -651,6 +652,39 @@ with open(
     Builder.load_string(kv_file.read())
 
 
+# Bit flags of the optional parts of a menu item.
+_LEADING_ICON = 1
+_TRAILING_ICON = 2
+_TRAILING_TEXT = 4
+
+# Menu item class names by the combination of the optional parts of an item.
+_DROPDOWN_VIEWCLASSES = {
+    0: "EZEDropdownTextItem",
+    _LEADING_ICON: "EZEDropdownLeadingIconItem",
+    _TRAILING_ICON: "EZEDropdownTrailingIconItem",
+    _TRAILING_TEXT: "EZEDropdownTrailingTextItem",
+    _TRAILING_ICON | _TRAILING_TEXT: "EZEDropdownTrailingIconTextItem",
+    _LEADING_ICON | _TRAILING_ICON: "EZEDropdownLeadingTrailingIconItem",
+    _LEADING_ICON | _TRAILING_TEXT: "EZEDropdownLeadingIconTrailingTextItem",
+    _LEADING_ICON
+    | _TRAILING_ICON
+    | _TRAILING_TEXT: "EZEDropdownLeadingTrailingIconTextItem",
+}
+
+
+def get_dropdown_viewclass(data: dict) -> str:
+    """
+    Returns the name of the menu item class for the item described by the
+    `data` dictionary.
+    """
+
+    return _DROPDOWN_VIEWCLASSES[
+        ("leading_icon" in data and _LEADING_ICON)
+        | ("trailing_icon" in data and _TRAILING_ICON)
+        | ("trailing_text" in data and _TRAILING_TEXT)
+    ]
+
+
 class EZEMenu(RecycleView):
     width_mult = NumericProperty(1)
     """
@@ -1095,6 +1129,10 @@ class EZEDropdownMenu(MotionDropDownMenuBehavior, StencilBehavior, EZECard):
     """
 
     _items = []
+    _items_height = 0
+    _items_changed = True
+    _geometry_key = None
+    _geometry = (0, 0)
     _start_coords = []
     _tar_x = 0
     _tar_y = 0
@@ -1179,9 +1217,7 @@ class EZEDropdownMenu(MotionDropDownMenuBehavior, StencilBehavior, EZECard):
         Set the target height of the menu depending on the size of each item.
         """
 
-        self.target_height = 0
-        for item in self.menu.data:
-            self.target_height += item.get("height", self.min_height)
+        self.target_height = self._items_height
 
         if 0 < self.max_height < self.target_height:
             self.target_height = self.max_height
@@ -1207,16 +1243,39 @@ class EZEDropdownMenu(MotionDropDownMenuBehavior, StencilBehavior, EZECard):
         """Sets the size and position for the menu window."""
 
         if self.caller:
-            self.menu.data = self._items
+            # Assigning the data makes the RecycleView refresh all of its
+            # views, so only do it when the items have actually changed.
+            self.prewarm()
             # We need to pick a starting point, see how big we need to be,
             # and where to grow to.
             self._start_coords = self.caller.to_window(*self.caller.center)
 
-            self.adjust_width()
-            self.set_target_height()
+            # The width and the target height only depend on the values
+            # of `_get_geometry_key`, so they are not recalculated if the
+            # menu is reopened from the same place.
+            if self._get_geometry_key() != self._geometry_key:
+                self.adjust_width()
+                self.set_target_height()
+                # The key is taken with the adjusted width, which is the
+                # width of the menu when it is reopened.
+                self._geometry_key = self._get_geometry_key()
+                self._geometry = (self.width, self.target_height)
+            else:
+                self.width, self.target_height = self._geometry
             self.check_ver_growth()
             self.check_hor_growth()
 
+    def _get_geometry_key(self) -> tuple:
+        return (
+            tuple(self._start_coords),
+            tuple(self.caller.size),
+            tuple(Window.size),
+            self.width,
+            self.max_height,
+            self.border_margin,
+            self.position,
+        )
+
     def set_menu_pos(self, *args) -> None:
         if self.position == "auto":
             self.menu.x = self._tar_x
@@ -1296,11 +1355,22 @@ class EZEDropdownMenu(MotionDropDownMenuBehavior, StencilBehavior, EZECard):
 
         return position
 
-    def open(self) -> None:
-        """Animate the opening of a menu window."""
+    def open(self, caller=None) -> None:
+        """
+        Animate the opening of a menu window.
+
+        If `caller` is passed, the menu is re-targeted to this widget before
+        opening, so one menu can be reused for several callers.
 
+        .. versionchanged:: 0.1.0
+            Added the `caller` argument.
+        """
+
+        if caller is not None:
+            self.caller = caller
         self.set_menu_properties()
-        Window.add_widget(self)
+        if not self.parent:
+            Window.add_widget(self)
         self.position = self.adjust_position()
 
         if self.width <= 100:
@@ -1314,73 +1384,40 @@ class EZEDropdownMenu(MotionDropDownMenuBehavior, StencilBehavior, EZECard):
         self.set_menu_pos()
         self.on_open()
 
+    def prewarm(self) -> None:
+        """
+        Passes the menu items to the internal `RecycleView` ahead of time,
+        so that the item views are already built when the menu is first
+        opened.
+
+        .. versionadded:: 0.1.0
+        """
+
+        if self._items_changed:
+            self.menu.data = self._items
+            self._items_changed = False
+
     def on_items(self, instance, value: list) -> None:
         """
         The method sets the class that will be used to create the menu item.
         """
 
         items = []
-        viewclass = "EZEDropdownTextItem"
+        items_height = 0
 
         for data in value:
             if "viewclass" not in data:
-                if (
-                    "leading_icon" not in data
-                    and "trailing_icon" not in data
-                    and "trailing_text" not in data
-                ):
-                    viewclass = "EZEDropdownTextItem"
-                elif (
-                    "leading_icon" in data
-                    and "trailing_icon" not in data
-                    and "trailing_text" not in data
-                ):
-                    viewclass = "EZEDropdownLeadingIconItem"
-                elif (
-                    "leading_icon" not in data
-                    and "trailing_icon" in data
-                    and "trailing_text" not in data
-                ):
-                    viewclass = "EZEDropdownTrailingIconItem"
-                elif (
-                    "leading_icon" not in data
-                    and "trailing_icon" in data
-                    and "trailing_text" in data
-                ):
-                    viewclass = "EZEDropdownTrailingIconTextItem"
-                elif (
-                    "leading_icon" in data
-                    and "trailing_icon" in data
-                    and "trailing_text" in data
-                ):
-                    viewclass = "EZEDropdownLeadingTrailingIconTextItem"
-                elif (
-                    "leading_icon" in data
-                    and "trailing_icon" in data
-                    and "trailing_text" not in data
-                ):
-                    viewclass = "EZEDropdownLeadingTrailingIconItem"
-                elif (
-                    "leading_icon" not in data
-                    and "trailing_icon" not in data
-                    and "trailing_text" in data
-                ):
-                    viewclass = "MDDropdownTrailingTextItem"
-                elif (
-                    "leading_icon" in data
-                    and "trailing_icon" not in data
-                    and "trailing_text" in data
-                ):
-                    viewclass = "EZEDropdownLeadingIconTrailingTextItem"
-
-                data["viewclass"] = viewclass
-
+                data["viewclass"] = get_dropdown_viewclass(data)
             if "height" not in data:
                 data["height"] = dp(48)
 
+            items_height += data["height"]
             items.append(data)
 
         self._items = items
+        self._items_height = items_height
+        self._items_changed = True
+        self._geometry_key = None
 
     def on_header_cls(
         self, instance_dropdown_menu, instance_user_menu_header
@@ -1417,6 +1454,107 @@ class EZEDropdownMenu(MotionDropDownMenuBehavior, StencilBehavior, EZECard):
         Window.remove_widget(self)
         self.set_scale()
 
+    def _unbind_window(self) -> None:
+        # Called when the menu is discarded by `EZEDropdownMenuPool`.
+        Window.unbind(
+            on_resize=self._remove_menu,
+            on_maximize=self._remove_menu,
+            on_restore=self._remove_menu,
+        )
+
+
+class EZEDropdownMenuPool:
+    """
+    Keeps built dropdown menus so that they can be reopened for any caller
+    without rebuilding their item views.
+
+    .. versionadded:: 0.1.0
+
+    Menus are stored by a user-defined key, for example the name of the form
+    field or the kind of values the menu offers:
+
+    .. code-block:: python
+
+        menu_pool = EZEDropdownMenuPool()
+        menu_pool.prewarm("currency", items=currency_items, width=dp(240))
+
+        ...
+
+        def open_currency_menu(self, caller):
+            menu_pool.open("currency", caller)
+
+    :param menu_cls: the class of the menus created by the pool;
+    :param max_menus: the maximum number of stored menus, the least recently
+                      used menu is discarded when it is exceeded;
+                      `0` for no limit;
+    """
+
+    def __init__(self, menu_cls=EZEDropdownMenu, max_menus: int = 0):
+        self.menu_cls = menu_cls
+        self.max_menus = max_menus
+        self._menus = {}
+
+    def __contains__(self, key) -> bool:
+        return key in self._menus
+
+    def __len__(self) -> int:
+        return len(self._menus)
+
+    def get(self, key, **kwargs) -> EZEDropdownMenu:
+        """
+        Returns the menu stored by `key`, creating it with the `kwargs`
+        properties if there is no such menu yet. The properties of an
+        existing menu are updated with `kwargs`.
+        """
+
+        menu = self._menus.pop(key, None)
+        if menu is None:
+            menu = self.menu_cls(**kwargs)
+        else:
+            for name, value in kwargs.items():
+                setattr(menu, name, value)
+        self._menus[key] = menu
+
+        if self.max_menus and len(self._menus) > self.max_menus:
+            self.discard(next(iter(self._menus)))
+        return menu
+
+    def prewarm(self, key, **kwargs) -> EZEDropdownMenu:
+        """
+        Creates the menu stored by `key` and builds its item views ahead of
+        time. See :meth:`get` for the `kwargs` argument.
+        """
+
+        menu = self.get(key, **kwargs)
+        menu.prewarm()
+        return menu
+
+    def open(self, key, caller, **kwargs) -> EZEDropdownMenu:
+        """
+        Opens the menu stored by `key` for the `caller` widget.
+        See :meth:`get` for the `kwargs` argument.
+        """
+
+        menu = self.get(key, **kwargs)
+        menu.open(caller)
+        return menu
+
+    def discard(self, key) -> None:
+        """Removes the menu stored by `key` from the pool."""
+
+        menu = self._menus.pop(key, None)
+        if menu is None:
+            return
+        if menu.parent:
+            menu._remove_menu()
+        menu._unbind_window()
+
+    def clear(self) -> None:
+        """Removes all menus from the pool."""
+
+        for key in list(self._menus):
+            self.discard(key)
+
 
 if __name__ == "__main__":
     # To test the correct menu position.
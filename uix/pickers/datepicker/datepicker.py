@@ -242,6 +242,19 @@ with open(
 ) as kv_file:
     Builder.load_string(kv_file.read())
 
+# Properties of `DatePickerDaySelectableItem` set by
+# `EZEDatePicker.update_calendar`, in the order of the cell states.
+_DAY_ITEM_PROPERTIES = (
+    "text",
+    "disabled",
+    "is_today",
+    "is_selected",
+    "is_in_range",
+    "is_range_start",
+    "is_range_end",
+    "is_month_end",
+)
+
 
 class BaseDialogPicker(
     BaseDialog,
@@ -917,6 +930,8 @@ class EZEDatePicker(BaseDialogPicker):
 
     _calendar_layout = ObjectProperty()
     _calendar_list = None
+    # Last states of the `_calendar_list` widgets, see `_DAY_ITEM_PROPERTIES`.
+    _calendar_states = None
     _fields_container = None
     _scale_calendar_layout = NumericProperty(1)
     _scale_year_layout = NumericProperty(0)
@@ -1200,37 +1215,50 @@ class EZEDatePicker(BaseDialogPicker):
         self._update_date_label_text()
         month_end = date(year, month, calendar.monthrange(year, month)[1])
         dates = self.calendar.itermonthdates(year, month)
-        for widget, widget_date in zip_longest(self._calendar_list, dates):
+        min_date, max_date = self.min_date, self.max_date
+        calendar_states = self._calendar_states
+        for index, (widget, widget_date) in enumerate(
+            zip_longest(self._calendar_list, dates)
+        ):
             # Only widgets whose dates are in the displayed month are visible.
             visible = (
                 widget_date is not None
                 and widget_date.month == month
                 and widget_date.year == year
             )
-            widget.text = str(widget_date.day) if visible else ""
-            widget.is_today = visible and widget_date == self.today
-            widget.is_selected = visible and widget_date in selected_dates
-            # I don't understand why, but this line is important. Without this
-            # line, some widgets that we are trying to disable remain enabled.
-            widget.disabled = False
-            widget.disabled = not visible
-            widget.is_in_range = (
-                visible
-                and self.min_date is not None
-                and self.max_date is not None
-                and self.min_date <= widget_date <= self.max_date
-            )
-            widget.is_range_start = (
+            state = (
+                str(widget_date.day) if visible else "",
+                not visible,
+                visible and widget_date == self.today,
+                visible and widget_date in selected_dates,
                 visible
-                and self.min_date is not None
-                and widget_date == self.min_date
+                and min_date is not None
+                and max_date is not None
+                and min_date <= widget_date <= max_date,
+                visible and min_date is not None and widget_date == min_date,
+                visible and max_date is not None and widget_date == max_date,
+                widget_date == month_end,
             )
-            widget.is_range_end = (
-                visible
-                and self.max_date is not None
-                and widget_date == self.max_date
-            )
-            widget.is_month_end = widget_date == month_end
+            # Only the properties of the changed cells are set, so that
+            # switching months does not update the canvas and KV rules of
+            # all 42 cells.
+            previous_state = calendar_states[index]
+            if state == previous_state:
+                continue
+            calendar_states[index] = state
+            for name, value, previous_value in zip(
+                _DAY_ITEM_PROPERTIES,
+                state,
+                previous_state or (None,) * len(_DAY_ITEM_PROPERTIES),
+            ):
+                if value == previous_value:
+                    continue
+                if name == "disabled":
+                    # I don't understand why, but this line is important.
+                    # Without this line, some widgets that we are trying to
+                    # disable remain enabled.
+                    widget.disabled = False
+                setattr(widget, name, value)
 
     def get_field(self, date=None) -> EZETextField:
         """Creates and returns a text field object used to enter dates."""
@@ -1398,16 +1426,17 @@ class EZEDatePicker(BaseDialogPicker):
         year_layout.scroll_y = min(1, max(0, scroll_y))
 
     def generate_list_widgets_years(self) -> None:
-        self.ids._year_layout.data = []
-        for i, number_year in enumerate(range(self.min_year, self.max_year)):
-            self.ids._year_layout.data.append(
-                {
-                    "owner": self,
-                    "text": str(number_year),
-                    "index": i,
-                    "viewclass": "DatePickerYearSelectableItem",
-                }
-            )
+        # The list is assigned at once, appending to the `data` refreshes
+        # the RecycleView on every item.
+        self.ids._year_layout.data = [
+            {
+                "owner": self,
+                "text": str(number_year),
+                "index": i,
+                "viewclass": "DatePickerYearSelectableItem",
+            }
+            for i, number_year in enumerate(range(self.min_year, self.max_year))
+        ]
 
     def generate_list_widgets_days(self) -> None:
         calendar_list = []
@@ -1428,6 +1457,7 @@ class EZEDatePicker(BaseDialogPicker):
             calendar_list.append(day_selectable_item)
             self._calendar_layout.add_widget(day_selectable_item)
         self._calendar_list = calendar_list
+        self._calendar_states = [None] * len(calendar_list)
 
     def change_month(self, operation: str) -> None:
         """
@@ -239,7 +239,9 @@ class TimeInputTextField(EZETextField):
 
     def validate_time(self, text) -> Union[None, re.Match]:
         reg = self.hour_regx if self.num_type == "hour" else self.minute_regx
-        return re.match(reg, text)
+        # `re` caches the compiled strings and returns compiled patterns
+        # as they are.
+        return re.compile(reg).match(text)
 
     def insert_text(self, text, from_undo=False):
         strip_text = self.text.strip()
@@ -150,6 +150,7 @@ from kivy.properties import (
 from kivy.uix.progressbar import ProgressBar
 
 from eze import uix_path
+from eze.animation import EZEAnimation
 from eze.theming import ThemableBehavior
 
 with open(
@@ -303,14 +304,14 @@ class EZEProgressBar(ThemableBehavior, ProgressBar):
         self.catching_anim.start(self)
 
     def _create_determinate_animations(self):
-        self.running_anim = Animation(
+        self.running_anim = EZEAnimation(
             value=100,
             opacity=1,
             t=self.running_transition,
             d=self.running_duration,
         )
         self.running_anim.bind(on_complete=self.catching_up)
-        self.catching_anim = Animation(
+        self.catching_anim = EZEAnimation(
             opacity=0,
             t=self.catching_transition,
             d=self.catching_duration,
@@ -318,14 +319,14 @@ class EZEProgressBar(ThemableBehavior, ProgressBar):
         self.catching_anim.bind(on_complete=self.running_away)
 
     def _create_indeterminate_animations(self):
-        self.running_anim = Animation(
+        self.running_anim = EZEAnimation(
             _x=self.width / 2,
             value=50,
             t=self.running_transition,
             d=self.running_duration,
         )
         self.running_anim.bind(on_complete=self.catching_up)
-        self.catching_anim = Animation(
+        self.catching_anim = EZEAnimation(
             value=0, t=self.catching_transition, d=self.catching_duration
         )
         self.catching_anim.bind(on_complete=self.running_away)
@@ -81,3 +81,22 @@ class MDScreen(DeclarativeBehavior, ThemableBehavior, Screen, EZEAdaptiveWidget)
                 f"class or inherited from this class"
             )
         self.heroes_to = [widget]
+
+    def save_state(self):
+        """
+        Returns the state of the screen that is passed to
+        :meth:`restore_state` when the screen is created again after it has
+        been removed by the :class:`~eze.uix.screenmanager.EZEScreenManager`,
+        see :meth:`~eze.uix.screenmanager.EZEScreenManager.register_screen`.
+        `None` if nothing should be saved.
+
+        .. versionadded:: 0.1.0
+        """
+
+    def restore_state(self, state) -> None:
+        """
+        Restores the `state` returned by :meth:`save_state` of the removed
+        screen.
+
+        .. versionadded:: 0.1.0
+        """
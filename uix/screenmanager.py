@@ -22,15 +22,42 @@ transitions:
 You need to use the :class:`~eze.uix.screenmanager.EZEScreenManager` class
 when you want to use hero animations on your screens. If you don't need hero
 animation use the :class:`~kivy.uix.screenmanager.ScreenManager` class.
+
+Lazy screens
+------------
+
+.. versionadded:: 0.1.0
+
+Screens can be registered as factories with
+:meth:`~EZEScreenManager.register_screen`. A registered screen is created
+when it becomes the current screen for the first time:
+
+.. code-block:: python
+
+    screen_manager = EZEScreenManager(max_screens=5)
+    screen_manager.register_screen("settings", lambda name: SettingsScreen())
+    ...
+    screen_manager.current = "settings"
+
+When more than :attr:`~EZEScreenManager.max_screens` registered screens are
+created, or when the operating system reports low memory, the least
+recently shown registered screens are removed; they are created again
+when they are shown. Before a screen is removed, the value returned by its
+`save_state()` method, if it has one, is kept and passed to the
+`restore_state(state)` method of the new screen, see
+:meth:`~eze.uix.screen.MDScreen.save_state`.
 """
 
+from collections import OrderedDict
+
 from kivy import Logger
 from kivy.clock import Clock
-from kivy.properties import ListProperty, StringProperty
-from kivy.uix.screenmanager import ScreenManager
+from kivy.core.window import Window
+from kivy.properties import ListProperty, NumericProperty, StringProperty
+from kivy.uix.screenmanager import Screen, ScreenManager
 
 from eze.uix.behaviors import DeclarativeBehavior
-from eze.uix.hero import EZEHeroFrom
+from eze.uix.hero import get_heroes_from
 
 
 class EZEScreenManager(DeclarativeBehavior, ScreenManager):
@@ -71,13 +98,118 @@ class EZEScreenManager(DeclarativeBehavior, ScreenManager):
     and defaults to `[]`.
     """
 
-    # Collection of `EZEHeroFrom` objects on all screens of the current
-    # screen manager.
-    _heroes_data = ListProperty()
+    max_screens = NumericProperty(0)
+    """
+    The maximum number of created screens registered with
+    :meth:`register_screen`. When it is exceeded, the least recently shown
+    of them are removed. `0` for no limit.
+
+    .. versionadded:: 0.1.0
+
+    :attr:`max_screens` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `0`.
+    """
 
     def __init__(self, *args, **kwargs):
+        # Name -> factory of the registered screens.
+        self._screen_factories = {}
+        # Names of the created registered screens, the least recently shown
+        # first.
+        self._created_screens = OrderedDict()
+        # Name -> state saved by the removed registered screens.
+        self._screen_states = {}
         super().__init__(*args, **kwargs)
         Clock.schedule_once(self.check_transition)
+        self.fbind("current", self._on_current_screen)
+        self.fbind("max_screens", self._evict_screens)
+        if Window.is_event_type("on_memorywarning"):
+            # `bind` keeps a weak reference to the method, so the Window
+            # does not keep the manager alive.
+            Window.bind(on_memorywarning=self.evict_screens)
+
+    def register_screen(self, name: str, factory) -> None:
+        """
+        Registers the `factory` of the screen with the `name`. The screen is
+        created with `factory(name)` when it becomes the current screen.
+
+        .. versionadded:: 0.1.0
+        """
+
+        self._screen_factories[name] = factory
+
+    def unregister_screen(self, name: str) -> None:
+        """
+        Removes the factory of the screen with the `name`. The created
+        screen is kept.
+
+        .. versionadded:: 0.1.0
+        """
+
+        self._screen_factories.pop(name, None)
+        self._created_screens.pop(name, None)
+        self._screen_states.pop(name, None)
+
+    def get_screen(self, name: str):
+        # Registered screens are created on demand, `has_screen` returns
+        # `True` only for the created ones.
+        if name in self._screen_factories and not super().has_screen(name):
+            self._create_screen(name)
+        return super().get_screen(name)
+
+    def evict_screens(self, *args) -> None:
+        """
+        Removes all created registered screens except the current screen
+        and the screens of the running transition.
+
+        .. versionadded:: 0.1.0
+        """
+
+        for name in list(self._created_screens):
+            self._evict_screen(name)
+
+    def _create_screen(self, name: str) -> None:
+        screen = self._screen_factories[name](name)
+        screen.name = name
+        state = self._screen_states.pop(name, None)
+        if state is not None and hasattr(screen, "restore_state"):
+            screen.restore_state(state)
+        self._created_screens[name] = None
+        self.add_widget(screen)
+
+    def _on_current_screen(self, instance, name: str) -> None:
+        if name in self._created_screens:
+            self._created_screens.move_to_end(name)
+            self._evict_screens()
+
+    def _evict_screens(self, *args) -> None:
+        if not self.max_screens:
+            return
+        for name in list(self._created_screens):
+            if len(self._created_screens) <= self.max_screens:
+                break
+            self._evict_screen(name)
+
+    def _evict_screen(self, name: str) -> None:
+        screen = super().get_screen(name)
+        transition = self.transition
+        # The screens shown by a running transition are not removed, nor
+        # the screen being switched to, when `current` is changed during
+        # a transition and stopping it evicts the screens.
+        if (
+            screen is self.current_screen
+            or name == self.current
+            or (
+                transition.is_active
+                and screen in (transition.screen_in, transition.screen_out)
+            )
+        ):
+            return
+        if hasattr(screen, "save_state"):
+            state = screen.save_state()
+            if state is not None:
+                self._screen_states[name] = state
+        del self._created_screens[name]
+        self.remove_widget(screen)
 
     def check_transition(self, *args) -> None:
         """Sets the default type transition."""
@@ -98,12 +230,9 @@ class EZEScreenManager(DeclarativeBehavior, ScreenManager):
         hero_from_widget = []
 
         for name_hero in self.current_heroes:
-            for hero_widget in self._heroes_data:
-                if isinstance(hero_widget, EZEHeroFrom) or issubclass(
-                    hero_widget.__class__, EZEHeroFrom
-                ):
-                    if hero_widget.tag == name_hero:
-                        hero_from_widget.append(hero_widget)
+            for hero_widget in get_heroes_from(name_hero):
+                if self._is_own_hero(hero_widget):
+                    hero_from_widget.append(hero_widget)
 
         return hero_from_widget
 
@@ -124,30 +253,22 @@ class EZEScreenManager(DeclarativeBehavior, ScreenManager):
         else:
             self.current_heroes = []
 
-    def add_widget(self, widget, *args, **kwargs):
-        super().add_widget(widget, *args, **kwargs)
-        Clock.schedule_once(lambda x: self._create_heroes_data(widget))
-
-    # TODO: Add a method to delete an object from the arrt:`_heroes_data`
-    #  collection when deleting an object using the `remove_widget` method.
-
-    def _create_heroes_data(self, widget):
-        def find_hero_widget(child_widget):
-            widget_hero = None
-
-            for w in child_widget.children:
-                if isinstance(w, EZEHeroFrom) or issubclass(
-                    w.__class__, EZEHeroFrom
-                ):
-                    self._heroes_data.append(w)
-                find_hero_widget(w)
-
-            return widget_hero
-
-        for child in widget.children:
-            if isinstance(child, EZEHeroFrom) or issubclass(
-                child.__class__, EZEHeroFrom
+    def remove_widget(self, widget, *args, **kwargs):
+        super().remove_widget(widget, *args, **kwargs)
+        name = getattr(widget, "name", None)
+        if name in self._created_screens:
+            del self._created_screens[name]
+
+    def _is_own_hero(self, hero) -> bool:
+        # The heroes of the removed screens, e.g. the evicted ones, are
+        # not animated. The screens of a transition are out of the widget
+        # tree of the manager before they are added and after they are
+        # hidden, but still belong to it.
+        parent = hero.parent
+        while parent is not None:
+            if parent is self or (
+                isinstance(parent, Screen) and parent.manager is self
             ):
-                self._heroes_data.append(child)
-            else:
-                find_hero_widget(child)
+                return True
+            parent = parent.parent
+        return False
@@ -125,6 +125,7 @@ from kivy.properties import (
 from kivy.uix.widget import Widget
 
 from eze import uix_path
+from eze.animation import EZEAnimation
 from eze.theming import ThemableBehavior
 
 with open(
@@ -215,8 +216,12 @@ class EZESpinner(ThemableBehavior, Widget):
         if self.color == self.theme_cls.primary_color:
             self.theme_cls.bind(primary_color=self._update_color)
 
-        self._alpha_anim_in = Animation(_alpha=1, duration=0.8, t="out_quad")
-        self._alpha_anim_out = Animation(_alpha=0, duration=0.3, t="out_quad")
+        self._alpha_anim_in = EZEAnimation(
+            _alpha=1, duration=0.8, t="out_quad"
+        )
+        self._alpha_anim_out = EZEAnimation(
+            _alpha=0, duration=0.3, t="out_quad"
+        )
         self._alpha_anim_out.bind(
             on_complete=self._reset,
             on_progress=self._on_determinate_progress,
@@ -228,15 +233,19 @@ class EZESpinner(ThemableBehavior, Widget):
         if self._rotation_angle == 0:
             self._rotation_angle = 360
             if not self.determinate:
-                _rot_anim = Animation(_rotation_angle=0, duration=2)
+                _rot_anim = EZEAnimation(_rotation_angle=0, duration=2)
                 _rot_anim.start(self)
         elif self._rotation_angle == 360:
             if self._palette:
                 try:
-                    Animation(color=next(self._palette), duration=2).start(self)
+                    EZEAnimation(
+                        color=next(self._palette), duration=2
+                    ).start(self)
                 except StopIteration:
                     self._palette = iter(self.palette)
-                    Animation(color=next(self._palette), duration=2).start(self)
+                    EZEAnimation(
+                        color=next(self._palette), duration=2
+                    ).start(self)
 
     def on_palette(self, instance_spinner, palette_list: list) -> None:
         self._palette = iter(palette_list)
@@ -264,13 +273,13 @@ class EZESpinner(ThemableBehavior, Widget):
 
     def _start_determinate(self, *args):
         self._alpha_anim_in.start(self)
-        Animation(
+        EZEAnimation(
             _rotation_angle=0,
             duration=self.determinate_time * 0.7,
             t="out_quad",
         ).start(self)
 
-        _angle_start_anim = Animation(
+        _angle_start_anim = EZEAnimation(
             _angle_end=360, duration=self.determinate_time, t="in_out_quad"
         )
         _angle_start_anim.bind(
@@ -281,19 +290,19 @@ class EZESpinner(ThemableBehavior, Widget):
 
     def _start_loop(self, *args):
         if self._alpha == 0:
-            _rot_anim = Animation(_rotation_angle=0, duration=2, t="linear")
+            _rot_anim = EZEAnimation(_rotation_angle=0, duration=2, t="linear")
             _rot_anim.start(self)
 
         self._alpha = 1
         self._alpha_anim_in.start(self)
-        _angle_start_anim = Animation(
+        _angle_start_anim = EZEAnimation(
             _angle_end=self._angle_end + 270, duration=0.6, t="in_out_cubic"
         )
         _angle_start_anim.bind(on_complete=self._anim_back)
         _angle_start_anim.start(self)
 
     def _anim_back(self, *args):
-        _angle_back_anim = Animation(
+        _angle_back_anim = EZEAnimation(
             _angle_start=self._angle_end - 8, duration=0.6, t="in_out_cubic"
         )
         _angle_back_anim.bind(on_complete=self._start_loop)
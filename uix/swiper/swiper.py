@@ -193,6 +193,34 @@ Example
     EZERaisedButton:
         text: "Go to Second"
         on_release: swiper.set_current(1)
+
+Data-driven swiper
+==================
+
+.. versionadded:: 0.1.0
+
+For feeds with hundreds of items, set :attr:`~EZESwiper.viewclass` and
+:attr:`~EZESwiper.data` instead of adding the items as children. Only the
+current item and :attr:`~EZESwiper.live_items` items on each side of it
+are created as widgets; the items leaving this range are reused for the
+items entering it, and the attributes of each item are set from its
+`data` dictionary, like in :class:`~kivy.uix.recycleview.RecycleView`.
+
+.. code-block:: kv
+
+    <CardItem@EZESwiperItem>
+        source: ""
+
+        FitImage:
+            source: root.source
+            radius: [20,]
+
+    EZESwiper:
+        viewclass: "CardItem"
+        data: [{"source": f"card_{i}.png"} for i in range(500)]
+
+:meth:`~EZESwiper.get_items` and :meth:`~EZESwiper.get_current_item`
+return the live items only.
 """
 
 __all__ = ("EZESwiperItem", "EZESwiper")
@@ -203,14 +231,17 @@ from kivy.animation import Animation
 from kivy.clock import Clock
 from kivy.core.window import Window
 from kivy.effects.dampedscroll import DampedScrollEffect
+from kivy.factory import Factory
 from kivy.lang.builder import Builder
 from kivy.properties import (
     BooleanProperty,
+    ListProperty,
     NumericProperty,
     ObjectProperty,
     StringProperty,
 )
 from kivy.uix.anchorlayout import AnchorLayout
+from kivy.uix.widget import Widget
 from kivy.utils import platform
 
 from eze import uix_path
@@ -229,23 +260,11 @@ class _ScrollViewHardStop(DampedScrollEffect):
 
 
 class _ItemsBox(AnchorLayout):
+    # Sized by the swiper.
     _root = ObjectProperty()
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        Clock.schedule_once(self._update)
-        Window.bind(on_resize=self._set_size)
-
-    def _update(self, *args):
-        self._set_size()
-
     def _set_size(self, *args):
-        window_size = Window.size
-        self.size = [
-            window_size[0]
-            - self._root.items_spacing * self._root.width_mult * 2,
-            self._root.height,
-        ]
+        self.size = [self._root._get_box_width(), self._root.height]
 
 
 class EZESwiperItem(EZEBoxLayout):
@@ -259,37 +278,37 @@ class EZESwiperItem(EZEBoxLayout):
     _root = ObjectProperty()
     _selected = False
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        Clock.schedule_once(self._set_size)
-        Window.bind(on_resize=self._set_size)
-
     def _set_size(self, *args):
-        Clock.schedule_once(lambda x: self._root._reset_size())
+        # Sized by the swiper, which handles the window resizes of all its
+        # items at once.
         if self._selected:
             self._selected_size()
         else:
             self._dismiss_size()
 
-    def _selected_size(self):
-        size = [
+    def _get_selected_size(self) -> list:
+        return [self._root._get_box_width(), self._root.height]
+
+    def _get_dismiss_size(self) -> list:
+        return [
             Window.size[0]
-            - self._root.items_spacing * self._root.width_mult * 2,
-            self._root.height,
+            - self._root.items_spacing * (1 + self._root.width_mult) * 2,
+            self._root.height - self._root.items_spacing * 2,
         ]
+
+    def _selected_size(self):
         anim = Animation(
-            size=size, d=self._root.size_duration, t=self._root.size_transition
+            size=self._get_selected_size(),
+            d=self._root.size_duration,
+            t=self._root.size_transition,
         )
         anim.start(self)
 
     def _dismiss_size(self):
-        size = [
-            Window.size[0]
-            - self._root.items_spacing * (1 + self._root.width_mult) * 2,
-            self._root.height - self._root.items_spacing * 2,
-        ]
         anim = Animation(
-            size=size, d=self._root.size_duration, t=self._root.size_transition
+            size=self._get_dismiss_size(),
+            d=self._root.size_duration,
+            t=self._root.size_transition,
         )
         anim.start(self)
 
@@ -369,6 +388,40 @@ class EZESwiper(EZEScrollView):
     and defaults to `True`.
     """
 
+    viewclass = ObjectProperty(None)
+    """
+    The class of the items created from :attr:`data`, a subclass of
+    :class:`EZESwiperItem` or its name in the :class:`~kivy.factory.Factory`.
+    When set, the children of the swiper are not used as items.
+
+    .. versionadded:: 0.1.0
+
+    :attr:`viewclass` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to `None`.
+    """
+
+    data = ListProperty()
+    """
+    The attributes of the items, one dictionary per item. Used with
+    :attr:`viewclass`.
+
+    .. versionadded:: 0.1.0
+
+    :attr:`data` is an :class:`~kivy.properties.ListProperty`
+    and defaults to `[]`.
+    """
+
+    live_items = NumericProperty(1)
+    """
+    The number of items on each side of the current item that are kept as
+    widgets when :attr:`viewclass` is set.
+
+    .. versionadded:: 0.1.0
+
+    :attr:`live_items` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `1`.
+    """
+
     _selected = 0
     _start_touch_x = None
 
@@ -391,13 +444,38 @@ class EZESwiper(EZEScrollView):
         self.register_event_type("on_swipe_right")
 
         self.effect_cls = _ScrollViewHardStop
+        # Boxes of the child items in the order of the items.
+        self._item_boxes = []
+        # Index -> box of the live items created from `data`.
+        self._live_boxes = {}
+        # Boxes of the `viewclass` items ready to be reused.
+        self._box_pool = []
+        self._data_changed = False
+        self._leading_spacer = Widget(size_hint_x=None)
+        self._trailing_spacer = Widget(size_hint_x=None)
+        self._trigger_update_size = Clock.create_trigger(self._update_size)
+        self._trigger_refresh_data = Clock.create_trigger(self._refresh_data)
+        self.fbind("height", self._trigger_update_size)
+        self.fbind("data", self._on_data_changed)
+        self.fbind("viewclass", self._on_viewclass_changed)
+        self.fbind("live_items", self._trigger_refresh_data)
+        self.fbind("parent", self._on_parent)
+
+    def _on_parent(self, instance_swiper, parent) -> None:
+        # The Window keeps the bound triggers, so bind only while attached.
+        Window.funbind("on_resize", self._trigger_update_size)
+        if parent is not None:
+            Window.fbind("on_resize", self._trigger_update_size)
+            self._trigger_update_size()
 
     def add_widget(self, widget, index=0):
         if issubclass(widget.__class__, EZESwiperItem):
             widget._root = self
             items_box = _ItemsBox(_root=self)
             items_box.add_widget(widget)
+            self._item_boxes.append(items_box)
             self.ids.anchor_scroll.add_widget(items_box)
+            self._trigger_update_size()
             return
         else:
             return super().add_widget(widget, index=index)
@@ -406,8 +484,9 @@ class EZESwiper(EZEScrollView):
         if not issubclass(widget.__class__, EZESwiperItem):
             return
 
-        for item_box in self.ids.anchor_scroll.children:
+        for item_box in self._item_boxes:
             if widget in item_box.children:
+                self._item_boxes.remove(item_box)
                 return self.ids.anchor_scroll.remove_widget(item_box)
 
     def set_current(self, index):
@@ -415,6 +494,8 @@ class EZESwiper(EZEScrollView):
 
         self._selected = index
         self.dispatch("on_pre_swipe")
+        if self.viewclass:
+            self._update_live_items()
         self._reset_size()
         self.dispatch("on_swipe")
 
@@ -426,9 +507,7 @@ class EZESwiper(EZEScrollView):
     def get_current_item(self):
         """Returns the current :class:`EZESwiperItem` instance."""
 
-        return list(reversed(self.ids.anchor_scroll.children))[
-            self._selected
-        ].children[0]
+        return self._get_item_box(self._selected).children[0]
 
     def get_items(self):
         """Returns the list of :class:`EZESwiperItem` children.
@@ -438,44 +517,182 @@ class EZESwiper(EZEScrollView):
             Use `get_items()` to get the list of children instead of
             `EZESwiper.children`.
 
+        .. versionchanged:: 0.1.0
+            With :attr:`viewclass`, returns the live items in the order
+            of :attr:`data`.
         """
 
-        children = list(reversed(self.ids.anchor_scroll.children))
-        items = [item.children[0] for item in children]
-        return items
+        return [box.children[0] for box in self._get_live_boxes()]
+
+    def get_items_count(self) -> int:
+        """
+        Returns the number of items, including the items of :attr:`data`
+        that are not created as widgets.
+
+        .. versionadded:: 0.1.0
+        """
+
+        if self.viewclass:
+            return len(self.data)
+        return len(self._item_boxes)
+
+    def _get_item_box(self, index: int) -> _ItemsBox:
+        if self.viewclass:
+            return self._live_boxes[index]
+        return self._item_boxes[index]
+
+    def _get_live_boxes(self) -> list:
+        if self.viewclass:
+            live_boxes = self._live_boxes
+            return [live_boxes[index] for index in sorted(live_boxes)]
+        return self._item_boxes
+
+    def _get_box_width(self) -> float:
+        return Window.size[0] - self.items_spacing * self.width_mult * 2
+
+    def _update_size(self, *args):
+        # The only handler of the window resizes for the swiper and all
+        # its items.
+        for box in self._get_live_boxes():
+            box._set_size()
+            box.children[0]._set_size()
+        self._update_spacers()
+        self._reset_size()
 
     def _reset_size(self, *args):
-        children = list(reversed(self.ids.anchor_scroll.children))
-        if not children:
+        count = self.get_items_count()
+        if not count or not self._get_live_boxes():
             return
 
-        child = children[self._selected]
-        total_width = self.ids.anchor_scroll.width - Window.width
+        # All boxes have the same width, so the position of the item does
+        # not depend on the layout of the boxes, which may not have been
+        # updated yet.
+        box_width = self._get_box_width()
+        child_x = self.items_spacing + box_width * self._selected
+        total_width = self.items_spacing * 2 + box_width * count - Window.width
 
         if self.get_current_index() == 0:
-            view_x = child.x - self.items_spacing
-        elif self.get_current_index() == len(children) - 1:
+            view_x = child_x - self.items_spacing
+        elif self.get_current_index() == count - 1:
             view_x = (
-                child.x
+                child_x
                 - self.items_spacing * self.width_mult
                 - self.items_spacing * 2
             )
         else:
-            view_x = child.x - self.items_spacing * self.width_mult
+            view_x = child_x - self.items_spacing * self.width_mult
 
-        anim = Animation(
-            scroll_x=view_x / total_width,
-            d=self.transition_duration,
-            t=self.swipe_transition,
-        )
-        anim.start(self)
+        if total_width > 0:
+            anim = Animation(
+                scroll_x=view_x / total_width,
+                d=self.transition_duration,
+                t=self.swipe_transition,
+            )
+            anim.start(self)
+
+        # Only the items changing their state are resized.
+        current_item = self.get_current_item()
+        for widget in self._get_live_boxes():
+            item = widget.children[0]
+            if item._selected and item is not current_item:
+                item._dismiss_size()
+                item._selected = False
+
+        if not current_item._selected:
+            current_item._selected_size()
+            current_item._selected = True
+
+    def _on_data_changed(self, *args):
+        self._data_changed = True
+        self._trigger_refresh_data()
+
+    def _on_viewclass_changed(self, *args):
+        for box in self._live_boxes.values():
+            self.ids.anchor_scroll.remove_widget(box)
+        self._live_boxes = {}
+        self._box_pool = []
+        self._on_data_changed()
+
+    def _refresh_data(self, *args):
+        if not self.viewclass:
+            return
 
-        for widget in children:
-            widget.children[0]._dismiss_size()
-            widget.children[0]._selected = False
+        count = len(self.data)
+        self._selected = max(0, min(self._selected, count - 1))
+        self._update_live_items()
+        if count:
+            self._reset_size()
 
-        child.children[0]._selected_size()
-        child.children[0]._selected = True
+    def _update_live_items(self):
+        # Keeps the boxes of the current item and `live_items` items on
+        # each side of it, the others are reused for the new indices.
+        count = len(self.data)
+        start = max(0, self._selected - int(self.live_items))
+        stop = min(count, self._selected + int(self.live_items) + 1)
+        data_changed, self._data_changed = self._data_changed, False
+
+        live_boxes = {}
+        for index, box in self._live_boxes.items():
+            if start <= index < stop:
+                live_boxes[index] = box
+            else:
+                self._release_box(box)
+        for index in range(start, stop):
+            box = live_boxes.get(index)
+            if box is None:
+                box = live_boxes[index] = self._acquire_box()
+            elif not data_changed:
+                continue
+            item = box.children[0]
+            for key, value in self.data[index].items():
+                setattr(item, key, value)
+
+        if live_boxes.keys() != self._live_boxes.keys():
+            self._live_boxes = live_boxes
+            anchor_scroll = self.ids.anchor_scroll
+            anchor_scroll.clear_widgets()
+            anchor_scroll.add_widget(self._leading_spacer)
+            for index in range(start, stop):
+                anchor_scroll.add_widget(live_boxes[index])
+            anchor_scroll.add_widget(self._trailing_spacer)
+        self._update_spacers()
+
+    def _update_spacers(self):
+        # The spacers take the place of the items that are not created,
+        # so the scroll position of the live items does not change.
+        if not self.viewclass:
+            return
+        box_width = self._get_box_width()
+        indices = self._live_boxes.keys()
+        start = min(indices, default=0)
+        stop = max(indices, default=-1) + 1
+        self._leading_spacer.width = box_width * start
+        self._trailing_spacer.width = box_width * (len(self.data) - stop)
+
+    def _acquire_box(self) -> _ItemsBox:
+        if self._box_pool:
+            box = self._box_pool.pop()
+            item = box.children[0]
+        else:
+            viewclass = self.viewclass
+            if isinstance(viewclass, str):
+                viewclass = Factory.get(viewclass)
+            item = viewclass()
+            item._root = self
+            box = _ItemsBox(_root=self)
+            box.add_widget(item)
+        # The window may have been resized while the box was in the pool.
+        box._set_size()
+        item.size = item._get_dismiss_size()
+        return box
+
+    def _release_box(self, box: _ItemsBox):
+        item = box.children[0]
+        if item._selected:
+            Animation.cancel_all(item, "size")
+            item.size = item._get_dismiss_size()
+            item._selected = False
+        self._box_pool.append(box)
 
     def on_swipe(self):
         pass
@@ -506,7 +723,7 @@ class EZESwiper(EZEScrollView):
 
     def swipe_right(self):
         next_index = self._selected + 1
-        last_index = len(self.ids.anchor_scroll.children) - 1
+        last_index = self.get_items_count() - 1
         if next_index == last_index + 1:
             self.set_current(last_index)
             self.dispatch("on_overswipe_right")
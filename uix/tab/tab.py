@@ -918,6 +918,27 @@ Switching the tab by name
 
 .. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/switching-tab-by-name.gif
     :align: center
+
+Lazy tabs
+---------
+
+With many tabs, creating the content of all of them at startup is slow.
+Set the :attr:`~EZETabsBase.content_factory` of the tabs and enable
+:attr:`~EZETabs.lazy_tabs`: the content of a tab is created when the tab is
+shown or becomes adjacent to the current tab. With
+:attr:`~EZETabs.unload_distance`, the content of the distant tabs is
+removed; the scroll positions are saved and restored when it is created
+again, see :meth:`~EZETabsBase.save_content_state`.
+
+.. code-block:: kv
+
+    EZETabs:
+        lazy_tabs: True
+        unload_distance: 3
+
+        Tab:
+            title: "USD"
+            content_factory: lambda tab: Factory.RatesList(currency="USD")
 """
 
 __all__ = ("EZETabs", "EZETabsBase")
@@ -1096,6 +1117,50 @@ class EZETabsBase:
     and defaults to `None`.
     """
 
+    content_factory = ObjectProperty(None, allownone=True)
+    """
+    Callable that creates the content of the tab. It is called as
+    `content_factory(tab)` and returns the widget to add to the tab.
+
+    With :attr:`EZETabs.lazy_tabs`, the content is created when the tab is
+    shown or becomes adjacent to the current tab, otherwise when the tab is
+    added to :class:`EZETabs`.
+
+    .. code-block:: kv
+
+        Tab:
+            title: "Currencies"
+            content_factory: lambda tab: Factory.CurrencyList()
+
+    .. versionadded:: 0.1.0
+
+    :attr:`content_factory` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to `None`.
+    """
+
+    content = ObjectProperty(None, allownone=True)
+    """
+    The widget created by :attr:`content_factory`, `None` if the content
+    is not loaded.
+
+    .. versionadded:: 0.1.0
+
+    :attr:`content` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to `None`.
+    """
+
+    content_state = ObjectProperty(None, allownone=True)
+    """
+    Snapshot of the state of the unloaded content returned by
+    :meth:`save_content_state`. It is restored when the content is
+    created again.
+
+    .. versionadded:: 0.1.0
+
+    :attr:`content_state` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to `None`.
+    """
+
     def _get_label_font_style(self):
         if self.tab_label:
             return self.tab_label.font_style
@@ -1184,6 +1249,63 @@ class EZETabsBase:
     def update_label_text(self, instance_user_tab, text_tab: str) -> None:
         self.tab_label.text = text_tab
 
+    def load_content(self) -> None:
+        """
+        Creates the content of the tab with :attr:`content_factory`
+        and restores its :attr:`content_state`.
+
+        .. versionadded:: 0.1.0
+        """
+
+        if self.content is not None or self.content_factory is None:
+            return
+        self.content = self.content_factory(self)
+        self.add_widget(self.content)
+        if self.content_state is not None:
+            self.restore_content_state(self.content, self.content_state)
+            self.content_state = None
+
+    def unload_content(self) -> None:
+        """
+        Saves the state of the content created by :attr:`content_factory`
+        to :attr:`content_state` and removes the content.
+
+        .. versionadded:: 0.1.0
+        """
+
+        if self.content is None or self.content_factory is None:
+            return
+        self.content_state = self.save_content_state(self.content)
+        self.remove_widget(self.content)
+        self.content = None
+
+    def save_content_state(self, content) -> dict:
+        """
+        Returns the snapshot of the state of the `content` before it is
+        unloaded. Saves the scroll positions of the scroll views of the
+        content; override to save more.
+
+        .. versionadded:: 0.1.0
+        """
+
+        return {
+            index: (widget.scroll_x, widget.scroll_y)
+            for index, widget in enumerate(content.walk(restrict=True))
+            if isinstance(widget, ScrollView)
+        }
+
+    def restore_content_state(self, content, state: dict) -> None:
+        """
+        Restores the `state` saved by :meth:`save_content_state` in the
+        created `content`.
+
+        .. versionadded:: 0.1.0
+        """
+
+        for index, widget in enumerate(content.walk(restrict=True)):
+            if index in state and isinstance(widget, ScrollView):
+                widget.scroll_x, widget.scroll_y = state[index]
+
 
 class EZETabsMain(EZEBoxLayout):
     """
@@ -1318,6 +1440,12 @@ class EZETabsBar(EZECard):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # The last carousel offset of the swipe, applied once per frame
+        # before drawing.
+        self._swipe_offset = None
+        self._trigger_swipe_frame = Clock.create_trigger(
+            self._apply_swipe_frame, -1
+        )
 
     def update_indicator(
         self, x: Union[float, int], w: Union[float, int], radius=None
@@ -1332,6 +1460,10 @@ class EZETabsBar(EZECard):
             self.parent._line_x = x
             self.parent._line_width = w
             self.parent._line_height = self.parent.tab_indicator_height
+        if self.parent.tab_indicator_type in ("line-round", "line-rect"):
+            # The line may have been moved by a swipe that returned to the
+            # same tab, in which case the properties above do not change.
+            self._update_indicator_instruction(x, w)
         else:
             self.indicator.pos = (x, 0)
             self.indicator.size = (w, self.parent.tab_indicator_height)
@@ -1362,6 +1494,20 @@ class EZETabsBar(EZECard):
     def android_animation(
         self, instance_carousel: EZETabsCarousel, offset: Union[float, int]
     ):
+        # The offset changes several times per frame during a swipe, the
+        # indicator and the tab bar are updated only for the last one.
+        self._swipe_offset = offset
+        self._trigger_swipe_frame()
+
+    def _apply_swipe_frame(self, *args):
+        offset, self._swipe_offset = self._swipe_offset, None
+        if offset is None:
+            return
+        if offset == 0 and self.carousel.current_slide:
+            # The swipe has ended, put the indicator under the current tab.
+            self._label_request_indicator_update()
+            return
+        instance_carousel = self.carousel
         # Try to reproduce the android animation effect.
         if offset != 0 and abs(offset) < instance_carousel.width:
             forward = offset < 0
@@ -1398,7 +1544,35 @@ class EZETabsBar(EZECard):
             else:
                 x_step = a.x - gap_x * step
             w_step = a.width + (gap_w * step)
-            self.update_indicator(x_step, w_step)
+            self._update_indicator_instruction(x_step, w_step)
+
+    def _update_indicator_instruction(
+        self, x: Union[float, int], w: Union[float, int]
+    ) -> None:
+        # Moves the indicator during a swipe by updating its canvas
+        # instruction directly. The `_line_*` properties of the tabs, which
+        # rebuild the line on every change, are set by `update_indicator`
+        # when the swipe ends.
+        tabs = self.parent
+        if tabs.tab_indicator_type in ("line-round", "line-rect"):
+            line = self.layout.canvas.before.get_group(
+                "Indicator_rounded_line"
+            )[0]
+            radius = (
+                tabs.tab_indicator_height / 2
+                if tabs.tab_indicator_type == "line-round"
+                else tabs._line_radius
+            )
+            line.rounded_rectangle = (
+                x,
+                self.layout.y,
+                w,
+                tabs.tab_indicator_height,
+                radius,
+            )
+        else:
+            self.indicator.pos = (x, 0)
+            self.indicator.size = (w, tabs.tab_indicator_height)
 
     def _label_request_indicator_update(self, *args):
         widget = self.carousel.current_slide.tab_label
@@ -1655,6 +1829,41 @@ class EZETabs(
     and defaults to `True`.
     """
 
+    lazy_tabs = BooleanProperty(False)
+    """
+    Create the content of the tabs with a
+    :attr:`~EZETabsBase.content_factory` only when the tab is shown or
+    becomes adjacent to the current tab, instead of when the tab is added.
+
+    .. versionadded:: 0.1.0
+
+    :attr:`lazy_tabs` is an :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
+    unload_distance = NumericProperty(0)
+    """
+    With :attr:`lazy_tabs`, the content of the tabs more than
+    :attr:`unload_distance` slides away from the current tab is unloaded,
+    see :meth:`EZETabsBase.unload_content`. `0` to keep all loaded tabs.
+
+    .. versionadded:: 0.1.0
+
+    :attr:`unload_distance` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `0`.
+    """
+
+    snapshot_slides = BooleanProperty(False)
+    """
+    Draw the snapshots of the adjacent tabs instead of their content while
+    swiping, see :attr:`~eze.uix.carousel.EZECarousel.snapshot_slides`.
+
+    .. versionadded:: 0.1.0
+
+    :attr:`snapshot_slides` is an :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.register_event_type("on_tab_switch")
@@ -1670,6 +1879,19 @@ class EZETabs(
             title_icon_mode=self._parse_icon_mode,
         )
         self.bind(tab_hint_x=self._update_tab_hint_x)
+        # Lookup index of the tabs: key -> tabs in the order of adding,
+        # see `_get_tab_keys`.
+        self._tab_index = {}
+        self._tab_keys = {}
+        self._tab_list = None
+        self.ids.layout.fbind("children", self._reset_tab_list)
+        self._trigger_update_tabs_content = Clock.create_trigger(
+            self._update_tabs_content
+        )
+        self.bind(
+            lazy_tabs=self._trigger_update_tabs_content,
+            unload_distance=self._trigger_update_tabs_content,
+        )
 
     def update_icon_color(
         self,
@@ -1703,27 +1925,10 @@ class EZETabs(
         """
 
         if isinstance(name_tab, str):
-            if search_by == "title":
-                for tab_instance in self.tab_bar.parent.carousel.slides:
-                    if tab_instance.title_is_capital is True:
-                        _name_tab = name_tab.upper()
-                    else:
-                        _name_tab = name_tab
-                    if tab_instance.title == _name_tab:
-                        self.carousel.load_slide(tab_instance)
-                        return
-            # Search by icon.
-            elif search_by == "icon":
-                for tab_instance in self.tab_bar.parent.carousel.slides:
-                    if tab_instance.icon == name_tab:
-                        self.carousel.load_slide(tab_instance)
-                        return
-            # Search by title.
-            else:
-                for tab_instance in self.tab_bar.parent.carousel.slides:
-                    if tab_instance.tab_label_text == name_tab:
-                        self.carousel.load_slide(tab_instance)
-                        return
+            tab_instance = self.find_tab(name_tab, search_by)
+            if tab_instance is not None:
+                self.carousel.load_slide(tab_instance)
+                return
             raise ValueError(
                 "switch_tab:\n\t"
                 "name_tab not found in the tab list\n\t"
@@ -1733,10 +1938,33 @@ class EZETabs(
         else:
             self.carousel.load_slide(name_tab.tab)
 
+    def find_tab(self, name_tab: str, search_by="text"):
+        """
+        Returns the tab whose `search_by` property (see :meth:`switch_tab`)
+        is `name_tab`, or `None`. The first added tab is returned if
+        several tabs match.
+
+        .. versionadded:: 0.1.0
+        """
+
+        if search_by == "title":
+            # The first matching tab of both keys in the order of slides.
+            tabs = self._tab_index.get(("title", name_tab, False), []) + (
+                self._tab_index.get(("title", name_tab.upper(), True), [])
+            )
+            tabs.sort(key=self.carousel.slides.index)
+        elif search_by == "icon":
+            tabs = self._tab_index.get(("icon", name_tab))
+        else:
+            tabs = self._tab_index.get(("text", name_tab))
+        return tabs[0] if tabs else None
+
     def get_tab_list(self) -> list:
         """Returns a list of :class:`~EZETabsLabel` objects."""
 
-        return self.tab_bar.layout.children[::-1]
+        if self._tab_list is None:
+            self._tab_list = self.tab_bar.layout.children[::-1]
+        return list(self._tab_list)
 
     def get_slides(self) -> list:
         """Returns a list of user tab objects."""
@@ -1792,6 +2020,15 @@ class EZETabs(
                 Clock.schedule_once(widget.tab_label._update_text_size, 0)
                 self.tab_bar.layout.add_widget(widget.tab_label)
                 self.carousel.add_widget(widget)
+                self._index_tab(widget)
+                widget.fbind("tab_label_text", self._index_tab)
+                widget.fbind("icon", self._index_tab)
+                widget.fbind("title", self._index_tab)
+                widget.fbind("title_is_capital", self._index_tab)
+                if self.lazy_tabs:
+                    self._trigger_update_tabs_content()
+                else:
+                    widget.load_content()
                 if self.force_title_icon_mode is True:
                     widget.title_icon_mode = self.title_icon_mode
                 Clock.schedule_once(
@@ -1828,6 +2065,11 @@ class EZETabs(
             text_color_active=title_label.setter("text_color_active"),
             text_color_normal=title_label.setter("text_color_normal"),
         )
+        slide.funbind("tab_label_text", self._index_tab)
+        slide.funbind("icon", self._index_tab)
+        slide.funbind("title", self._index_tab)
+        slide.funbind("title_is_capital", self._index_tab)
+        self._unindex_tab(slide)
         self.carousel.remove_widget(slide)
         self.tab_bar.layout.remove_widget(title_label)
         # Clean the references.
@@ -1847,6 +2089,8 @@ class EZETabs(
         This event is deployed by the built in carousel of the class.
         """
 
+        if self.lazy_tabs:
+            self._update_tabs_content()
         # When the index of the carousel change, update tab indicator,
         # select the current tab and reset threshold data.
         if instance_tabs_carousel.current_slide:
@@ -1935,6 +2179,58 @@ class EZETabs(
                 else:
                     self.tab_bar_height = dp(48)
 
+    def _get_tab_keys(self, tab) -> tuple:
+        return (
+            ("text", tab.tab_label_text),
+            ("icon", tab.icon),
+            ("title", tab.title, tab.title_is_capital is True),
+        )
+
+    def _index_tab(self, tab, *args):
+        # Called when the tab is added and when its text, icon or title
+        # changes.
+        self._unindex_tab(tab)
+        keys = self._get_tab_keys(tab)
+        self._tab_keys[tab] = keys
+        slides = self.carousel.slides
+        for key in keys:
+            tabs = self._tab_index.setdefault(key, [])
+            tabs.append(tab)
+            if len(tabs) > 1:
+                # Several tabs match, keep them in the order of the slides.
+                tabs.sort(key=slides.index)
+
+    def _unindex_tab(self, tab):
+        for key in self._tab_keys.pop(tab, ()):
+            tabs = self._tab_index[key]
+            tabs.remove(tab)
+            if not tabs:
+                del self._tab_index[key]
+
+    def _reset_tab_list(self, *args):
+        self._tab_list = None
+
+    def _update_tabs_content(self, *args):
+        # Loads the content of the current and adjacent tabs and unloads
+        # the content of the distant tabs.
+        slides = self.carousel.slides
+        current_index = self.carousel.index or 0
+        loaded = False
+        for index, slide in enumerate(slides):
+            if slide.content_factory is None:
+                continue
+            distance = abs(index - current_index)
+            if self.carousel.loop:
+                distance = min(distance, len(slides) - distance)
+            if not self.lazy_tabs or distance <= 1:
+                loaded = loaded or slide.content is None
+                slide.load_content()
+            elif self.unload_distance and distance > self.unload_distance:
+                slide.unload_content()
+        if loaded and self.snapshot_slides:
+            # The snapshots of the adjacent tabs show their old content.
+            self.carousel.refresh_snapshots()
+
     def _carousel_bind(self, interval):
         self.carousel.bind(on_slide_progress=self._on_slide_progress)
 
@@ -1,2 +1,2 @@
 # NOQA F401
-from .textfield import EZETextField, EZETextFieldRect
+from .textfield import EZETextField, EZETextFieldRect, register_validator
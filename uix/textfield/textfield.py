@@ -277,11 +277,13 @@ Clickable icon for EZETextField
     See more information in the :class:`~EZETextFieldRect` class.
 """
 
-__all__ = ("EZETextField", "EZETextFieldRect")
+__all__ = ("EZETextField", "EZETextFieldRect", "register_validator")
 
+import inspect
 import os
 import re
 from datetime import date
+from functools import lru_cache
 from typing import Union
 
 from kivy.animation import Animation
@@ -306,6 +308,7 @@ from eze.font_definitions import theme_font_styles
 from eze.theming import ThemableBehavior
 from eze.uix.behaviors import DeclarativeBehavior
 from eze.uix.label import EZEIcon
+from eze.utils import asynckivy
 
 with open(
     os.path.join(uix_path, "textfield", "textfield.kv"), encoding="utf-8"
@@ -375,6 +378,42 @@ class AutoFormatTelephoneNumber:
             Clock.schedule_once(lambda x: set_pos_cursor(len(self.text)), 0.1)
 
 
+EMAIL_PATTERN = re.compile(r"[^@]+@[^@]+\.[^@]+")
+TIME_PATTERN = re.compile(r"^(2[0-3]|[01]?[0-9]):([0-5]?[0-9])(:[0-5]?[0-9])?$")
+# Regex strings of the parts of a date.
+DATE_PART_PATTERNS = {
+    "dd": "[0][1-9]|[1-2][0-9]|[3][0-1]",
+    "mm": "[0][1-9]|[1][0-2]",
+    "yyyy": "[0-9][0-9][0-9][0-9]",
+}
+
+
+@lru_cache(maxsize=None)
+def get_date_parser(date_format: str):
+    """
+    Returns the compiled pattern of the dates in the `date_format` and the
+    function that converts the parts of a date in this format, in the
+    order of the format, to a <class 'datetime.date'> object.
+    """
+
+    fmt = date_format.split("/")
+    pattern = re.compile(
+        "^({})/({})/({})$".format(*(DATE_PART_PATTERNS[part] for part in fmt))
+    )
+    year_index, month_index, day_index = (
+        fmt.index("yyyy"),
+        fmt.index("mm"),
+        fmt.index("dd"),
+    )
+
+    def to_date(parts) -> date:
+        return date(
+            int(parts[year_index]), int(parts[month_index]), int(parts[day_index])
+        )
+
+    return pattern, to_date
+
+
 class Validator:
     """Container class for various validation methods."""
 
@@ -418,14 +457,12 @@ class Validator:
     """
 
     def is_email_valid(self, text: str) -> bool:
-        if not re.match(r"[^@]+@[^@]+\.[^@]+", text):
+        if not EMAIL_PATTERN.match(text):
             return True
         return False
 
     def is_time_valid(self, text: str) -> bool:
-        if re.match(r"^(2[0-3]|[01]?[0-9]):([0-5]?[0-9])$", text) or re.match(
-            r"^(2[0-3]|[01]?[0-9]):([0-5]?[0-9]):([0-5]?[0-9])$", text
-        ):
+        if TIME_PATTERN.match(text):
             return False
 
         return True
@@ -434,30 +471,15 @@ class Validator:
         if not self.date_format:
             raise Exception("TextInput date_format was not defined.")
 
-        # Regex strings.
-        dd = "[0][1-9]|[1-2][0-9]|[3][0-1]"
-        mm = "[0][1-9]|[1][0-2]"
-        yyyy = "[0-9][0-9][0-9][0-9]"
-        fmt = self.date_format.split("/")
-        largs = locals()
-        # Access  the local variables  dict in the correct format based on
-        # date_format split. Example: "mm/dd/yyyy" -> ["mm", "dd", "yyyy"]
-        # largs[fmt[0]] would be largs["mm"] so the month regex string.
-        if re.match(
-            f"^({largs[fmt[0]]})/({largs[fmt[1]]})/({largs[fmt[2]]})$", text
-        ):
-            input_split = text.split("/")
-            largs[fmt[0]] = input_split[0]
-            largs[fmt[1]] = input_split[1]
-            largs[fmt[2]] = input_split[2]
-            # Organize input  into correct slots and try to convert
-            # to datetime  object. This way February exceptions are
-            # tested. Also tests with the date_interval are simpler
-            # using datetime objects.
+        # The pattern and the converter are created once per date_format.
+        pattern, to_date = get_date_parser(self.date_format)
+        match = pattern.match(text)
+        if match:
+            # Convert the input to a datetime object. This way February
+            # exceptions are tested. Also tests with the date_interval are
+            # simpler using datetime objects.
             try:
-                datetime = date(
-                    int(largs["yyyy"]), int(largs["mm"]), int(largs["dd"])
-                )
+                datetime = to_date(match.groups())
             except ValueError:
                 return True
 
@@ -481,30 +503,21 @@ class Validator:
             if not self.date_format:
                 raise Exception("TextInput date_format was not defined.")
 
-            fmt = self.date_format.split("/")
-            largs = {}
+            to_date = get_date_parser(self.date_format)[1]
             # Convert string inputs into datetime.date objects and store
             # them back into self.date_interval.
             try:
                 if self.date_interval[0] and not isinstance(
                     self.date_interval[0], date
                 ):
-                    split = self.date_interval[0].split("/")
-                    largs[fmt[0]] = split[0]
-                    largs[fmt[1]] = split[1]
-                    largs[fmt[2]] = split[2]
-                    self.date_interval[0] = date(
-                        int(largs["yyyy"]), int(largs["mm"]), int(largs["dd"])
+                    self.date_interval[0] = to_date(
+                        self.date_interval[0].split("/")
                     )
                 if self.date_interval[1] and not isinstance(
                     self.date_interval[1], date
                 ):
-                    split = self.date_interval[1].split("/")
-                    largs[fmt[0]] = split[0]
-                    largs[fmt[1]] = split[1]
-                    largs[fmt[2]] = split[2]
-                    self.date_interval[1] = date(
-                        int(largs["yyyy"]), int(largs["mm"]), int(largs["dd"])
+                    self.date_interval[1] = to_date(
+                        self.date_interval[1].split("/")
                     )
 
             except Exception:
@@ -527,6 +540,44 @@ class Validator:
         Clock.schedule_once(lambda x: on_date_interval())
 
 
+# Validators of the `EZETextField.validator` property:
+# name -> (function, debounce).
+validators = {
+    "date": (lambda text_field, text: text_field.is_date_valid(text), 0),
+    "email": (lambda text_field, text: text_field.is_email_valid(text), 0),
+    "time": (lambda text_field, text: text_field.is_time_valid(text), 0),
+}
+
+
+def register_validator(name: str, function, debounce: float = 0) -> None:
+    """
+    Registers a validator that can be set as :attr:`EZETextField.validator`.
+
+    `function(text_field, text)` returns `True` if the text is not valid.
+    It can be a coroutine function, which is run by
+    :func:`eze.utils.asynckivy.start` without blocking the input, for
+    example to check the uniqueness of the text in a database with
+    :func:`eze.utils.asynckivy.run_in_executor`. The text field keeps its
+    error state until the coroutine returns; the result is ignored if the
+    text has changed in the meantime.
+
+    With `debounce`, the validator is called only when the text has not
+    changed for `debounce` seconds.
+
+    .. versionadded:: 0.1.0
+
+    .. code-block:: python
+
+        async def is_username_taken(text_field, text):
+            return await asynckivy.run_in_executor(database.has_user, text)
+
+
+        register_validator("username", is_username_taken, debounce=0.3)
+    """
+
+    validators[name] = (function, debounce)
+
+
 class EZETextFieldRect(ThemableBehavior, TextInput):
     """
     Textfield rect class.
@@ -675,12 +726,13 @@ class EZETextField(
 
     phone_mask = StringProperty("")
 
-    validator = OptionProperty(None, options=["date", "email", "time", "phone"])
+    validator = StringProperty(None, allownone=True)
     """
     The type of text field for entering Email, time, etc.
     Automatically sets the type of the text field as "error" if the user input
     does not match any of the set validation types.
-    Available options are: `'date'`, `'email'`, `'time'`.
+    Available options are: `'date'`, `'email'`, `'time'` and the names of
+    the validators added with :func:`register_validator`.
 
     When using `'date'`, :attr:`date_format` must be defined.
 
@@ -837,7 +889,10 @@ class EZETextField(
     .. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/text-field-validator-date.png
         :align: center
 
-    :attr:`validator` is an :class:`~kivy.properties.OptionProperty`
+    .. versionchanged:: 0.1.0
+        Custom validators can be added with :func:`register_validator`.
+
+    :attr:`validator` is an :class:`~kivy.properties.StringProperty`
     and defaults to `None`.
     """
 
@@ -1287,6 +1342,12 @@ class EZETextField(
     # List of color attribute names that should be updated when changing the
     # application color palette.
     _colors_to_updated = ListProperty()
+    # The last (non-empty, error, focus) state of the text field the
+    # decorations were updated for, see `set_text`.
+    _text_state = None
+    # Pending validation of a debounced or asynchronous validator.
+    _validation_event = None
+    _validation_task = None
 
     def __init__(self, *args, **kwargs):
         self.set_objects_labels()
@@ -1530,20 +1591,25 @@ class EZETextField(
     def set_text(self, instance_text_field, text: str) -> None:
         """Called when text is entered into a text field."""
 
-        self.text = re.sub("\n", " ", text) if not self.multiline else text
+        if not self.multiline and "\n" in text:
+            # The new text dispatches this method again.
+            self.text = text.replace("\n", " ")
+            return
         self.set_max_text_length()
-        if self.validator and self.validator == "phone":
-            pass
-            # self.format(self.text)
 
-        if (self.text and self.max_length_text_color) or self._get_has_error():
+        has_error = self._get_has_error()
+        if text and self.max_length_text_color:
+            self.error = has_error
+        elif has_error:
             self.error = True
-        if (
-            self.text
-            and self.max_length_text_color
-            and not self._get_has_error()
-        ):
-            self.error = False
+
+        # The hint text, the notch and the colors depend only on whether the
+        # field is empty, focused and in the error state, so they are not
+        # updated on every keystroke.
+        text_state = (bool(text), self.error, self.focus)
+        if text_state == self._text_state:
+            return
+        self._text_state = text_state
 
         # Start the appropriate texture animations when programmatically
         # pasting text into a text field.
@@ -1884,12 +1950,7 @@ class EZETextField(
         """
 
         if self.validator and self.validator != "phone":
-            has_error = {
-                "date": self.is_date_valid,
-                "email": self.is_email_valid,
-                "time": self.is_time_valid,
-            }[self.validator](self.text)
-            return has_error
+            return self._validate(self.text)
         if self.max_text_length and len(self.text) > self.max_text_length:
             has_error = True
         else:
@@ -1899,6 +1960,45 @@ class EZETextField(
                 has_error = False
         return has_error
 
+    def _validate(self, text: str) -> bool:
+        try:
+            function, debounce = validators[self.validator]
+        except KeyError:
+            raise ValueError(
+                f"Validator {self.validator!r} is not registered, see "
+                f"`register_validator`"
+            )
+        is_coroutine = inspect.iscoroutinefunction(function)
+        if not debounce and not is_coroutine:
+            return function(self, text)
+
+        # The error state is kept until the delayed validation completes.
+        if self._validation_event is not None:
+            self._validation_event.cancel()
+        if self._validation_task is not None:
+            self._validation_task.cancel()
+        self._validation_event = Clock.schedule_once(
+            lambda x: self._run_delayed_validator(function, text), debounce
+        )
+        return self.error
+
+    def _run_delayed_validator(self, function, text: str) -> None:
+        self._validation_event = None
+
+        async def validate():
+            has_error = function(self, text)
+            if inspect.isawaitable(has_error):
+                has_error = await has_error
+            # The result is applied as in `set_text`.
+            if text != self.text:
+                return
+            if text and self.max_length_text_color:
+                self.error = has_error
+            elif has_error:
+                self.error = True
+
+        self._validation_task = asynckivy.start(validate())
+
     def _refresh_hint_text(self):
         """Method override to avoid duplicate hint text texture."""
 
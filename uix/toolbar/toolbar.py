@@ -2100,12 +2100,15 @@ class EZEBottomAppBar(
         if self.theme_cls.material_style == "M2":
             return
 
-        def wait_removed(*args):
-            if len(self.children) == 1 or not self.children:
-                Clock.unschedule(wait_removed)
+        async def wait_removed():
+            try:
+                await asynckivy.children_changed(
+                    self, lambda children: len(children) <= 1
+                )
+            finally:
                 self._wait_removed = False
-                self._x = -dp(48)
-                asynckivy.start(add_widget())
+            self._x = -dp(48)
+            await add_widget()
 
         async def add_widget():
             for button in value:
@@ -2119,8 +2122,9 @@ class EZEBottomAppBar(
                 if value[0] in data:
                     for i, widget in enumerate(self.children):
                         if not self._wait_removed:
-                            Clock.schedule_interval(wait_removed, 0)
+                            # The task can complete in `start`.
                             self._wait_removed = True
+                            asynckivy.start(wait_removed())
                         if isinstance(widget, EZEActionBottomAppBarButton):
                             anim = Animation(
                                 y=-widget.height,
@@ -26,6 +26,26 @@ You have multiple transitions available by default, such as:
 .. image:: https://github.com/HeaTTheatR/KivyMD-data/raw/master/gallery/kivymddoc/transition-md-fade-slide-transition.gif
     :align: center
 
+Snapshot transitions
+--------------------
+
+.. versionadded:: 0.1.0
+
+By default, both screens are drawn with all their widgets in every frame
+of a transition. For heavy screens, set the
+:attr:`~EZETransitionBase.snapshot` attribute: both screens are rendered
+once to textures in the first frame of the transition, and only two
+textured rectangles are drawn in the following frames, so the cost of a
+frame does not depend on the complexity of the screens. The heroes fly
+above the snapshots as usual.
+
+.. code-block:: python
+
+    screen_manager.transition = EZEFadeSlideTransition(snapshot=True)
+
+.. note::
+    The content of the screens is not updated during a snapshot
+    transition. :class:`EZESwapTransition` does not support snapshots.
 """
 
 __all__ = (
@@ -37,7 +57,8 @@ __all__ = (
 
 from kivy import Logger
 from kivy.animation import Animation, AnimationTransition
-from kivy.properties import DictProperty
+from kivy.graphics import Color, InstructionGroup, Rectangle
+from kivy.properties import BooleanProperty, DictProperty
 from kivy.uix.screenmanager import (
     ScreenManagerException,
     SlideTransition,
@@ -47,6 +68,7 @@ from kivy.uix.screenmanager import (
 
 from eze.uix.hero import EZEHeroFrom, EZEHeroTo
 from eze.uix.screenmanager import EZEScreenManager
+from eze.utils.snapshot import render_snapshot
 
 
 class EZETransitionBase(TransitionBase):
@@ -59,7 +81,24 @@ class EZETransitionBase(TransitionBase):
     class documentation.
     """
 
+    snapshot = BooleanProperty(False)
+    """
+    Animate the snapshots of the screens instead of the screens.
+    See `Snapshot transitions`_.
+
+    .. versionadded:: 0.1.0
+
+    :attr:`snapshot` is an :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`.
+    """
+
     _direction = "in"
+    # Whether the transition animates the screens with their positions
+    # and opacity only, which the snapshots can follow.
+    _snapshot_supported = True
+    # Screen -> (Fbo, Color, Rectangle) of the snapshots drawn instead of
+    # the screens during the transition.
+    _snapshots = None
     # Collection of child widgets of all 'EZEHeroFrom' widgets that are
     # on the screen, for example:
     #
@@ -91,91 +130,72 @@ class EZETransitionBase(TransitionBase):
     def animated_hero_in(self) -> None:
         """Animates the flight of heroes from screen **A** to screen **B**."""
 
-        if self.manager._heroes_data and self.manager.current_heroes:
-            for hero_from_widget in self.manager.get_hero_from_widget():
-                for heroes_tag in self.manager.current_heroes:
-                    if heroes_tag == hero_from_widget.tag:
-                        self._check_widget_properties(hero_from_widget)
-
-                        # Get child widget of the 'EZEHeroFrom' container.
-                        hero_widget = hero_from_widget.children[0]
-                        self._hero_from_widget_children[
-                            hero_from_widget.tag
-                        ] = hero_widget
-
-                        # Removing the child widget from the 'EZEHeroFrom'
-                        # container.
-                        hero_from_widget.remove_widget(hero_widget)
-
-                        # We set the size, position of the child widget of the
-                        # 'EZEHeroFrom' container and add this widget to the
-                        # root window.
-                        hero_widget.pos = self.screen_out.to_widget(
-                            *hero_from_widget.to_window(*hero_from_widget.pos)
-                        )
-                        hero_widget.size = hero_from_widget.size
-                        self.manager.get_root_window().add_widget(hero_widget)
-
-                        # Animating widgets added to the root window.
-                        if self.screen_in.heroes_to:
-                            for hero_to_widget in self.screen_in.heroes_to:
-                                self._check_hero_to_widget_tag(
-                                    hero_to_widget, hero_from_widget
-                                )
-                                if hero_to_widget.tag == heroes_tag:
-                                    Animation(
-                                        size=hero_to_widget.size,
-                                        d=self.duration,
-                                        pos=hero_to_widget.pos,
-                                    ).start(hero_widget)
-                                    hero_from_widget.dispatch(
-                                        "on_transform_in",
-                                        hero_widget,
-                                        self.duration,
-                                    )
+        if not self.manager.current_heroes:
+            return
+
+        hero_from_widgets = self.manager.get_hero_from_widget()
+        heroes_to = self._get_heroes_to(self.screen_in, hero_from_widgets)
+        for hero_from_widget in hero_from_widgets:
+            self._check_widget_properties(hero_from_widget)
+
+            # Get child widget of the 'EZEHeroFrom' container.
+            hero_widget = hero_from_widget.children[0]
+            self._hero_from_widget_children[hero_from_widget.tag] = hero_widget
+
+            # Removing the child widget from the 'EZEHeroFrom' container.
+            hero_from_widget.remove_widget(hero_widget)
+
+            # We set the size, position of the child widget of the
+            # 'EZEHeroFrom' container and add this widget to the root window.
+            hero_widget.pos = self.screen_out.to_widget(
+                *hero_from_widget.to_window(*hero_from_widget.pos)
+            )
+            hero_widget.size = hero_from_widget.size
+            self.manager.get_root_window().add_widget(hero_widget)
+
+            # Animating widgets added to the root window.
+            hero_to_widget = heroes_to.get(hero_from_widget.tag)
+            if hero_to_widget is not None:
+                Animation(
+                    size=hero_to_widget.size,
+                    d=self.duration,
+                    pos=hero_to_widget.pos,
+                ).start(hero_widget)
+                hero_from_widget.dispatch(
+                    "on_transform_in",
+                    hero_widget,
+                    self.duration,
+                )
 
     def animated_hero_out(self) -> None:
         """Animates the flight of heroes from screen **B** to screen **A**."""
 
-        if (
-            self.manager._heroes_data
-            and self.manager.current_heroes
-            and self.screen_out.heroes_to
-        ):
-            for heroes_tag in self.manager.current_heroes:
-                for hero_to_widget in self.screen_out.heroes_to:
-                    if hero_to_widget.tag == heroes_tag:
-                        hero_from_children = self._hero_from_widget_children[
-                            heroes_tag
-                        ]
-                        hero_to_widget.remove_widget(hero_from_children)
-                        self.manager.get_root_window().add_widget(
-                            hero_from_children
-                        )
-
-                        for (
-                            hero_from_widget
-                        ) in self.manager.get_hero_from_widget():
-                            hero_from_widget.dispatch(
-                                "on_transform_out",
-                                self._hero_from_widget_children[
-                                    hero_from_widget.tag
-                                ],
-                                self.duration,
-                            )
-                            Animation(
-                                pos=self.screen_in.to_widget(
-                                    *hero_from_widget.to_window(
-                                        *hero_from_widget.pos
-                                    )
-                                ),
-                                size=hero_from_widget.size,
-                                d=self.duration,
-                            ).start(
-                                self._hero_from_widget_children[
-                                    hero_from_widget.tag
-                                ]
-                            )
+        if not (self.manager.current_heroes and self.screen_out.heroes_to):
+            return
+
+        heroes_to = self._get_heroes_to(self.screen_out)
+        for hero_from_widget in self.manager.get_hero_from_widget():
+            hero_to_widget = heroes_to.get(hero_from_widget.tag)
+            hero_from_children = self._hero_from_widget_children.get(
+                hero_from_widget.tag
+            )
+            if hero_to_widget is None or hero_from_children is None:
+                continue
+
+            hero_to_widget.remove_widget(hero_from_children)
+            self.manager.get_root_window().add_widget(hero_from_children)
+            hero_from_widget.dispatch(
+                "on_transform_out",
+                hero_from_children,
+                self.duration,
+            )
+            Animation(
+                pos=self.screen_in.to_widget(
+                    *hero_from_widget.to_window(*hero_from_widget.pos)
+                ),
+                size=hero_from_widget.size,
+                d=self.duration,
+            ).start(hero_from_children)
 
     def on_complete(self) -> None:
         """
@@ -183,37 +203,111 @@ class EZETransitionBase(TransitionBase):
         See :attr:`kivy.uix.screenmanager.TransitionBase.on_complete'.
         """
 
+        self._show_live_screens()
         super().on_complete()
 
-        if self.manager._heroes_data and self.manager.current_heroes:
+        if self.manager.current_heroes:
+            heroes_to = (
+                self._get_heroes_to(self.screen_in)
+                if self._direction == "in"
+                else {}
+            )
             for hero_from_widget in self.manager.get_hero_from_widget():
-                for heroes_tag in self.manager.current_heroes:
-                    if heroes_tag == hero_from_widget.tag:
-                        hero_from_children = self._hero_from_widget_children[
-                            heroes_tag
-                        ]
-                        self.manager.get_root_window().remove_widget(
-                            hero_from_children
-                        )
-
-                        # Adding a child widget from the 'EZEHeraFrom' container
-                        # to the 'EZEHeroTo' container.
-                        if self._direction == "in":
-                            for hero_to_widget in self.screen_in.heroes_to:
-                                if hero_to_widget.tag == heroes_tag:
-                                    hero_to_widget.add_widget(
-                                        hero_from_children
-                                    )
-                        # Restores the child widget for the 'EZEHeraFrom'
-                        # container.
-                        elif self._direction == "out":
-                            hero_from_widget.add_widget(hero_from_children)
+                hero_from_children = self._hero_from_widget_children.get(
+                    hero_from_widget.tag
+                )
+                if hero_from_children is None:
+                    continue
+                self.manager.get_root_window().remove_widget(
+                    hero_from_children
+                )
+
+                # Adding a child widget from the 'EZEHeraFrom' container
+                # to the 'EZEHeroTo' container.
+                if self._direction == "in":
+                    hero_to_widget = heroes_to.get(hero_from_widget.tag)
+                    if hero_to_widget is not None:
+                        hero_to_widget.add_widget(hero_from_children)
+                # Restores the child widget for the 'EZEHeraFrom'
+                # container.
+                elif self._direction == "out":
+                    hero_from_widget.add_widget(hero_from_children)
 
         if self._direction == "out":
             self._direction = "in"
         else:
             self._direction = "out"
 
+        # The hidden screen is not protected from eviction anymore.
+        if isinstance(self.manager, EZEScreenManager):
+            self.manager._evict_screens()
+
+    def _on_progress(self, *args):
+        # The snapshots are rendered in the first frame of the animation,
+        # when the layout of the new screen has been updated.
+        if (
+            self.snapshot
+            and self._snapshot_supported
+            and self._snapshots is None
+        ):
+            self._show_snapshots()
+        super()._on_progress(*args)
+
+    def _show_snapshots(self) -> None:
+        self._snapshots = {}
+        canvas = self.manager.canvas
+        for screen in (self.screen_out, self.screen_in):
+            if screen is None or screen.parent is not self.manager:
+                continue
+            canvas_index = canvas.indexof(screen.canvas)
+            if canvas_index == -1:
+                continue
+            fbo = render_snapshot(screen)
+            color = Color(1, 1, 1, screen.opacity)
+            rectangle = Rectangle(
+                texture=fbo.texture, pos=screen.pos, size=fbo.size
+            )
+            group = InstructionGroup()
+            group.add(color)
+            group.add(rectangle)
+            canvas.remove(screen.canvas)
+            canvas.insert(canvas_index, group)
+            self._snapshots[screen] = (group, color, rectangle)
+            # The transition keeps moving and fading the screens, the
+            # snapshots follow them.
+            screen.fbind("pos", self._update_snapshot, screen)
+            screen.fbind("opacity", self._update_snapshot, screen)
+
+    def _update_snapshot(self, screen, *args) -> None:
+        group, color, rectangle = self._snapshots[screen]
+        rectangle.pos = screen.pos
+        color.a = screen.opacity
+
+    def _show_live_screens(self) -> None:
+        snapshots, self._snapshots = self._snapshots, None
+        if not snapshots:
+            return
+
+        canvas = self.manager.canvas
+        for screen, (group, color, rectangle) in snapshots.items():
+            screen.funbind("pos", self._update_snapshot, screen)
+            screen.funbind("opacity", self._update_snapshot, screen)
+            canvas_index = canvas.indexof(group)
+            if canvas_index > -1:
+                canvas.remove(group)
+                canvas.insert(canvas_index, screen.canvas)
+
+    def _get_heroes_to(self, screen, hero_from_widgets: list = ()) -> dict:
+        # Returns the tag -> 'EZEHeroTo' widget dictionary of the screen.
+        heroes_to = {}
+        for hero_to_widget in screen.heroes_to:
+            if hero_from_widgets:
+                self._check_hero_to_widget_tag(
+                    hero_to_widget, hero_from_widgets[0]
+                )
+            heroes_to[hero_to_widget.tag] = hero_to_widget
+        return heroes_to
+
     # Checks the attributes for the 'self.screen_in' screen.
     # Called from the animated_hero_in method.
     def _check_widget_properties(self, hero_from_widget: EZEHeroFrom):
@@ -244,7 +338,8 @@ class EZETransitionBase(TransitionBase):
 
 
 class EZESwapTransition(SwapTransition, EZETransitionBase):
-    pass
+    # The screens are scaled with the instructions of their canvases.
+    _snapshot_supported = False
 
 
 class EZESlideTransition(SlideTransition, EZETransitionBase):
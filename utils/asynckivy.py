@@ -9,30 +9,242 @@ GitHub -
 GitHub Gist -
     https://gist.github.com/gottadiveintopython/5f4a775849f9277081c396de65dc57c1
 
+Coroutines are run by :func:`start`, which returns a :class:`Task`:
+
+.. code-block:: python
+
+    from eze.utils import asynckivy
+
+
+    async def load_data(self):
+        # The data is read in a thread, the frames keep being drawn.
+        data = await asynckivy.run_in_executor(read_data_file, path)
+        self.data_table.update_row_data(self.data_table, data)
+        await asynckivy.animate(self.data_table, opacity=1, d=0.2)
+
+
+    task = asynckivy.start(load_data())
+    ...
+    # Stops the coroutine, its `finally` blocks are executed.
+    task.cancel()
+
+Several coroutines are awaited at once with :func:`gather` (all of them)
+and :func:`wait_any` (the first one), and :func:`timeout` limits the time
+of a coroutine:
+
+.. code-block:: python
+
+    users, posts = await asynckivy.gather(load_users(), load_posts())
+
+    try:
+        await asynckivy.timeout(asynckivy.event(button, "on_release"), 5)
+    except TimeoutError:
+        ...
 """
 
-__all__ = ("start", "sleep", "event")
+__all__ = (
+    "Task",
+    "Cancelled",
+    "start",
+    "sleep",
+    "event",
+    "children_changed",
+    "animation_complete",
+    "animate",
+    "gather",
+    "wait_any",
+    "timeout",
+    "run_in_executor",
+    "get_executor",
+)
 
 import types
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 
 from kivy.clock import Clock
 
+from eze.animation import EZEAnimation
+
 CallbackParameter = namedtuple("CallbackParameter", ("args", "kwargs"))
 
 
-def start(coro):
-    def step(*args, **kwargs):
+class Cancelled(Exception):
+    """Raised when awaiting a cancelled :class:`Task`."""
+
+
+class Task:
+    """
+    Coroutine run by :func:`start`.
+
+    The coroutine waits for an awaitable by yielding a function that
+    receives the `step` callback of the task. The function may return an
+    object with a `cancel` method, which is called when the task is
+    cancelled while waiting.
+    """
+
+    def __init__(self, coro):
+        self.coro = coro
+        self.state = "running"
+        """`'running'`, `'done'`, `'cancelled'` or `'error'`."""
+        self._result = None
+        self._error = None
+        self._waiting = None
+        self._sending = False
+        self._cancel_requested = False
+        self._done_callbacks = []
+
+    @property
+    def done(self) -> bool:
+        """Whether the task has finished, been cancelled or failed."""
+
+        return self.state != "running"
+
+    @property
+    def result(self):
+        """
+        The value returned by the coroutine. Raises the exception of the
+        coroutine if it failed and :class:`Cancelled` if it was cancelled.
+        """
+
+        if self.state == "error":
+            raise self._error
+        if self.state == "cancelled":
+            raise Cancelled()
+        return self._result
+
+    def cancel(self) -> None:
+        """
+        Stops the coroutine. `GeneratorExit` is raised in the coroutine at
+        the `await` it is waiting on, so its `finally` blocks are executed.
+        """
+
+        if self.done:
+            return
+        if self._sending:
+            # The task cancels itself, it stops at the next `await`.
+            self._cancel_requested = True
+            return
+        if self._waiting is not None:
+            self._waiting.cancel()
+            self._waiting = None
+        self.coro.close()
+        self._finish("cancelled")
+
+    def add_done_callback(self, callback) -> None:
+        """Calls `callback(task)` when the task is done."""
+
+        if self.done:
+            callback(self)
+        else:
+            self._done_callbacks.append(callback)
+
+    def remove_done_callback(self, callback) -> None:
+        if callback in self._done_callbacks:
+            self._done_callbacks.remove(callback)
+
+    def _step(self, *args, **kwargs) -> None:
+        if self.done:
+            return
+        self._waiting = None
+        self._send(CallbackParameter(args, kwargs))
+
+    def _send(self, value) -> None:
+        self._sending = True
         try:
-            coro.send(CallbackParameter(args, kwargs))(step)
-        except StopIteration:
-            pass
+            waiter = self.coro.send(value)
+        except StopIteration as stop:
+            self._result = stop.value
+            self._finish("done")
+            return
+        except BaseException as error:
+            self._error = error
+            observed = bool(self._done_callbacks)
+            self._finish("error")
+            if not observed:
+                raise
+            return
+        finally:
+            self._sending = False
 
-    try:
-        coro.send(None)(step)
-    except StopIteration:
-        pass
+        self._waiting = waiter(self._step)
+        if self._cancel_requested:
+            self.cancel()
+
+    def _finish(self, state: str) -> None:
+        self.state = state
+        callbacks, self._done_callbacks = self._done_callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def __await__(self):
+        if not self.done:
+            yield lambda step_coro: _TasksWaiter([self], 1, step_coro)
+        return self.result
+
+
+class _TasksWaiter:
+    # Calls `step_coro` when `count` of the tasks are done or one of them
+    # fails.
+
+    def __init__(self, tasks, count, step_coro):
+        self.tasks = tasks
+        self.count = count
+        self.step_coro = step_coro
+        for task in tasks:
+            task.add_done_callback(self.on_done)
+
+    def on_done(self, task) -> None:
+        finished = sum(1 for task in self.tasks if task.done)
+        if task.state == "error" or finished >= self.count:
+            self.cancel()
+            self.step_coro()
+
+    def cancel(self) -> None:
+        for task in self.tasks:
+            task.remove_done_callback(self.on_done)
+
+
+class _FutureWaiter:
+    # Calls `step_coro` on the main thread when the future is done.
+
+    def __init__(self, future, step_coro):
+        self.future = future
+        self.step_coro = step_coro
+        self.cancelled = False
+        future.add_done_callback(self.on_done)
+
+    def on_done(self, future) -> None:
+        # The partial() avoids the weak reference to the method.
+        Clock.schedule_once(partial(self.step))
+
+    def step(self, *args) -> None:
+        if not self.cancelled:
+            self.step_coro()
+
+    def cancel(self) -> None:
+        self.cancelled = True
+        self.future.cancel()
+
+
+def start(coro) -> Task:
+    """
+    Starts the coroutine (or wraps the awaitable) and returns its
+    :class:`Task`. A :class:`Task` is returned as is.
+    """
+
+    if isinstance(coro, Task):
+        return coro
+    if not isinstance(coro, (types.CoroutineType, types.GeneratorType)):
+        coro = _await(coro)
+    task = Task(coro)
+    task._send(None)
+    return task
+
+
+async def _await(awaitable):
+    return await awaitable
 
 
 @types.coroutine
@@ -55,13 +267,150 @@ class event:
         self.bind_id = bind_id = self.ed.fbind(self.name, self.callback)
         assert bind_id > 0  # check if binding succeeded
         self.step_coro = step_coro
+        return self
+
+    def cancel(self):
+        if self.bind_id is not None:
+            self.ed.unbind_uid(self.name, self.bind_id)
+            self.bind_id = None
 
     def callback(self, *args, **kwargs):
         self.parameter = CallbackParameter(args, kwargs)
-        ed = self.ed
-        ed.unbind_uid(self.name, self.bind_id)
+        self.cancel()
         self.step_coro()
 
     def __await__(self):
         yield self.bind
         return self.parameter
+
+
+async def children_changed(widget, condition):
+    """
+    Waits until `condition(widget.children)` is true. Returns at once
+    if it is already true. Nothing is done per frame while waiting: the
+    condition is only checked when the children of the widget change.
+    """
+
+    while not condition(widget.children):
+        await event(widget, "children")
+    return widget.children
+
+
+async def animation_complete(animation):
+    """
+    Waits until the `animation` completes and returns the widget it was
+    animating. Await it right after starting the animation.
+    """
+
+    param = await event(animation, "on_complete")
+    return param.args[1]
+
+
+async def animate(widget, priority: str = "normal", **kwargs):
+    """
+    Animates the `widget` and waits until the animation completes. The
+    keyword arguments are passed to :class:`~eze.animation.EZEAnimation`.
+    The animation is stopped if the task is cancelled.
+    """
+
+    animation = EZEAnimation(priority=priority, **kwargs)
+    animation.start(widget)
+    try:
+        await animation_complete(animation)
+    finally:
+        animation.cancel(widget)
+
+
+async def gather(*aws) -> list:
+    """
+    Runs the coroutines (or awaits the tasks) concurrently and returns the
+    list of their results. If one of them fails, the others are cancelled
+    and the exception is raised.
+    """
+
+    tasks = _start_tasks(aws)
+    try:
+        await _wait_tasks(tasks, len(tasks))
+        return [task.result for task in tasks]
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def wait_any(*aws) -> Task:
+    """
+    Runs the coroutines (or awaits the tasks) concurrently until one of
+    them is done, cancels the others and returns the finished
+    :class:`Task`.
+    """
+
+    tasks = _start_tasks(aws)
+    try:
+        await _wait_tasks(tasks, 1)
+        return next(task for task in tasks if task.done)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def timeout(aw, seconds: float):
+    """
+    Returns the result of the coroutine (or task). Cancels it and raises
+    `TimeoutError` if it has not finished within `seconds`.
+    """
+
+    task = start(aw)
+    timer = start(sleep(seconds))
+    finished = await wait_any(task, timer)
+    if finished is timer:
+        raise TimeoutError()
+    return finished.result
+
+
+def _start_tasks(aws) -> list:
+    # `start` raises if a coroutine fails at once, the tasks started before
+    # it must not keep running.
+    tasks = []
+    try:
+        for aw in aws:
+            tasks.append(start(aw))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    return tasks
+
+
+@types.coroutine
+def _wait_tasks(tasks, count):
+    if sum(1 for task in tasks if task.done) < count and not any(
+        task.state == "error" for task in tasks
+    ):
+        yield lambda step_coro: _TasksWaiter(tasks, count, step_coro)
+
+
+_executor = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Returns the thread pool used by :func:`run_in_executor`."""
+
+    global _executor
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(thread_name_prefix="asynckivy")
+    return _executor
+
+
+@types.coroutine
+def run_in_executor(func, *args, executor=None, **kwargs):
+    """
+    Calls `func(*args, **kwargs)` in a thread of the `executor` (the thread
+    pool of :func:`get_executor` by default) and returns its result on the
+    main thread. The frames keep being drawn while waiting. The call is
+    cancelled if it has not started when the task is cancelled.
+    """
+
+    future = (executor or get_executor()).submit(func, *args, **kwargs)
+    yield lambda step_coro: _FutureWaiter(future, step_coro)
+    return future.result()
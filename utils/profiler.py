@@ -0,0 +1,404 @@
+"""
+Profiler module
+===============
+
+.. versionadded:: 0.1.0
+
+The Profiler module collects the frame statistics of your current
+application:
+
+* frame time histogram and percentiles (p50/p95/p99);
+* the number of canvas instructions of each top-level widget;
+* the most expensive `Clock` callbacks (optional, uses :mod:`cProfile`);
+* the number of property dispatches per frame (optional);
+
+and exports them to a trace file in the Chrome trace event format, which
+can be opened in `chrome://tracing` or `Perfetto <https://ui.perfetto.dev>`_.
+
+The easiest way to use it is to start the monitor with the profiler
+overlay:
+
+.. code-block:: python
+
+    class MainApp(EZEApp):
+        def on_start(self):
+            self.fps_monitor_start(profiler=True)
+
+        def on_stop(self):
+            self.frame_profiler.export_trace("trace.json")
+
+The profiler can also be used without the overlay:
+
+.. code-block:: python
+
+    from eze.utils.profiler import FrameProfiler
+
+    profiler = FrameProfiler(profile_callbacks=True, count_properties=True)
+    profiler.start()
+    ...
+    print(profiler.get_report())
+"""
+
+__all__ = ("FrameProfiler", "ProfilerMonitor", "count_canvas_instructions")
+
+import cProfile
+import json
+import weakref
+from collections import deque
+
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.graphics.instructions import CanvasBase, InstructionGroup
+from kivy.properties import ObjectProperty
+
+from eze.utils.fpsmonitor import FpsMonitor
+
+# Upper bounds in milliseconds of the frame time histogram buckets.
+HISTOGRAM_BUCKETS = (4, 8, 12, 16.7, 20, 25, 33.4, 50, 100, 250)
+
+
+def count_canvas_instructions(widget) -> int:
+    """
+    Returns the number of canvas instructions of the widget and all its
+    children, including the instructions of `canvas.before` and
+    `canvas.after`. The canvases of the child widgets are not counted as
+    instructions of the parent.
+    """
+
+    count = 0
+    for child in widget.walk(restrict=True):
+        canvas = child.canvas
+        if canvas is None:
+            continue
+        # `canvas.before`, `canvas.after` and the canvases of the child
+        # widgets are in `canvas.children` too.
+        count += _count_instructions(canvas)
+        if canvas.has_before:
+            count += _count_instructions(canvas.before)
+        if canvas.has_after:
+            count += _count_instructions(canvas.after)
+    return count
+
+
+def _count_instructions(group: InstructionGroup) -> int:
+    count = 0
+    for instruction in group.children:
+        if isinstance(instruction, CanvasBase):
+            continue
+        if isinstance(instruction, InstructionGroup):
+            count += _count_instructions(instruction)
+        else:
+            count += 1
+    return count
+
+
+def _get_percentile(values: list, percent: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+def _get_code_key(callback) -> tuple:
+    callback = getattr(callback, "__func__", callback)
+    code = getattr(callback, "__code__", None)
+    if code is None:
+        return None
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+
+class FrameProfiler:
+    """
+    Collects the frame statistics of the application.
+
+    :param max_frames: the number of last frames to keep;
+    :param profile_callbacks: measure the time of the `Clock` callbacks;
+                              slows the application down noticeably;
+    :param count_properties: count the property dispatches of the widgets
+                             in the window;
+    """
+
+    def __init__(
+        self,
+        max_frames: int = 600,
+        profile_callbacks: bool = False,
+        count_properties: bool = False,
+    ):
+        self.max_frames = max_frames
+        self.profile_callbacks = profile_callbacks
+        self.count_properties = count_properties
+        self.running = False
+        self._profile = None
+        self._watched = []
+        self.reset()
+
+    def reset(self) -> None:
+        """Clears the collected statistics."""
+
+        # (frame start, frame cost, frame interval) in seconds.
+        self._frames = deque(maxlen=self.max_frames)
+        self._frame_count = 0
+        self._frame_interval = 0
+        self._callback_keys = {}
+        self._property_counts = {}
+        if self._profile is not None:
+            self._profile.disable()
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def start(self) -> None:
+        """Starts collecting the statistics."""
+
+        if self.running:
+            return
+        self.running = True
+        Clock.schedule_interval(self._on_frame, 0)
+        Window.bind(on_flip=self._on_flip)
+        if self.profile_callbacks:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        if self.count_properties:
+            self.watch_properties()
+
+    def stop(self) -> None:
+        """Stops collecting the statistics. The collected data is kept."""
+
+        if not self.running:
+            return
+        self.running = False
+        Clock.unschedule(self._on_frame)
+        Window.unbind(on_flip=self._on_flip)
+        if self._profile is not None:
+            self._profile.disable()
+        for widget_ref, name, key in self._watched:
+            widget = widget_ref()
+            if widget is not None:
+                widget.funbind(name, self._on_property, key)
+        self._watched = []
+
+    def watch_properties(self) -> None:
+        """
+        Starts counting the property dispatches of the widgets added to the
+        window since the last call.
+        """
+
+        watched = {id(widget_ref()) for widget_ref, _, _ in self._watched}
+        for root in Window.children:
+            for widget in root.walk(restrict=True):
+                if id(widget) in watched:
+                    continue
+                watched.add(id(widget))
+                widget_ref = weakref.ref(widget)
+                class_name = type(widget).__name__
+                for name in widget.properties():
+                    key = f"{class_name}.{name}"
+                    widget.fbind(name, self._on_property, key)
+                    self._watched.append((widget_ref, name, key))
+
+    def get_frame_stats(self) -> dict:
+        """
+        Returns the frame statistics in milliseconds: the percentiles of
+        the time between the frames (`frame_time`) and of the time spent
+        on the frames (`frame_cost`), and the histogram of the frame time
+        (the upper bound of the bucket -> the number of frames).
+        """
+
+        intervals = [frame[2] * 1000 for frame in self._frames if frame[2]]
+        costs = [frame[1] * 1000 for frame in self._frames]
+        histogram = dict.fromkeys(HISTOGRAM_BUCKETS + ("inf",), 0)
+        for interval in intervals:
+            for bucket in HISTOGRAM_BUCKETS:
+                if interval <= bucket:
+                    histogram[bucket] += 1
+                    break
+            else:
+                histogram["inf"] += 1
+
+        def get_percentiles(values):
+            return {
+                "p50": _get_percentile(values, 50),
+                "p95": _get_percentile(values, 95),
+                "p99": _get_percentile(values, 99),
+                "max": max(values, default=0.0),
+            }
+
+        return {
+            "frames": self._frame_count,
+            "fps": Clock.get_fps(),
+            "frame_time": get_percentiles(intervals),
+            "frame_cost": get_percentiles(costs),
+            "histogram": histogram,
+        }
+
+    def get_canvas_stats(self) -> list:
+        """
+        Returns the (widget, number of canvas instructions) pairs for the
+        top-level widgets of the window, the largest first.
+        """
+
+        return sorted(
+            (
+                (repr(widget), count_canvas_instructions(widget))
+                for widget in Window.children
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+
+    def get_callback_stats(self, limit: int = 10) -> list:
+        """
+        Returns the (callback name, number of calls, total time in
+        milliseconds) tuples of the most expensive `Clock` callbacks.
+        Requires `profile_callbacks`.
+        """
+
+        if self._profile is None:
+            return []
+
+        self._profile.create_stats()
+        stats = self._profile.stats
+        if self.running:
+            self._profile.enable()
+
+        result = []
+        for key, name in self._callback_keys.items():
+            if key in stats:
+                calls, _, _, cumulative_time, _ = stats[key]
+                result.append((name, calls, cumulative_time * 1000))
+        result.sort(key=lambda item: item[2], reverse=True)
+        return result[:limit]
+
+    def get_property_stats(self, limit: int = 10) -> list:
+        """
+        Returns the (class.property, dispatches per frame) pairs of the most
+        often dispatched properties. Requires `count_properties`.
+        """
+
+        frames = max(self._frame_count, 1)
+        result = sorted(
+            self._property_counts.items(), key=lambda item: item[1], reverse=True
+        )
+        return [(key, count / frames) for key, count in result[:limit]]
+
+    def get_report(self) -> dict:
+        """Returns all collected statistics."""
+
+        return {
+            "frames": self.get_frame_stats(),
+            "canvas": self.get_canvas_stats(),
+            "callbacks": self.get_callback_stats(),
+            "properties": self.get_property_stats(),
+        }
+
+    def export_trace(self, path: str) -> None:
+        """
+        Saves the collected frames to the `path` file in the Chrome trace
+        event format. The report is saved as the `otherData` of the trace.
+        """
+
+        events = []
+        for start, cost, interval in self._frames:
+            events.append(
+                {
+                    "name": "frame",
+                    "ph": "X",
+                    "ts": start * 1e6,
+                    "dur": cost * 1e6,
+                    "pid": 0,
+                    "tid": 0,
+                }
+            )
+            if interval:
+                events.append(
+                    {
+                        "name": "fps",
+                        "ph": "C",
+                        "ts": start * 1e6,
+                        "pid": 0,
+                        "args": {"fps": 1 / interval},
+                    }
+                )
+
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump(
+                {
+                    "traceEvents": events,
+                    "displayTimeUnit": "ms",
+                    "otherData": self.get_report(),
+                },
+                trace_file,
+                default=str,
+            )
+
+    def _on_frame(self, interval: float) -> None:
+        self._frame_interval = interval
+        if self.profile_callbacks:
+            for event in Clock.get_events():
+                callback = event.get_callback()
+                key = _get_code_key(callback)
+                if key is not None and key not in self._callback_keys:
+                    self._callback_keys[key] = getattr(
+                        callback, "__qualname__", key[2]
+                    )
+
+    def _on_flip(self, *args) -> None:
+        start = Clock.get_time()
+        self._frames.append(
+            (
+                start,
+                Clock.time() - start,
+                self._frame_interval,
+            )
+        )
+        self._frame_interval = 0
+        self._frame_count += 1
+
+    def _on_property(self, key: str, *args) -> None:
+        self._property_counts[key] = self._property_counts.get(key, 0) + 1
+
+
+class ProfilerMonitor(FpsMonitor):
+    """
+    Monitor that shows the frame time percentiles and the most expensive
+    top-level widget, callback and property of the :attr:`profiler`.
+    """
+
+    profiler = ObjectProperty()
+    """
+    Instance of :class:`~FrameProfiler` class.
+
+    :attr:`profiler` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to `None`.
+    """
+
+    def start(self):
+        self.profiler.start()
+        super().start()
+
+    def update_fps(self, *args):
+        profiler = self.profiler
+        if profiler.count_properties:
+            profiler.watch_properties()
+
+        frame_time = profiler.get_frame_stats()["frame_time"]
+        lines = [
+            "FPS: %.1f  p50: %.1f ms  p95: %.1f ms  p99: %.1f ms"
+            % (
+                Clock.get_fps(),
+                frame_time["p50"],
+                frame_time["p95"],
+                frame_time["p99"],
+            )
+        ]
+        canvas_stats = [
+            item for item in profiler.get_canvas_stats() if item[0] != repr(self)
+        ]
+        if canvas_stats:
+            lines.append("Canvas: %s - %d instructions" % canvas_stats[0])
+        callback_stats = profiler.get_callback_stats(1)
+        if callback_stats:
+            lines.append("Callback: %s - %d calls, %.1f ms" % callback_stats[0])
+        property_stats = profiler.get_property_stats(1)
+        if property_stats:
+            lines.append("Property: %s - %.1f/frame" % property_stats[0])
+        self._fsp_value = "\n".join(lines)
@@ -0,0 +1,58 @@
+"""
+Snapshot module
+===============
+
+.. versionadded:: 0.1.0
+
+Renders widgets to textures. Used to draw a single textured rectangle
+instead of the widget tree of a heavy widget while it is animated, see
+:attr:`~eze.uix.carousel.EZECarousel.snapshot_slides` and
+:attr:`~eze.uix.transition.transition.EZETransitionBase.snapshot`.
+
+.. code-block:: python
+
+    from eze.utils.snapshot import render_snapshot
+
+    fbo = render_snapshot(widget)
+    with canvas:
+        Rectangle(texture=fbo.texture, pos=widget.pos, size=fbo.size)
+"""
+
+__all__ = ("render_snapshot",)
+
+from kivy.graphics import ClearBuffers, ClearColor, Fbo, Translate
+
+
+def render_snapshot(widget, fbo: Fbo = None) -> Fbo:
+    """
+    Renders the `widget` with its children to the `fbo` and returns it.
+    A new :class:`~kivy.graphics.Fbo` is created if `fbo` is `None` or its
+    size differs from the size of the widget. The snapshot is rendered
+    fully opaque, regardless of the `opacity` of the widget.
+    """
+
+    size = (max(1, int(widget.width)), max(1, int(widget.height)))
+    if fbo is None or tuple(fbo.size) != size:
+        fbo = Fbo(size=size, with_stencilbuffer=True)
+    fbo.clear()
+    with fbo:
+        ClearColor(0, 0, 0, 0)
+        ClearBuffers()
+        Translate(-widget.x, -widget.y)
+
+    # A canvas can have only one parent.
+    canvas = widget.canvas
+    parent_canvas = widget.parent.canvas if widget.parent else None
+    canvas_index = -1
+    if parent_canvas is not None:
+        canvas_index = parent_canvas.indexof(canvas)
+    if canvas_index > -1:
+        parent_canvas.remove(canvas)
+    opacity, canvas.opacity = canvas.opacity, 1
+    fbo.add(canvas)
+    fbo.draw()
+    fbo.remove(canvas)
+    canvas.opacity = opacity
+    if canvas_index > -1:
+        parent_canvas.insert(canvas_index, canvas)
+    return fbo
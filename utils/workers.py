@@ -0,0 +1,352 @@
+"""
+Workers module
+==============
+
+.. versionadded:: 0.1.0
+
+The Workers module runs blocking and CPU-bound work off the UI thread and
+delivers the results on the main thread.
+
+Every :class:`~eze.app.EZEApp` has a :attr:`~eze.app.EZEApp.worker_pool`,
+which is shut down when the application stops:
+
+.. code-block:: python
+
+    class MainApp(EZEApp):
+        def load_images(self, screen, paths):
+            for path in paths:
+                self.worker_pool.submit(
+                    make_thumbnail,
+                    path,
+                    callback=screen.add_thumbnail,
+                    # Jobs of the screen are cancelled when it is left.
+                    owner=screen,
+                )
+
+Jobs with a higher `priority` are started first. Jobs can be awaited in
+a coroutine started by :func:`eze.utils.asynckivy.start`:
+
+.. code-block:: python
+
+    rows = await app.worker_pool.submit(read_rows, path, priority=10)
+
+CPU-bound functions can be run in processes with `process=True`; the
+function and its arguments must be picklable. Processes are not available
+on Android and iOS, where such jobs are run in threads.
+"""
+
+__all__ = ("WorkerJob", "WorkerPool", "get_worker_pool")
+
+import heapq
+import itertools
+import os
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from kivy.clock import Clock
+from kivy.logger import Logger
+from kivy.utils import platform
+
+
+def get_default_workers() -> int:
+    """
+    Returns the number of worker threads for the device: one less than the
+    number of CPUs on Android and iOS, so that the UI thread keeps a core,
+    and up to eight on desktops.
+    """
+
+    cpu_count = os.cpu_count() or 1
+    if platform in ("android", "ios"):
+        return max(1, cpu_count - 1)
+    return max(2, min(8, cpu_count))
+
+
+class WorkerJob:
+    """
+    A function submitted to a :class:`WorkerPool`. Created by
+    :meth:`WorkerPool.submit`.
+    """
+
+    def __init__(
+        self,
+        pool,
+        func,
+        args,
+        kwargs,
+        priority,
+        callback,
+        error_callback,
+        owner,
+        process,
+    ):
+        self.pool = pool
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.callback = callback
+        self.error_callback = error_callback
+        self.owner = owner
+        self.process = process
+        self.state = "pending"
+        """
+        `'pending'`, `'running'`, `'done'`, `'error'` or `'cancelled'`.
+        """
+        self.result = None
+        self.error = None
+        self._future = None
+        self._waiters = []
+
+    @property
+    def done(self) -> bool:
+        return self.state in ("done", "error", "cancelled")
+
+    def cancel(self) -> None:
+        """
+        Cancels the job. A pending job is not started; the callbacks of
+        a running job are not called, the function itself runs to the end.
+        """
+
+        if self.done:
+            return
+        self.state = "cancelled"
+        # The pool is notified of a started job when its future is done.
+        if self._future is not None:
+            self._future.cancel()
+        self.pool._discard_owner_job(self)
+        self._notify()
+
+    def _notify(self) -> None:
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            waiter()
+
+    def _on_future_done(self, future) -> None:
+        # Called in the worker thread.
+        Clock.schedule_once(partial(self._deliver, future))
+
+    def _deliver(self, future, *args) -> None:
+        self.pool._on_job_finished(self)
+        if self.done:
+            return
+        error = None if future.cancelled() else future.exception()
+        if error is None:
+            self.state = "done"
+            self.result = future.result()
+            if self.callback:
+                self.callback(self.result)
+        else:
+            self.state = "error"
+            self.error = error
+            if self.error_callback:
+                self.error_callback(error)
+            elif not self._waiters:
+                Logger.error(
+                    f"EZE: Worker job {self.func!r} failed: {error!r}"
+                )
+        self._notify()
+
+    def __await__(self):
+        if not self.done:
+            yield lambda step_coro: _JobWaiter(self, step_coro)
+        if self.state == "error":
+            raise self.error
+        if self.state == "cancelled":
+            from eze.utils.asynckivy import Cancelled
+
+            raise Cancelled()
+        return self.result
+
+
+class _JobWaiter:
+    # Resumes the coroutine awaiting the job.
+
+    def __init__(self, job, step_coro):
+        self.job = job
+        self.step_coro = step_coro
+        job._waiters.append(self.step)
+
+    def step(self) -> None:
+        self.step_coro()
+
+    def cancel(self) -> None:
+        if self.step in self.job._waiters:
+            self.job._waiters.remove(self.step)
+
+
+class WorkerPool:
+    """
+    Runs functions in threads (or processes) in the order of their
+    priority and calls the callbacks on the main thread.
+
+    :param max_workers: the number of jobs running at the same time,
+                        :func:`get_default_workers` by default;
+    :param max_processes: the number of worker processes, the number of
+                          CPUs by default;
+    """
+
+    def __init__(self, max_workers: int = None, max_processes: int = None):
+        self.max_workers = max_workers or get_default_workers()
+        self.max_processes = max_processes
+        self._thread_executor = None
+        self._process_executor = None
+        self._pending = []
+        self._running = set()
+        self._owners = weakref.WeakKeyDictionary()
+        self._counter = itertools.count()
+        self._shutdown = False
+
+    @property
+    def pending_count(self) -> int:
+        """The number of jobs waiting to start."""
+
+        return sum(1 for *_, job in self._pending if not job.done)
+
+    @property
+    def running_count(self) -> int:
+        """The number of running jobs."""
+
+        return len(self._running)
+
+    def submit(
+        self,
+        func,
+        *args,
+        priority: int = 0,
+        callback=None,
+        error_callback=None,
+        owner=None,
+        process: bool = False,
+        **kwargs,
+    ) -> WorkerJob:
+        """
+        Runs `func(*args, **kwargs)` in a worker and returns the
+        :class:`WorkerJob`.
+
+        :param priority: jobs with a higher priority are started first;
+        :param callback: called on the main thread with the result;
+        :param error_callback: called on the main thread with the exception
+                               raised by the function;
+        :param owner: the object (a widget) the job belongs to, its jobs
+                      are cancelled by :meth:`cancel_owner`; if it has an
+                      `on_leave` event (a screen), they are cancelled when
+                      it is left;
+        :param process: run the function in a process;
+        """
+
+        if self._shutdown:
+            raise RuntimeError("The worker pool is shut down")
+
+        job = WorkerJob(
+            self,
+            func,
+            args,
+            kwargs,
+            priority,
+            callback,
+            error_callback,
+            owner,
+            process and platform not in ("android", "ios"),
+        )
+        if owner is not None:
+            self._add_owner_job(owner, job)
+        heapq.heappush(self._pending, (-priority, next(self._counter), job))
+        self._start_jobs()
+        return job
+
+    def cancel_owner(self, owner, *args) -> None:
+        """Cancels the pending and running jobs of the `owner`."""
+
+        for job in list(self._owners.get(owner, ())):
+            job.cancel()
+
+    def cancel_all(self) -> None:
+        """Cancels all pending and running jobs."""
+
+        for *_, job in list(self._pending):
+            job.cancel()
+        for job in list(self._running):
+            job.cancel()
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Cancels all jobs and stops the workers. Called by
+        :class:`~eze.app.EZEApp` when the application stops.
+        """
+
+        self._shutdown = True
+        self.cancel_all()
+        for executor in (self._thread_executor, self._process_executor):
+            if executor is not None:
+                executor.shutdown(wait=wait, cancel_futures=True)
+        self._thread_executor = self._process_executor = None
+
+    def _add_owner_job(self, owner, job) -> None:
+        jobs = self._owners.get(owner)
+        if jobs is None:
+            jobs = self._owners[owner] = set()
+            is_event_type = getattr(owner, "is_event_type", None)
+            if is_event_type is not None and is_event_type("on_leave"):
+                owner.fbind("on_leave", self.cancel_owner)
+        jobs.add(job)
+
+    def _get_executor(self, process: bool):
+        if process:
+            if self._process_executor is None:
+                self._process_executor = ProcessPoolExecutor(
+                    self.max_processes
+                )
+            return self._process_executor
+        if self._thread_executor is None:
+            self._thread_executor = ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix="eze-worker"
+            )
+        return self._thread_executor
+
+    def _start_jobs(self) -> None:
+        while self._pending and len(self._running) < self.max_workers:
+            *_, job = heapq.heappop(self._pending)
+            if job.done:
+                continue
+            job.state = "running"
+            self._running.add(job)
+            job._future = self._get_executor(job.process).submit(
+                job.func, *job.args, **job.kwargs
+            )
+            job._future.add_done_callback(job._on_future_done)
+
+    def _on_job_finished(self, job) -> None:
+        self._running.discard(job)
+        self._discard_owner_job(job)
+        if not self._shutdown:
+            self._start_jobs()
+
+    def _discard_owner_job(self, job) -> None:
+        if job.owner is not None:
+            jobs = self._owners.get(job.owner)
+            if jobs is not None:
+                jobs.discard(job)
+
+
+_worker_pool = None
+
+
+def get_worker_pool() -> WorkerPool:
+    """
+    Returns the :attr:`~eze.app.EZEApp.worker_pool` of the running
+    application, or a pool shared by the widgets when there is no
+    running :class:`~eze.app.EZEApp`.
+    """
+
+    global _worker_pool
+
+    from kivy.app import App
+
+    app = App.get_running_app()
+    worker_pool = getattr(app, "worker_pool", None)
+    if worker_pool is not None:
+        return worker_pool
+    if _worker_pool is None:
+        _worker_pool = WorkerPool()
+    return _worker_pool